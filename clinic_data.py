@@ -7,6 +7,8 @@ class ClinicDataManager:
         """Manages clinic locations and provider data."""
         self.locations_df = pd.DataFrame()
         self.providers_df = pd.DataFrame()
+        self.address_by_location = {}
+        self.providers_by_location = {}
         self.load_data_from_excel()
 
     def load_data_from_excel(self, file_path="hillside_clinic_data.xlsx"):
@@ -36,18 +38,27 @@ class ClinicDataManager:
                 print(f"⚠️ Warning: Could not load CSV fallback: {csv_error}. The application will run without pre-loaded clinic data.")
         except Exception as e:
             print(f"💥 Error loading data from Excel file: {e}")
+        self.build_indexes()
+
+    def build_indexes(self):
+        """Indexes locations and providers by lower-cased name so lookups skip a DataFrame scan."""
+        self.address_by_location = {}
+        if not self.locations_df.empty and {'office_location', 'Address'} <= set(self.locations_df.columns):
+            for location, address in zip(self.locations_df['office_location'], self.locations_df['Address']):
+                if isinstance(location, str):
+                    self.address_by_location.setdefault(location.strip().lower(), str(address))
+
+        self.providers_by_location = {}
+        if not self.providers_df.empty and 'location' in self.providers_df.columns:
+            for provider in self.providers_df.to_dict('records'):
+                if isinstance(provider['location'], str):
+                    self.providers_by_location.setdefault(provider['location'].lower(), []).append(provider)
 
     def find_clinic_address(self, location_key: str) -> Optional[str]:
         """Finds the full address for a given location key (case-insensitive)."""
-        if self.locations_df.empty or not location_key:
+        if not location_key:
             return None
-
-        location_key_lower = location_key.strip().lower()
-        match = self.locations_df[self.locations_df['office_location'].str.strip().str.lower() == location_key_lower]
-
-        if not match.empty:
-            return str(match.iloc[0]['Address'])
-        return None
+        return self.address_by_location.get(location_key.strip().lower())
 
     def get_all_locations(self) -> List[Tuple[str, str]]:
         """Gets all clinic locations as (name, address) tuples."""
@@ -63,17 +74,16 @@ class ClinicDataManager:
 
     def find_providers_by_location(self, location: str) -> List[Dict]:
         """Finds providers available at a specific location (requires 'location' column in Providers sheet)."""
-        if self.providers_df.empty or 'location' not in self.providers_df.columns:
+        if not location:
             return []
-
-        matching_providers = self.providers_df[self.providers_df['location'].str.lower() == location.lower()]
-        return [row.to_dict() for _, row in matching_providers.iterrows()]
+        return self.providers_by_location.get(location.lower(), [])
 
     def load_clinic_data_from_csv(self, csv_content: str) -> bool:
         """Updates clinic locations from CSV content (e.g., from an admin upload)."""
         try:
             self.locations_df = pd.read_csv(io.StringIO(csv_content))
             self.locations_df.columns = [col.strip() for col in self.locations_df.columns]
+            self.build_indexes()
             print(f"✅ Admin uploaded and updated {len(self.locations_df)} clinic locations.")
             return True
         except Exception as e:
@@ -85,6 +95,7 @@ class ClinicDataManager:
         try:
             self.providers_df = pd.read_csv(io.StringIO(csv_content))
             self.providers_df.columns = [col.strip() for col in self.providers_df.columns]
+            self.build_indexes()
             print(f"✅ Admin uploaded and updated {len(self.providers_df)} providers.")
             return True
         except Exception as e:
@@ -1,46 +1,70 @@
 import os
 import sys
-import requests
 import csv
 import io
-import json
+import base64
+import logging
+import logging.handlers
+import queue
+import atexit
+import orjson
 import pandas as pd
+import openpyxl
 import time
+import random
 import asyncio
 import aiohttp
 import uuid
+import heapq
+from collections import deque, OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
 import pytz
-from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Form, Depends, status
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Form, Depends, BackgroundTasks, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-import importlib
 import importlib.util
 import re
 import hashlib
+import hmac
 import secrets
 from clinic_data import clinic_manager
 
-# Check if 'blandai' package is available (optional since we're using requests directly)
+# Application logger; LOG_LEVEL=DEBUG brings back the per-call trace output
+logger = logging.getLogger("bland")
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+if not logger.handlers:
+    log_handler = logging.StreamHandler(sys.stdout)
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    # Records are queued on the event loop and written to stdout by a listener thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logger.propagate = False
+
+# pyahocorasick is pinned in requirements.txt; transcript scanning falls back to compiled regexes if it is missing
 try:
-    if importlib.util.find_spec("blandai") is not None:
-        print("✅ blandai library is available")
-    else:
-        print(
-            "⚠️ blandai library not found, but continuing with direct API calls"
-        )
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# httpx with h2 is optional; when present, analytics fans out call-detail GETs over one HTTP/2 connection
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for http2=True
 except ImportError:
-    print(
-        "⚠️ blandai library check failed, but continuing with direct API calls"
-    )
+    httpx = None
 
 app = FastAPI(title="Bland AI Call Center",
-              description="Make automated calls using Bland AI")
+              description="Make automated calls using Bland AI",
+              default_response_class=ORJSONResponse)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -54,33 +78,176 @@ app.add_middleware(
 )
 templates = Jinja2Templates(directory="templates")
 
+
+# Bland AI calls endpoint: POST to place a call, GET {BLAND_CALLS_URL}/{call_id} for its details
+BLAND_CALLS_URL = "https://api.bland.ai/v1/calls"
+# Public URL of /bland_webhook; sent with each call so results arrive without polling Bland
+BLAND_WEBHOOK_URL = os.environ.get("BLAND_WEBHOOK_URL")
+# Bland calls placed at once; kept low by default for international rate limits
+MAX_CALL_CONCURRENCY = int(os.environ.get("BLAND_MAX_CONCURRENCY", "2"))
+
+
+@app.on_event("startup")
+async def open_http_session():
+    """Create the shared aiohttp session used for Bland AI requests"""
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=200, limit_per_host=max(16, MAX_CALL_CONCURRENCY),
+                                       ttl_dns_cache=300, keepalive_timeout=75,
+                                       enable_cleanup_closed=True),
+        timeout=aiohttp.ClientTimeout(total=60))
+    # Multiplexed HTTP/2 client for bulk call-detail reads, or None to use app.state.http
+    app.state.bland = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+        timeout=30.0) if httpx is not None else None
+
+
+async def compact_sessions_periodically():
+    """Background task: drop expired sessions and fold the session log into the snapshot every few minutes"""
+    while True:
+        await asyncio.sleep(SESSIONS_COMPACT_INTERVAL)
+        expired = expire_sessions()
+        if session_log_state["appends"] or expired:
+            try:
+                await save_sessions_db_async(sessions_db)
+            except IOError as e:
+                logger.warning("⚠️ Session compaction failed: %s", e)
+
+
+@app.on_event("startup")
+async def start_session_compactor():
+    """Start the periodic session-log compaction task"""
+    app.state.session_compactor = asyncio.create_task(compact_sessions_periodically())
+
+
+@app.on_event("shutdown")
+async def stop_session_compactor():
+    """Stop the compaction task and compact one last time"""
+    app.state.session_compactor.cancel()
+    if session_log_state["appends"]:
+        await save_sessions_db_async(sessions_db)
+
+
+@app.on_event("shutdown")
+async def close_http_session():
+    """Close the shared aiohttp session"""
+    await app.state.http.close()
+    if app.state.bland is not None:
+        await app.state.bland.aclose()
+
 # In-memory storage (in production, use a database)
 clients_db = {}
 campaigns_db = {}
 campaign_results_db = {}
 campaign_logs = {}
 
+# run_id -> live run dict for runs still in progress; their campaign_results_db blob is only
+# rewritten at start and finish, while each call in between goes to the results log
+active_campaign_runs = {}
+
+# Built analytics responses: campaign_id -> (expires_at, JSON body, ETag). Dropped
+# whenever one of the campaign's runs is stored.
+ANALYTICS_CACHE_TTL_ACTIVE = 300
+ANALYTICS_CACHE_TTL_SETTLED = 86400
+# Seconds the analytics stream waits on any one call's details before writing a placeholder row
+ANALYTICS_ROW_TIMEOUT = 60
+analytics_cache = {}
+
+# Home dashboard call totals ({'total_calls', 'total_duration_seconds'}); emptied whenever a run is stored or deleted
+dashboard_totals_cache = {}
+
+# Serialized /debug/campaign_results response under "body"; emptied together with the dashboard totals
+campaign_results_debug_cache = {}
+
 
 
 # File paths for persistent storage
 USERS_FILE = "data/users.json"
 SESSIONS_FILE = "data/sessions.json"
+# Session creations/deletions since the last compaction, one JSON record per line
+SESSIONS_LOG_FILE = "data/sessions.jsonl"
+SESSIONS_COMPACT_INTERVAL = 300  # seconds
+SESSION_LIFETIME = 24 * 60 * 60  # seconds
 CLIENTS_FILE = "data/clients.json"
 CAMPAIGNS_FILE = "data/campaigns.json"
+# Uploaded campaign files, one raw file per campaign, referenced by file_path in campaigns.json
+CAMPAIGN_BLOBS_DIR = "data/blobs"
 CAMPAIGN_RESULTS_FILE = "data/campaign_results.json"
+# Per-call result changes since the last compaction, one JSON record per line
+CAMPAIGN_RESULTS_LOG_FILE = "data/campaign_results.jsonl"
 
 def ensure_data_directory():
     """Ensure data directory exists"""
-    os.makedirs("data", exist_ok=True)
+    os.makedirs(CAMPAIGN_BLOBS_DIR, exist_ok=True)
+
+def read_json_file(path):
+    """Read a JSON data file with orjson"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def encode_json_file(data):
+    """Encode a JSON data file with orjson, indented like the hand-edited originals"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+def atomic_write(path, data):
+    """Write bytes via a temp file and rename, so readers never see a half-written file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def write_json_file(path, data):
+    """Write a JSON data file with orjson"""
+    atomic_write(path, encode_json_file(data))
+
+# One lock per data file so queued async writes land in order and never share a temp file
+data_file_locks = {}
+
+async def write_file_async(path, encode, writer=atomic_write):
+    """Encode on the event loop (a consistent snapshot), then write the bytes in a worker thread"""
+    lock = data_file_locks.setdefault(path, asyncio.Lock())
+    async with lock:
+        ensure_data_directory()
+        data = encode()
+        await asyncio.to_thread(writer, path, data)
+
+# scrypt cost parameters (~16 MB and a few tens of ms per hash)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+def scrypt_digest(password: str, salt: bytes) -> str:
+    """Hex scrypt digest of a password with the given salt"""
+    return hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P).hex()
+
+def hash_password(password: str) -> str:
+    """Hash a password for storage as scrypt$<salt>$<hash>"""
+    salt = secrets.token_bytes(16)
+    return f"scrypt${salt.hex()}${scrypt_digest(password, salt)}"
+
+def is_legacy_password_hash(hashed: str) -> bool:
+    """Unsalted SHA-256 and blake2b hex digests predate the scrypt$ format"""
+    return not hashed.startswith("scrypt$")
+
+def verify_password(password: str, hashed: str) -> bool:
+    """Verify a password against its hash in constant time, accepting legacy unsalted hashes"""
+    if not is_legacy_password_hash(hashed):
+        _, salt, expected = hashed.split("$", 2)
+        candidate = scrypt_digest(password, bytes.fromhex(salt))
+        return hmac.compare_digest(candidate, expected)
+    if len(hashed) == 64:
+        candidate = hashlib.sha256(password.encode()).hexdigest()
+    else:
+        candidate = hashlib.blake2b(password.encode(), digest_size=16).hexdigest()
+    return hmac.compare_digest(candidate, hashed)
 
 def load_users_db():
     """Load users from file or create default users"""
     ensure_data_directory()
     if os.path.exists(USERS_FILE):
         try:
-            with open(USERS_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            return read_json_file(USERS_FILE)
+        except (orjson.JSONDecodeError, IOError):
             pass
 
     # Default users if file doesn't exist or is corrupted
@@ -88,7 +255,7 @@ def load_users_db():
         "admin": {
             "id": "admin",
             "username": "admin",
-            "password_hash": hashlib.sha256("admin123".encode()).hexdigest(),
+            "password_hash": hash_password("admin123"),
             "role": "admin",
             "email": "admin@company.com",
             "created_at": datetime.now().isoformat()
@@ -96,7 +263,7 @@ def load_users_db():
         "user": {
             "id": "user",
             "username": "user",
-            "password_hash": hashlib.sha256("user123".encode()).hexdigest(),
+            "password_hash": hash_password("user123"),
             "role": "user",
             "email": "user@company.com",
             "created_at": datetime.now().isoformat()
@@ -108,130 +275,372 @@ def load_users_db():
 def save_users_db(users_data):
     """Save users to file"""
     ensure_data_directory()
-    with open(USERS_FILE, 'w') as f:
-        json.dump(users_data, f, indent=2)
+    write_json_file(USERS_FILE, users_data)
+
+async def save_users_db_async(users_data):
+    """Save users to file without blocking the event loop"""
+    await write_file_async(USERS_FILE, lambda: encode_json_file(users_data))
+
+def session_timestamp(value):
+    """Session times are epoch seconds; older files stored ISO strings"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+def parse_session(session):
+    """Turn a stored session record back into a live session, or None if expired/invalid"""
+    try:
+        expires_at = session_timestamp(session['expires_at'])
+        if expires_at <= time.time():
+            return None
+        return {
+            "user_id": session["user_id"],
+            "created_at": session_timestamp(session['created_at']),
+            "expires_at": expires_at
+        }
+    except (KeyError, ValueError, TypeError):
+        return None
 
 def load_sessions_db():
-    """Load sessions from file"""
+    """Load sessions from the compacted snapshot, then replay the append-only log"""
     ensure_data_directory()
+    valid_sessions = {}
     if os.path.exists(SESSIONS_FILE):
         try:
-            with open(SESSIONS_FILE, 'r') as f:
-                sessions_data = json.load(f)
-                # Convert datetime strings back to datetime objects and clean expired sessions
-                current_time = datetime.now()
-                valid_sessions = {}
-                for token, session in sessions_data.items():
+            for token, session in read_json_file(SESSIONS_FILE).items():
+                parsed = parse_session(session)
+                if parsed:
+                    valid_sessions[token] = parsed
+        except (orjson.JSONDecodeError, IOError):
+            pass
+
+    if os.path.exists(SESSIONS_LOG_FILE):
+        try:
+            with open(SESSIONS_LOG_FILE, 'rb') as f:
+                for line in f:
                     try:
-                        expires_at = datetime.fromisoformat(session['expires_at'])
-                        if expires_at > current_time:
-                            session['created_at'] = datetime.fromisoformat(session['created_at'])
-                            session['expires_at'] = expires_at
-                            valid_sessions[token] = session
-                    except (KeyError, ValueError):
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # Torn final line from a crash mid-append
+                    token = record.get("token")
+                    if record.get("deleted"):
+                        valid_sessions.pop(token, None)
                         continue
-                return valid_sessions
-        except (json.JSONDecodeError, IOError):
+                    parsed = parse_session(record)
+                    if token and parsed:
+                        valid_sessions[token] = parsed
+        except IOError:
             pass
-    return {}
+    return valid_sessions
+
+def write_sessions_snapshot(path, data):
+    """Replace the sessions snapshot and start a fresh session log"""
+    atomic_write(path, data)
+    open(SESSIONS_LOG_FILE, 'wb').close()
 
 def save_sessions_db(sessions_data):
-    """Save sessions to file"""
+    """Compact sessions: rewrite the snapshot and start a fresh log"""
     ensure_data_directory()
-    # Convert datetime objects to strings for JSON serialization
-    serializable_sessions = {}
-    for token, session in sessions_data.items():
-        serializable_sessions[token] = {
-            "user_id": session["user_id"],
-            "created_at": session["created_at"].isoformat() if isinstance(session["created_at"], datetime) else session["created_at"],
-            "expires_at": session["expires_at"].isoformat() if isinstance(session["expires_at"], datetime) else session["expires_at"]
-        }
-
-    with open(SESSIONS_FILE, 'w') as f:
-        json.dump(serializable_sessions, f, indent=2)
+    write_sessions_snapshot(SESSIONS_FILE, encode_json_file(sessions_data))
+    session_log_state["appends"] = 0
+
+async def save_sessions_db_async(sessions_data):
+    """Compact sessions without blocking the event loop"""
+    def encode():
+        session_log_state["appends"] = 0
+        return encode_json_file(sessions_data)
+    await write_file_async(SESSIONS_FILE, encode, writer=write_sessions_snapshot)
+
+def expire_sessions():
+    """Pop sessions off the expiry heap until the earliest one is still live; returns how many were dropped"""
+    now = time.time()
+    expired = 0
+    while session_expiry_heap and session_expiry_heap[0][0] <= now:
+        expires_at, token = heapq.heappop(session_expiry_heap)
+        session = sessions_db.get(token)
+        # Skip tokens already logged out or expired on access
+        if session is not None and session["expires_at"] == expires_at:
+            del sessions_db[token]
+            expired += 1
+    return expired
+
+async def append_session_record(record):
+    """Persist one session change by appending it to the log instead of rewriting every session"""
+    line = orjson.dumps(record) + b"\n"
+    # Shares the snapshot's lock so a line never lands between a compaction's snapshot and its truncate
+    await write_file_async(SESSIONS_FILE, lambda: line,
+                           writer=lambda _path, data: append_line(SESSIONS_LOG_FILE, data))
+    session_log_state["appends"] += 1
 
 def load_clients_db():
     """Load clients from file"""
     ensure_data_directory()
     if os.path.exists(CLIENTS_FILE):
         try:
-            with open(CLIENTS_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            return read_json_file(CLIENTS_FILE)
+        except (orjson.JSONDecodeError, IOError):
             pass
     return {}
 
 def save_clients_db(clients_data):
     """Save clients to file"""
     ensure_data_directory()
-    with open(CLIENTS_FILE, 'w') as f:
-        json.dump(clients_data, f, indent=2)
+    write_json_file(CLIENTS_FILE, clients_data)
+
+async def save_clients_db_async(clients_data):
+    """Save clients to file without blocking the event loop"""
+    await write_file_async(CLIENTS_FILE, lambda: encode_json_file(clients_data))
+
+def campaign_blob_path(campaign_id):
+    """Where a campaign's uploaded file is kept"""
+    return f"{CAMPAIGN_BLOBS_DIR}/{campaign_id}.bin"
 
 def load_campaigns_db():
     """Load campaigns from file"""
     ensure_data_directory()
     if os.path.exists(CAMPAIGNS_FILE):
         try:
-            with open(CAMPAIGNS_FILE, 'r') as f:
-                campaigns_data = json.load(f)
-                # Convert base64 file data back to bytes
-                for campaign in campaigns_data.values():
-                    if 'file_data_b64' in campaign:
-                        import base64
-                        campaign['file_data'] = base64.b64decode(campaign['file_data_b64'])
-                        del campaign['file_data_b64']
-                return campaigns_data
-        except (json.JSONDecodeError, IOError):
+            campaigns_data = read_json_file(CAMPAIGNS_FILE)
+            # Move base64 file data left by older versions out to blob files
+            migrated = False
+            for campaign_id, campaign in campaigns_data.items():
+                if 'file_data_b64' in campaign:
+                    campaign['file_path'] = campaign_blob_path(campaign_id)
+                    atomic_write(campaign['file_path'], base64.b64decode(campaign.pop('file_data_b64')))
+                    migrated = True
+            if migrated:
+                save_campaigns_db(campaigns_data)
+            return campaigns_data
+        except (orjson.JSONDecodeError, IOError):
             pass
     return {}
 
 def save_campaigns_db(campaigns_data):
     """Save campaigns to file"""
     ensure_data_directory()
-    # Convert bytes to base64 for JSON serialization
-    serializable_campaigns = {}
-    for campaign_id, campaign in campaigns_data.items():
-        campaign_copy = campaign.copy()
-        if 'file_data' in campaign_copy and isinstance(campaign_copy['file_data'], bytes):
-            import base64
-            campaign_copy['file_data_b64'] = base64.b64encode(campaign_copy['file_data']).decode('utf-8')
-            del campaign_copy['file_data']
-        serializable_campaigns[campaign_id] = campaign_copy
-
-    with open(CAMPAIGNS_FILE, 'w') as f:
-        json.dump(serializable_campaigns, f, indent=2)
+    write_json_file(CAMPAIGNS_FILE, campaigns_data)
+
+async def save_campaigns_db_async(campaigns_data):
+    """Save campaigns to file without blocking the event loop"""
+    await write_file_async(CAMPAIGNS_FILE, lambda: encode_json_file(campaigns_data))
+
+async def save_campaign_file(campaign_id, campaign, file_content):
+    """Write a campaign's uploaded file to its blob and point the campaign at it"""
+    campaign['file_path'] = campaign_blob_path(campaign_id)
+    await write_file_async(campaign['file_path'], lambda: file_content)
+
+def read_campaign_file(campaign):
+    """Read a campaign's uploaded file back from its blob, or None if it has none"""
+    try:
+        with open(campaign['file_path'], 'rb') as f:
+            return f.read()
+    except (KeyError, IOError):
+        return None
 
 def load_campaign_results_db():
-    """Load campaign results from file"""
+    """Load campaign results from the snapshot, replay the per-call log, and keep each run as a serialized JSON blob"""
     ensure_data_directory()
+    runs = {}
     if os.path.exists(CAMPAIGN_RESULTS_FILE):
         try:
-            with open(CAMPAIGN_RESULTS_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            runs = read_json_file(CAMPAIGN_RESULTS_FILE)
+        except (orjson.JSONDecodeError, IOError):
             pass
-    return {}
+
+    if os.path.exists(CAMPAIGN_RESULTS_LOG_FILE):
+        call_positions = {}
+        try:
+            with open(CAMPAIGN_RESULTS_LOG_FILE, 'rb') as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # Torn final line from a crash mid-append
+                    apply_campaign_result_record(runs, call_positions, record)
+        except IOError:
+            pass
+
+    # A run still marked running was cut off by a restart; nothing will ever finish it
+    for run_data in runs.values():
+        if run_data.get("status") == "running":
+            run_data.update({
+                "status": "interrupted",
+                "error": "Server restarted before the run finished",
+                "completed_at": datetime.now().isoformat()
+            })
+    return {run_id: orjson.dumps(run_data) for run_id, run_data in runs.items()}
+
+def apply_campaign_result_record(runs, call_positions, record):
+    """Replay one logged call result onto its run, replacing the stored call with the same call_id.
+    Matching on call_id makes replay safe for records the snapshot already contains."""
+    run_id = record.get("run_id")
+    run_data = runs.get(run_id)
+    if run_data is None:
+        return
+    results = run_data.setdefault("results", [])
+    positions = call_positions.get(run_id)
+    if positions is None:
+        positions = call_positions[run_id] = {r.get("call_id"): i for i, r in enumerate(results)}
+    result = record["result"]
+    position = positions.get(result.get("call_id"))
+    if position is None:
+        positions[result.get("call_id")] = len(results)
+        results.append(result)
+    else:
+        results[position] = result
+    if "successful_calls" in record:
+        run_data["successful_calls"] = record["successful_calls"]
+
+def encode_campaign_results_db(results_data):
+    """Splice the stored run blobs into one JSON object without re-encoding them.
+    Runs still in progress are encoded from memory, since compaction truncates the log that holds their progress."""
+    return b'{' + b','.join(
+        orjson.dumps(run_id) + b':' + (orjson.dumps(active_campaign_runs[run_id]) if run_id in active_campaign_runs else blob)
+        for run_id, blob in results_data.items()
+    ) + b'}'
+
+def write_campaign_results_snapshot(path, data):
+    """Replace the results snapshot and start a fresh per-call log"""
+    atomic_write(path, data)
+    open(CAMPAIGN_RESULTS_LOG_FILE, 'wb').close()
 
 def save_campaign_results_db(results_data):
-    """Save campaign results to file"""
+    """Compact campaign results: rewrite the snapshot and start a fresh log"""
     ensure_data_directory()
-    with open(CAMPAIGN_RESULTS_FILE, 'w') as f:
-        json.dump(results_data, f, indent=2)
+    write_campaign_results_snapshot(CAMPAIGN_RESULTS_FILE, encode_campaign_results_db(results_data))
+
+async def save_campaign_results_db_async(results_data):
+    """Compact campaign results without blocking the event loop"""
+    await write_file_async(CAMPAIGN_RESULTS_FILE, lambda: encode_campaign_results_db(results_data),
+                           writer=write_campaign_results_snapshot)
+
+def append_line(path, line):
+    """Append one line to a log file"""
+    with open(path, 'ab') as f:
+        f.write(line)
+
+async def append_campaign_result(run_id, result, successful_calls=None):
+    """Persist one call result as a log line instead of rewriting every stored run"""
+    record = {"run_id": run_id, "result": result}
+    if successful_calls is not None:
+        record["successful_calls"] = successful_calls
+    line = orjson.dumps(record) + b"\n"
+    # Shares the snapshot's lock so a line never lands between a compaction's snapshot and its truncate
+    await write_file_async(CAMPAIGN_RESULTS_FILE, lambda: line,
+                           writer=lambda _path, data: append_line(CAMPAIGN_RESULTS_LOG_FILE, data))
+
+def campaign_public_view(campaign):
+    """Campaign dict without the uploaded file bytes, safe to serialize"""
+    return {key: value for key, value in campaign.items() if key not in ('file_data', 'file_path', 'csv_data')}
+
+def put_campaign(campaign_id, campaign):
+    """Store a campaign and refresh its public view"""
+    campaigns_db[campaign_id] = campaign
+    campaigns_public_db[campaign_id] = campaign_public_view(campaign)
+    campaigns_api_cache.clear()
+
+def remove_campaign(campaign_id):
+    """Drop a campaign, its public view and its uploaded file"""
+    campaign = campaigns_db.pop(campaign_id)
+    campaigns_public_db.pop(campaign_id, None)
+    campaigns_api_cache.clear()
+    if campaign.get('file_path'):
+        try:
+            os.remove(campaign['file_path'])
+        except FileNotFoundError:
+            pass
+
+def store_campaign_run(run_id, run_data):
+    """Store a campaign run in campaign_results_db as one serialized JSON blob"""
+    campaign_results_db[run_id] = orjson.dumps(run_data)
+    invalidate_campaign_analytics(run_id)
+
+def invalidate_campaign_analytics(run_id):
+    """Drop cached analytics for the campaign a stored run belongs to"""
+    analytics_cache.pop(run_id.split("_run_", 1)[0], None)
+    dashboard_totals_cache.clear()
+    campaign_results_debug_cache.clear()
+
+def get_dashboard_totals():
+    """Total calls and stored call seconds across every campaign run, recomputed only after a change"""
+    if not dashboard_totals_cache:
+        total_calls = 0
+        total_duration_seconds = 0
+        for result_key, campaign_results in iter_campaign_runs():
+            results = campaign_results.get('results', [])
+            total_calls += len(results)
+            for result in results:
+                # The 'duration' is already parsed into seconds by the webhook
+                duration_in_seconds = result.get('duration', 0)
+                if isinstance(duration_in_seconds, int):
+                    total_duration_seconds += duration_in_seconds
+        dashboard_totals_cache.update(total_calls=total_calls, total_duration_seconds=total_duration_seconds)
+    return dashboard_totals_cache
+
+def get_campaign_run(run_id, default=None):
+    """Decode a stored campaign run blob back into a dict, or return the live dict of a run in progress"""
+    blob = campaign_results_db.get(run_id)
+    if blob is None:
+        return default
+    live = active_campaign_runs.get(run_id)
+    return live if live is not None else orjson.loads(blob)
+
+def iter_campaign_runs():
+    """Yield (run_id, run_data) for every stored campaign run"""
+    # Snapshot the items so handlers that await mid-iteration don't see the dict change size
+    for run_id, blob in list(campaign_results_db.items()):
+        live = active_campaign_runs.get(run_id)
+        yield run_id, live if live is not None else orjson.loads(blob)
+
+def campaign_run_mentions_call(blob, call_id):
+    """Cheap byte search for a call_id in a stored run blob before decoding it"""
+    return b'"call_id":' + orjson.dumps(call_id) in blob
+
+def iter_campaign_runs_with_call(call_id, run_ids=None):
+    """Yield (run_id, run_data) for each campaign run holding a call, live runs included"""
+    for run_id in list(campaign_results_db.keys() if run_ids is None else run_ids):
+        live = active_campaign_runs.get(run_id)
+        if live is not None:
+            if any(r.get("call_id") == call_id for r in live.get("results", [])):
+                yield run_id, live
+            continue
+        blob = campaign_results_db.get(run_id)
+        if blob is not None and campaign_run_mentions_call(blob, call_id):
+            yield run_id, orjson.loads(blob)
 
 # Initialize databases from persistent storage
 users_db = load_users_db()
+# username -> user id, kept in step with users_db so login/signup don't scan every user
+username_to_id = {}
+for user_record in users_db.values():
+    username_to_id.setdefault(user_record["username"], user_record["id"])
+session_log_state = {"appends": 0}
 sessions_db = load_sessions_db()
+# (expires_at, token) min-heap so expired sessions are dropped without scanning every session
+session_expiry_heap = [(session["expires_at"], token) for token, session in sessions_db.items()]
+heapq.heapify(session_expiry_heap)
+# Fold the replayed log into the snapshot so expired sessions are dropped and the log starts empty
+save_sessions_db(sessions_db)
 clients_db = load_clients_db()
 campaigns_db = load_campaigns_db()
+# Campaigns without their file bytes, kept in step by put_campaign/remove_campaign,
+# plus the serialized /api/campaigns body built from them
+campaigns_public_db = {campaign_id: campaign_public_view(campaign) for campaign_id, campaign in campaigns_db.items()}
+campaigns_api_cache = {}
 campaign_results_db = load_campaign_results_db()
+# Fold the replayed log into the snapshot so the log starts empty
+save_campaign_results_db(campaign_results_db)
 
-print(f"✅ Loaded {len(users_db)} users, {len(sessions_db)} sessions, {len(clients_db)} clients, {len(campaigns_db)} campaigns, {len(campaign_results_db)} campaign results from persistent storage")
+logger.info("✅ Loaded %s users, %s sessions, %s clients, %s campaigns, %s campaign results from persistent storage",
+            len(users_db), len(sessions_db), len(clients_db), len(campaigns_db), len(campaign_results_db))
 
 security = HTTPBasic()
 
 # Add number formatting filter
 def number_format(value):
     """Format numbers with commas"""
+    if type(value) is int:
+        return f"{value:,}"
     try:
         return f"{int(value):,}"
     except (ValueError, TypeError):
@@ -243,6 +652,8 @@ templates.env.filters['number_format'] = number_format
 # --- Configuration ---
 
 
+# Read once per process; /admin/reload_key clears the cache after a key rotation
+@lru_cache(maxsize=1)
 def get_api_key():
     """Retrieve the API key from Replit Secrets"""
     try:
@@ -261,33 +672,61 @@ VOICE_MAP = {
 }
 
 
-def get_voice_id(name) -> str:
-    """Get the voice ID for the given voice name"""
-    return VOICE_MAP.get(
-        name,
-        VOICE_MAP["Paige"])  # Default to Paige
+DEFAULT_VOICE_ID = VOICE_MAP["Paige"]
+
+# Call outcome buckets reported by analytics and campaign summaries
+STATUS_KEYS = ('confirmed', 'cancelled', 'rescheduled', 'busy_voicemail',
+               'not_available', 'wrong_number', 'unknown', 'failed')
+EMPTY_STATUS_COUNTS = dict.fromkeys(STATUS_KEYS, 0)
+
+# Serialized analytics for a campaign that has no stored runs yet
+EMPTY_CAMPAIGN_ANALYTICS_JSON = orjson.dumps({
+    'total_calls': 0,
+    'total_duration': 0,
+    'formatted_duration': "0s",
+    'campaign_runs': 0,
+    'success_rate': 0,
+    'status_counts': EMPTY_STATUS_COUNTS,
+    'calls': []
+})
+
+# Voicemail text shared by the automatic and final voicemails, built once at import
+VOICEMAIL_MESSAGE_TEMPLATE = (
+    "Hi Good Morning, I am calling from Hillside Medical Group. "
+    "This call is for {patient_name} to remind him/her of an upcoming appointment on {appointment_date} at {appointment_time} with {provider_name} at {office_location}. "
+    "Please make sure to arrive 15 minutes prior to your appointment. "
+    "Also, Please make sure to email us your insurance information ASAP so that we can get it verified and avoid any delays on the day of your appointment. "
+    "If you wish to cancel or reschedule your appointment, please inform us at least 24 hours in advance to avoid cancellation charge of $25.00. "
+    "For more information, you can call us back on 210-742-6555. Thank you and have a blessed day."
+)
 
+FINAL_VOICEMAIL_TASK_TEMPLATE = (
+    "You are leaving a voicemail message. Speak clearly and deliver this message: "
+    + VOICEMAIL_MESSAGE_TEMPLATE
+)
 
-def get_call_prompt(city_name: str = "",
-                    full_address: str = "",
-                    office_location: str = "[office_location]",
-                    patient_name: str = "[patient name]",
-                    appointment_date: str = "[date]",
-                    appointment_time: str = "[time]",
-                    provider_name: str = "[provider name]",
-                    available_providers: str = ""):
-    """Return the call prompt"""
+VOICEMAIL_PROMPT_TEMPLATE = """
+    ROLE & PERSONA
+    You are an AI voice agent leaving a voicemail message from Hillside Medical Group. You are professional, clear, and concise.
 
-    # Add provider information if available
-    provider_info_section = ""
-    if available_providers:
-        provider_info_section = f"""
-    AVAILABLE PROVIDERS AT THIS LOCATION
-    {available_providers}
+    VOICEMAIL MESSAGE
+    {voicemail_message}{provider_info_section}
 
+    DELIVERY RULES
+    • Speak clearly and at a moderate pace
+    • Pause briefly between sentences
+    • Emphasize important information like the appointment date, time, and callback number
+    • End the call after delivering the complete message
     """
 
-    return f"""
+
+def get_voice_id(name) -> str:
+    """Get the voice ID for the given voice name"""
+    return VOICE_MAP.get(name, DEFAULT_VOICE_ID)  # Default to Paige
+
+
+# The call script; get_call_prompt fills in the {placeholders} with str.format_map
+CALL_PROMPT_TEMPLATE = """
     ROLE & PERSONA
     You are an AI voice agent calling from Hillside Primary Care. You are professional, polite, and empathetic. Speak in complete, natural sentences and combine related thoughts smoothly. Always wait for the patient's full response before continuing or ending the call. Do not skip or reorder steps.
 
@@ -414,6 +853,38 @@ def get_call_prompt(city_name: str = "",
     REMEMBER: Maintain natural conversation flow with appropriate pauses. Let patients naturally end with acknowledgments while ensuring calls don't continue indefinitely."""
 
 
+# Retries and resends of the same patient rebuild an identical multi-kilobyte prompt
+@lru_cache(maxsize=1024)
+def get_call_prompt(city_name: str = "",
+                    full_address: str = "",
+                    office_location: str = "[office_location]",
+                    patient_name: str = "[patient name]",
+                    appointment_date: str = "[date]",
+                    appointment_time: str = "[time]",
+                    provider_name: str = "[provider name]",
+                    available_providers: str = ""):
+    """Return the call prompt"""
+
+    # Add provider information if available
+    provider_info_section = ""
+    if available_providers:
+        provider_info_section = f"""
+    AVAILABLE PROVIDERS AT THIS LOCATION
+    {available_providers}
+
+    """
+
+    return CALL_PROMPT_TEMPLATE.format_map({
+        "city_name": city_name,
+        "full_address": full_address,
+        "patient_name": patient_name,
+        "appointment_date": appointment_date,
+        "appointment_time": appointment_time,
+        "provider_name": provider_name,
+        "provider_info_section": provider_info_section
+    })
+
+
 class CallRequest(BaseModel):
     phone_number: str
     patient_name: str
@@ -437,6 +908,14 @@ class CallResult(BaseModel):
     patient_name: str
     phone_number: str
     duration: int = 0
+    retry_after: Optional[float] = None  # Seconds to wait after a 429; the attempt doesn't count
+
+
+def model_to_dict(model: BaseModel) -> dict:
+    """Dump a model to a plain dict on pydantic v2 (model_dump) or v1 (dict)"""
+    if hasattr(model, 'model_dump'):
+        return model.model_dump()
+    return model.dict()
 
 
 class Client(BaseModel):
@@ -471,34 +950,29 @@ class UserLogin(BaseModel):
     password: str
 
 
-def hash_password(password: str) -> str:
-    """Hash a password for storage"""
-    return hashlib.sha256(password.encode()).hexdigest()
-
-def verify_password(password: str, hashed: str) -> bool:
-    """Verify a password against its hash"""
-    return hashlib.sha256(password.encode()).hexdigest() == hashed
-
-def create_session(user_id: str) -> str:
+async def create_session(user_id: str) -> str:
     """Create a new session token"""
     session_token = secrets.token_urlsafe(32)
-    sessions_db[session_token] = {
+    now = time.time()
+    session = {
         "user_id": user_id,
-        "created_at": datetime.now(),
-        "expires_at": datetime.now() + timedelta(hours=24)
+        "created_at": now,
+        "expires_at": now + SESSION_LIFETIME
     }
-    save_sessions_db(sessions_db)
+    sessions_db[session_token] = session
+    heapq.heappush(session_expiry_heap, (session["expires_at"], session_token))
+    await append_session_record({"token": session_token, **session})
     return session_token
 
 def get_current_user(request: Request) -> Optional[Dict]:
     """Get the current user from session"""
     # Check for session cookie
     session_token = request.cookies.get("session_token")
-    if not session_token or session_token not in sessions_db:
+    session = sessions_db.get(session_token) if session_token else None
+    if session is None:
         return None
 
-    session = sessions_db[session_token]
-    if datetime.now() > session["expires_at"]:
+    if time.time() > session["expires_at"]:
         del sessions_db[session_token]
         return None
 
@@ -525,6 +999,12 @@ def require_admin(request: Request):
         )
     return user
 
+# Runs of anything that isn't a digit, stripped from phone numbers and microsecond fields
+NON_DIGIT_RE = re.compile(r'\D+')
+
+
+# Uploads often repeat a number (family members, reschedules); the result only depends on the inputs
+@lru_cache(maxsize=8192)
 def format_phone_number(phone_number, country_code) -> str:
     """Format phone number with the selected country code"""
     if phone_number is None:
@@ -534,26 +1014,85 @@ def format_phone_number(phone_number, country_code) -> str:
 
     # Convert to string and remove all non-digit characters
     phone_str = str(phone_number) if phone_number is not None else ''
-    cleaned = re.sub(r'[^\d]', '', phone_str.strip())
+    cleaned = NON_DIGIT_RE.sub('', phone_str.strip())
 
     # Add the selected country code
     return f"{country_code}{cleaned}"
 
 
+# Columns every uploaded campaign/CSV row must fill in
+REQUIRED_FIELDS = ('phone_number', 'patient_name', 'date', 'time', 'provider_name', 'office_location')
+
+
+def excel_cell_to_str(value) -> str:
+    """Render an openpyxl cell value the way pandas' dtype=str reader does"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def read_excel_upload(content: bytes) -> pd.DataFrame:
+    """Stream the first sheet of an uploaded workbook into an all-string DataFrame"""
+    workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header_row = next(rows, ())
+
+        # Name blank and repeated headers the same way pandas does
+        headers = []
+        seen = {}
+        for position, cell in enumerate(header_row):
+            header = excel_cell_to_str(cell).strip() or f"Unnamed: {position}"
+            if header in seen:
+                seen[header] += 1
+                header = f"{header}.{seen[header]}"
+            else:
+                seen[header] = 0
+            headers.append(header)
+
+        records = [
+            [excel_cell_to_str(cell) for cell in row[:len(headers)]]
+            for row in rows
+            if any(cell is not None for cell in row)
+        ]
+    finally:
+        workbook.close()
+
+    return pd.DataFrame(records, columns=headers, dtype=str).fillna('')
+
+
+def safe_str(value) -> str:
+    """Strip an uploaded cell value - cells are str, or None for short CSV rows"""
+    return value.strip() if value is not None else ''
+
+
+def find_blank_required_fields(df, blank_values=('',)):
+    """Flag blank REQUIRED_FIELDS cells of a string-typed DataFrame, one boolean column per field"""
+    required = df.reindex(columns=list(REQUIRED_FIELDS), fill_value='')
+    return required.apply(lambda column: column.str.strip().str.lower().isin(blank_values))
+
+
+# Numbers with an optional h/m/s unit, e.g. "1m 30s" or "90s"
+DURATION_UNIT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([hms]?)')
+
+
 def parse_duration(duration_value):
     """Parse duration from various formats into seconds"""
     if not duration_value:
         return 0
 
-    print(f"🔍 Parsing duration: {duration_value} (type: {type(duration_value)})")
+    # Fast path: Bland AI almost always sends a number of seconds
+    if isinstance(duration_value, (int, float)):
+        try:
+            return int(duration_value)
+        except (ValueError, OverflowError):  # nan / inf
+            return 0
 
-    try:
-        # If it's already a number (seconds), return it
-        if isinstance(duration_value, (int, float)):
-            result = int(duration_value)
-            print(f"   Numeric value: {duration_value} -> {result} seconds")
-            return result
+    logger.debug("🔍 Parsing duration: %r", duration_value)
 
+    try:
         # If it's a string, try to parse it
         if isinstance(duration_value, str):
             duration_value = duration_value.strip()
@@ -562,11 +1101,15 @@ def parse_duration(duration_value):
             if not duration_value:
                 return 0
 
-            # Try to convert to float first (most common case for call_length)
+            # Plain integer strings like "150" parse in one step
+            try:
+                return int(duration_value)
+            except ValueError:
+                pass
+
+            # Then decimal strings like "1.5" (common for call_length)
             try:
-                result = int(float(duration_value))
-                print(f"   String-to-float: {duration_value} -> {result} seconds")
-                return result
+                return int(float(duration_value))
             except ValueError:
                 pass
 
@@ -590,11 +1133,7 @@ def parse_duration(duration_value):
                         pass
 
             # Handle formats like "1m 30s" or "90s"
-            import re
-
-            # Extract numbers followed by time units
-            pattern = r'(\d+(?:\.\d+)?)\s*([hms]?)'
-            matches = re.findall(pattern, duration_value.lower())
+            matches = DURATION_UNIT_RE.findall(duration_value.lower())
 
             total_seconds = 0
             for value, unit in matches:
@@ -609,17 +1148,31 @@ def parse_duration(duration_value):
             return int(total_seconds)
 
     except Exception as e:
-        print(f"❌ Error parsing duration '{duration_value}': {e}")
+        logger.error("❌ Error parsing duration '%s': %s", duration_value, e)
         return 0
 
     return 0
 
 
+def call_duration_seconds(call_data):
+    """Pick the best duration field from a Bland AI call payload, in seconds"""
+    call_length = call_data.get("call_length")
+    if call_length is not None and call_length != 0:
+        # call_length is in MINUTES, convert to seconds
+        return int(float(call_length) * 60)
+
+    corrected_duration = call_data.get("corrected_duration")
+    if corrected_duration is not None and corrected_duration != 0:
+        # corrected_duration is in SECONDS
+        return parse_duration(corrected_duration)
+
+    return parse_duration(call_data.get("duration", 0) or call_data.get("length", 0))
+
+
 def format_duration_display(total_duration_seconds):
     """Format duration in seconds to display format"""
-    hours = total_duration_seconds // 3600
-    minutes = (total_duration_seconds % 3600) // 60
-    seconds = total_duration_seconds % 60
+    hours, remainder = divmod(total_duration_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
 
     if hours > 0:
         return f"{hours}h {minutes}m"
@@ -629,6 +1182,10 @@ def format_duration_display(total_duration_seconds):
         return f"{seconds}s"
 
 
+# Timezone offsets truncated to "+nn:" at the end of an API timestamp
+TZ_TRAILING_COLON_RE = re.compile(r'([+-]\d{2}):$')
+
+
 def convert_utc_to_ist(utc_datetime_str):
     """Convert UTC datetime string to IST with comprehensive error handling"""
     if not utc_datetime_str or utc_datetime_str in ['N/A', 'Unknown', 'Invalid Date', 'null', 'None']:
@@ -652,15 +1209,12 @@ def convert_utc_to_ist(utc_datetime_str):
             # Fix incomplete timezone formats like "+00:" to "+00:00"
             if utc_datetime_str.endswith(('+00:', '-00:', '+01:', '-01:', '+02:', '-02:')):
                 utc_datetime_str = utc_datetime_str[:-1] + '00'
-                print(f"🔧 Fixed timezone format: {original_str} -> {utc_datetime_str}")
+                logger.debug("🔧 Fixed timezone format: %s -> %s", original_str, utc_datetime_str)
 
             # Fix other malformed timezone patterns
-            import re
-            # Pattern for fixing "+nn:" or "-nn:" at the end
-            tz_pattern = re.compile(r'([+-]\d{2}):$')
-            if tz_pattern.search(utc_datetime_str):
-                utc_datetime_str = tz_pattern.sub(r'\1:00', utc_datetime_str)
-                print(f"🔧 Fixed timezone pattern: {original_str} -> {utc_datetime_str}")
+            if TZ_TRAILING_COLON_RE.search(utc_datetime_str):
+                utc_datetime_str = TZ_TRAILING_COLON_RE.sub(r'\1:00', utc_datetime_str)
+                logger.debug("🔧 Fixed timezone pattern: %s -> %s", original_str, utc_datetime_str)
 
             # Handle microseconds - fix malformed microsecond parts
             if '.' in utc_datetime_str and not utc_datetime_str.endswith('Z'):
@@ -682,18 +1236,18 @@ def convert_utc_to_ist(utc_datetime_str):
                         timezone_part = microsecond_and_tz[tz_index:]
 
                         # Clean up microseconds - remove any non-digit characters
-                        microseconds = re.sub(r'[^\d]', '', microseconds)[:6]
+                        microseconds = NON_DIGIT_RE.sub('', microseconds)[:6]
                         microseconds = microseconds.ljust(6, '0')
 
                         # Reconstruct the datetime string
                         utc_datetime_str = parts[0] + '.' + microseconds + timezone_part
                     else:
                         # No timezone found, just clean and limit microseconds
-                        microseconds = re.sub(r'[^\d]', '', microsecond_and_tz)[:6]
+                        microseconds = NON_DIGIT_RE.sub('', microsecond_and_tz)[:6]
                         microseconds = microseconds.ljust(6, '0')
                         utc_datetime_str = parts[0] + '.' + microseconds
 
-                    print(f"🔧 Fixed microseconds: {original_str} -> {utc_datetime_str}")
+                    logger.debug("🔧 Fixed microseconds: %s -> %s", original_str, utc_datetime_str)
 
             # Handle Z suffix
             if utc_datetime_str.endswith('Z'):
@@ -715,7 +1269,7 @@ def convert_utc_to_ist(utc_datetime_str):
                 utc_dt = datetime.fromisoformat(clean_str)
                 utc_dt = utc_dt.replace(tzinfo=pytz.UTC)
         except ValueError as e:
-            print(f"🔧 ISO parsing failed for {utc_datetime_str}: {e}")
+            logger.debug("🔧 ISO parsing failed for %s: %s", utc_datetime_str, e)
 
         # Strategy 2: Manual parsing if ISO failed
         if utc_dt is None:
@@ -751,10 +1305,10 @@ def convert_utc_to_ist(utc_datetime_str):
                         continue
 
                 if utc_dt:
-                    print(f"🔧 Manual parsing succeeded for {utc_datetime_str}")
+                    logger.debug("🔧 Manual parsing succeeded for %s", utc_datetime_str)
 
             except Exception as e:
-                print(f"🔧 Manual parsing also failed for {utc_datetime_str}: {e}")
+                logger.debug("🔧 Manual parsing also failed for %s: %s", utc_datetime_str, e)
 
         # If we successfully parsed the datetime, convert to IST
         if utc_dt:
@@ -765,13 +1319,11 @@ def convert_utc_to_ist(utc_datetime_str):
             raise ValueError("All parsing strategies failed")
 
     except Exception as e:
-        print(f"❌ Error converting datetime {utc_datetime_str}: {e}")
+        logger.error("❌ Error converting datetime %s: %s", utc_datetime_str, e)
         # Enhanced fallback strategies
         try:
             if isinstance(utc_datetime_str, str):
                 # Strategy 1: Extract just the date and time without timezone
-                import re
-
                 # Try to extract ISO-like date and time
                 datetime_patterns = [
                     r'(\d{4}-\d{2}-\d{2})[T\s](\d{2}:\d{2}:\d{2})',
@@ -800,15 +1352,24 @@ def convert_utc_to_ist(utc_datetime_str):
                 return f"Date parsing failed ({safe_repr})"
 
         except Exception as fallback_error:
-            print(f"🔧 Even fallback parsing failed: {fallback_error}")
+            logger.debug("🔧 Even fallback parsing failed: %s", fallback_error)
             pass
 
         return "Invalid Date"
 
 
+def parse_retry_after(value, default=10.0) -> float:
+    """Seconds from a Retry-After header, or the default when it's missing or an HTTP date"""
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
 async def make_single_call_async(call_request: CallRequest, api_key: str,
-                                 semaphore: asyncio.Semaphore, campaign_id: Optional[str] = None, client_voice: Optional[str] = None) -> CallResult:
-    """Make a single call asynchronously with concurrency control"""
+                                 semaphore: asyncio.Semaphore, campaign_id: Optional[str] = None, client_voice: Optional[str] = None,
+                                 session: Optional[aiohttp.ClientSession] = None) -> CallResult:
+    """Make a single call asynchronously with concurrency control, reusing the shared HTTP session by default"""
     async with semaphore:  # Limit concurrent calls to 10
         call_data = {
             "patient name": call_request.patient_name,
@@ -821,10 +1382,10 @@ async def make_single_call_async(call_request: CallRequest, api_key: str,
             # Use client voice if provided, otherwise default to Paige
             voice_name = client_voice or "Paige"
             selected_voice = get_voice_id(voice_name)
-            print(f"🎤 Selected voice: {voice_name} (ID: {selected_voice})")
+            logger.debug("🎤 Selected voice: %s (ID: %s)", voice_name, selected_voice)
 
             # Get available providers for this location
-            office_location_key = getattr(call_request, 'office_location_key', call_request.office_location)
+            office_location_key = call_request.office_location_key or call_request.office_location
             available_providers_list = clinic_manager.find_providers_by_location(office_location_key)
 
             # Format provider information for the prompt
@@ -839,13 +1400,13 @@ async def make_single_call_async(call_request: CallRequest, api_key: str,
                     else:
                         provider_lines.append(f"• Dr. {name}")
                 available_providers_text = "\n".join(provider_lines)
-                print(f"📋 Including {len(available_providers_list)} providers in call prompt for {call_request.office_location}")
+                logger.debug("📋 Including %d providers in call prompt for %s", len(available_providers_list), call_request.office_location)
 
             payload = {
                 "phone_number": call_request.phone_number,
                 "task": get_call_prompt(
                     city_name=call_request.office_location,  # This now correctly holds just the city name
-                    full_address=getattr(call_request, 'full_address', call_request.office_location), # This gets the full address we attached
+                    full_address=call_request.full_address or call_request.office_location, # This gets the full address we attached
                     patient_name=call_request.patient_name,
                     appointment_date=call_request.appointment_date,
                     appointment_time=call_request.appointment_time,
@@ -858,192 +1419,71 @@ async def make_single_call_async(call_request: CallRequest, api_key: str,
                   "campaign_id": campaign_id
                 }
             }
+            if BLAND_WEBHOOK_URL:
+                payload["webhook"] = BLAND_WEBHOOK_URL
 
-            print(
-                f"🔄 Initiating call to {call_request.phone_number} for {call_request.patient_name}"
-            )
-            print(f"📞 API Payload keys: {list(payload.keys())}"
-                  )  # Don't log full payload for security
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                        "https://api.bland.ai/v1/calls",
-                        headers={
-                            "Authorization": f"Bearer {api_key}",
-                            "Content-Type": "application/json"
-                        },
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=60)) as response:
-
-                    response_text = await response.text()
-                    print(f"📊 API Response Status: {response.status}")
-                    print(f"📄 API Response: {response_text}")
-
-                    if response.status == 200:
-                        resp_json = await response.json()
-                        print(
-                            f"✅ Call initiated successfully for {call_request.patient_name}"
-                        )
-                        return CallResult(
-                            success=True,
-                            call_id=resp_json.get("call_id", "N/A"),
-                            status=resp_json.get("status", "N/A"),
-                            message=resp_json.get("message",
-                                                  "Call successfully queued."),
-                            patient_name=call_request.patient_name,
-                            phone_number=call_request.phone_number)
-                    elif response.status == 429:
-                        print(
-                            f"⏳ Rate limit hit for {call_request.patient_name}, applying 10-second backoff..."
-                        )
-                        await asyncio.sleep(10)  # 10-second backoff for rate limits
-                        return CallResult(
-                            success=False,
-                            error=
-                            "Rate limit exceeded - applied backoff, will retry",
-                            patient_name=call_request.patient_name,
-                            phone_number=call_request.phone_number)
-                    else:
-                        error_msg = f"API error (Status {response.status})"
-                        try:
-                            error_json = await response.json()
-                            if 'message' in error_json:
-                                error_msg += f": {error_json['message']}"
-                            elif 'detail' in error_json:
-                                error_msg += f": {error_json['detail']}"
-                            else:
-                                error_msg += f": {response_text}"
-                        except:
-                            error_msg += f": {response_text}"
-
-                        print(
-                            f"❌ API Error for {call_request.patient_name}: {error_msg}"
-                        )
-                        return CallResult(
-                            success=False,
-                            error=error_msg,
-                            patient_name=call_request.patient_name,
-                            phone_number=call_request.phone_number)
-        except Exception as e:
-            print(f"💥 Exception during call initiation: {str(e)}")
-            return CallResult(success=False,
-                              error=str(e),
-                              patient_name=call_request.patient_name,
-                              phone_number=call_request.phone_number)
-
-
-def make_single_call(call_request: CallRequest, api_key: str, client_voice: Optional[str] = None) -> CallResult:
-    """Make a single call and return the result"""
-    call_data = {
-        "patient name": call_request.patient_name,
-        "provider name": call_request.provider_name,
-        "date": call_request.appointment_date,
-        "time": call_request.appointment_time
-    }
-
-    try:
-        # Use client voice if provided, otherwise default to Paige
-        voice_name = client_voice or "Paige"
-        selected_voice = get_voice_id(voice_name)
-        print(f"🎤 Selected voice: {voice_name} (ID: {selected_voice})")
-
-        # Get available providers for this location
-        office_location_key = getattr(call_request, 'office_location_key', call_request.office_location)
-        available_providers_list = clinic_manager.find_providers_by_location(office_location_key)
-
-        # Format provider information for the prompt
-        available_providers_text = ""
-        if available_providers_list:
-            provider_lines = []
-            for provider in available_providers_list:
-                name = provider.get('name', provider.get('provider_name', 'Unknown'))
-                specialty = provider.get('specialty', provider.get('specialization', ''))
-                if specialty:
-                    provider_lines.append(f"• Dr. {name} - {specialty}")
-                else:
-                    provider_lines.append(f"• Dr. {name}")
-            available_providers_text = "\n".join(provider_lines)
-            print(f"📋 Including {len(available_providers_list)} providers in call prompt for {call_request.office_location}")
-
-        payload = {
-            "phone_number": call_request.phone_number,
-            "task": get_call_prompt(
-                office_location=call_request.office_location,
-                patient_name=call_request.patient_name,
-                appointment_date=call_request.appointment_date,
-                appointment_time=call_request.appointment_time,
-                provider_name=call_request.provider_name,
-                available_providers=available_providers_text
-            ),
-            "voice": selected_voice,
-            "request_data": call_data
-        }
-
-        print(
-            f"🔄 Initiating call to {call_request.phone_number} for {call_request.patient_name}"
-        )
-        print(f"📞 API Payload keys: {list(payload.keys())}"
-              )  # Don't log full payload for security
+            logger.debug("🔄 Initiating call to %s for %s", call_request.phone_number, call_request.patient_name)
+            logger.debug("📞 API Payload keys: %s", list(payload))  # Don't log full payload for security
 
-        response = requests.post(
-            "https://api.bland.ai/v1/calls",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json=payload,
-            timeout=60  # Increased timeout
-        )
+            session = session or app.state.http
+            async with session.post(
+                    BLAND_CALLS_URL,
+                    headers=get_bland_headers(api_key),
+                    data=orjson.dumps(payload),
+                    timeout=aiohttp.ClientTimeout(total=60)) as response:
 
-        print(f"📊 API Response Status: {response.status_code}")
-        print(f"📄 API Response: {response.text}")
+                body = await response.read()
+                logger.debug("📊 API Response Status: %s", response.status)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📄 API Response: %s", body.decode('utf-8', 'replace'))
 
-        if response.status_code == 200:
-            resp_json = response.json()
-            print(
-                f"✅ Call initiated successfully for {call_request.patient_name}"
-            )
-            return CallResult(success=True,
-                              call_id=resp_json.get("call_id", "N/A"),
-                              status=resp_json.get("status", "N/A"),
-                              message=resp_json.get(
-                                  "message", "Call initiated successfully"),
-                              patient_name=call_request.patient_name,
-                              phone_number=call_request.phone_number)
-        elif response.status_code == 429:
-            print(
-                f"⏳ Rate limit hit for {call_request.patient_name}, applying 10-second backoff..."
-            )
-            time.sleep(10)  # 10-second backoff for rate limits
-            return CallResult(
-                success=False,
-                error=f"Rate limit exceeded - applied backoff, will retry",
-                patient_name=call_request.patient_name,
-                phone_number=call_request.phone_number)
-        else:
-            error_msg = f"API error (Status {response.status_code})"
-            try:
-                error_json = response.json()
-                if 'message' in error_json:
-                    error_msg += f": {error_json['message']}"
-                elif 'detail' in error_json:
-                    error_msg += f": {error_json['detail']}"
+                if response.status == 200:
+                    resp_json = orjson.loads(body)
+                    logger.info("✅ Call initiated successfully for %s", call_request.patient_name)
+                    return CallResult(
+                        success=True,
+                        call_id=resp_json.get("call_id", "N/A"),
+                        status=resp_json.get("status", "N/A"),
+                        message=resp_json.get("message",
+                                              "Call successfully queued."),
+                        patient_name=call_request.patient_name,
+                        phone_number=call_request.phone_number)
+                elif response.status == 429:
+                    # Hand the wait back to the caller instead of sleeping while holding the semaphore
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    logger.warning("⏳ Rate limit hit for %s, retry after %.0fs", call_request.patient_name, retry_after)
+                    return CallResult(
+                        success=False,
+                        error="Rate limit exceeded - will retry",
+                        retry_after=retry_after,
+                        patient_name=call_request.patient_name,
+                        phone_number=call_request.phone_number)
                 else:
-                    error_msg += f": {response.text}"
-            except:
-                error_msg += f": {response.text}"
+                    error_msg = f"API error (Status {response.status})"
+                    response_text = body.decode('utf-8', 'replace')
+                    try:
+                        error_json = orjson.loads(body)
+                        if 'message' in error_json:
+                            error_msg += f": {error_json['message']}"
+                        elif 'detail' in error_json:
+                            error_msg += f": {error_json['detail']}"
+                        else:
+                            error_msg += f": {response_text}"
+                    except:
+                        error_msg += f": {response_text}"
 
-            print(f"❌ API Error for {call_request.patient_name}: {error_msg}")
+                    logger.error("❌ API Error for %s: %s", call_request.patient_name, error_msg)
+                    return CallResult(
+                        success=False,
+                        error=error_msg,
+                        patient_name=call_request.patient_name,
+                        phone_number=call_request.phone_number)
+        except Exception as e:
+            logger.error("💥 Exception during call initiation: %s", e)
             return CallResult(success=False,
-                              error=error_msg,
+                              error=str(e),
                               patient_name=call_request.patient_name,
                               phone_number=call_request.phone_number)
-    except Exception as e:
-        print(f"💥 Exception during call initiation: {str(e)}")
-        return CallResult(success=False,
-                          error=str(e),
-                          patient_name=call_request.patient_name,
-                          phone_number=call_request.phone_number)
 
 
 @app.post("/make-call")
@@ -1061,9 +1501,8 @@ async def make_call(call_request: CallRequest, country_code: str = "+1"):
         # Format phone number with country code
         formatted_phone = format_phone_number(call_request.phone_number,
                                               country_code)
-        print(
-            f"📞 Original: {call_request.phone_number} -> Formatted: {formatted_phone} (Country Code: {country_code})"
-        )
+        logger.debug("📞 Original: %s -> Formatted: %s (Country Code: %s)",
+                     call_request.phone_number, formatted_phone, country_code)
 
         # Update the call request with formatted phone number
         call_request.phone_number = formatted_phone
@@ -1078,7 +1517,7 @@ async def make_call(call_request: CallRequest, country_code: str = "+1"):
         #     client_voice = clients_db[client_id].get("voice")
 
         # Make the call
-        result = make_single_call(call_request, api_key, client_voice)
+        result = await make_single_call_async(call_request, api_key, asyncio.Semaphore(1), client_voice=client_voice)
 
         return {
             "success": result.success,
@@ -1118,29 +1557,31 @@ async def signup_page(request: Request):
 async def login(request: Request, username: str = Form(...), password: str = Form(...)):
     """Handle login"""
     try:
-        user = None
-        for user_data in users_db.values():
-            if user_data["username"] == username:
-                user = user_data
-                break
+        user_id = username_to_id.get(username)
+        user = users_db.get(user_id) if user_id else None
 
-        if not user or not verify_password(password, user["password_hash"]):
+        # scrypt is deliberately slow, so hash in a worker thread
+        if not user or not await asyncio.to_thread(verify_password, password, user["password_hash"]):
             return {"success": False, "message": "Invalid username or password"}
 
+        # Upgrade legacy unsalted hashes now that we have the plaintext
+        if is_legacy_password_hash(user["password_hash"]):
+            user["password_hash"] = await asyncio.to_thread(hash_password, password)
+            await save_users_db_async(users_db)
+
         # Create session
-        session_token = create_session(user["id"])
+        session_token = await create_session(user["id"])
 
         # Create response with session cookie
-        from fastapi.responses import JSONResponse
         response_data = {"success": True, "message": "Login successful", "redirect_url": "/"}
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         response.set_cookie(
             key="session_token",
             value=session_token,
             httponly=True,
             secure=False,  # Set to True in production with HTTPS
             samesite="lax",
-            max_age=24 * 60 * 60  # 24 hours
+            max_age=SESSION_LIFETIME
         )
         return response
     except Exception as e:
@@ -1150,39 +1591,41 @@ async def login(request: Request, username: str = Form(...), password: str = For
 async def signup(request: Request, user_data: UserCreate):
     """Handle signup"""
     try:
+        # Hash before the username check so no await sits between the check and the insert
+        password_hash = await asyncio.to_thread(hash_password, user_data.password)
+
         # Check if username already exists
-        for existing_user in users_db.values():
-            if existing_user["username"] == user_data.username:
-                return {"success": False, "message": "Username already exists"}
+        if user_data.username in username_to_id:
+            return {"success": False, "message": "Username already exists"}
 
         # Create new user
         user_id = str(uuid.uuid4())
         new_user = {
             "id": user_id,
             "username": user_data.username,
-            "password_hash": hash_password(user_data.password),
+            "password_hash": password_hash,
             "role": user_data.role,
             "email": user_data.email,
             "created_at": datetime.now().isoformat()
         }
 
         users_db[user_id] = new_user
-        save_users_db(users_db)
+        username_to_id[user_data.username] = user_id
+        await save_users_db_async(users_db)
 
         # Create session
-        session_token = create_session(user_id)
+        session_token = await create_session(user_id)
 
         # Create response with session cookie
-        from fastapi.responses import JSONResponse
         response_data = {"success": True, "message": "Account created successfully", "redirect_url": "/"}
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         response.set_cookie(
             key="session_token",
             value=session_token,
             httponly=True,
             secure=False,  # Set to True in production with HTTPS
             samesite="lax",
-            max_age=24 * 60 * 60  # 24 hours
+            max_age=SESSION_LIFETIME
         )
         return response
     except Exception as e:
@@ -1194,11 +1637,10 @@ async def logout(request: Request):
     session_token = request.cookies.get("session_token")
     if session_token and session_token in sessions_db:
         del sessions_db[session_token]
-        save_sessions_db(sessions_db)
+        await append_session_record({"token": session_token, "deleted": True})
 
     # Create response that clears the session cookie
-    from fastapi.responses import JSONResponse
-    response = JSONResponse(content={"success": True, "message": "Logged out successfully"})
+    response = ORJSONResponse(content={"success": True, "message": "Logged out successfully"})
     response.delete_cookie(key="session_token", httponly=True, samesite="lax")
     return response
 
@@ -1214,38 +1656,16 @@ async def dashboard(request: Request):
 
     # Load clients and campaigns data for dashboard
     clients = load_clients()
-    campaigns_raw = load_campaigns()
-
-    # Remove file data from campaigns to make them JSON serializable
-    campaigns = []
-    for campaign in campaigns_raw:
-        campaign_copy = campaign.copy()
-        # Remove any file-related data that might be bytes
-        if 'file_data' in campaign_copy:
-            del campaign_copy['file_data']
-        if 'csv_data' in campaign_copy:
-            del campaign_copy['csv_data']
-        campaigns.append(campaign_copy)
+    # Public views have the file bytes stripped, so they are JSON serializable
+    campaigns = list(campaigns_public_db.values())
 
     # Calculate metrics from actual campaign results
     total_clients = len(clients)
     total_campaigns = len(campaigns)
-    total_calls = 0
-    total_duration_seconds = 0
-
-    # --- THIS IS THE CORRECTED LOGIC ---
-    # Aggregate data from all campaign results (including multiple runs)
-    for result_key, campaign_results in campaign_results_db.items():
-        if 'results' in campaign_results:
-            total_calls += len(campaign_results['results'])
-
-            # Sum the actual 'duration' field from each call result
-            for result in campaign_results['results']:
-                # The 'duration' is already parsed into seconds by the webhook
-                duration_in_seconds = result.get('duration', 0)
-                if isinstance(duration_in_seconds, int):
-                    total_duration_seconds += duration_in_seconds
-    # --- END OF CORRECTION ---
+    # Aggregated from all campaign results (including multiple runs), cached until a run changes
+    totals = get_dashboard_totals()
+    total_calls = totals['total_calls']
+    total_duration_seconds = totals['total_duration_seconds']
 
     # Format total duration
     formatted_duration = format_duration_display(total_duration_seconds)
@@ -1257,8 +1677,8 @@ async def dashboard(request: Request):
         "total_duration": formatted_duration
     }
 
-    print(f"📊 Dashboard metrics calculated: {metrics}")
-    print(f"📊 Available campaign results: {list(campaign_results_db.keys())}")
+    logger.info("📊 Dashboard metrics calculated: %s", metrics)
+    logger.debug("📊 Available campaign results: %s", campaign_results_db.keys())
 
     return templates.TemplateResponse("dashboard.html", {
         "request": request,
@@ -1306,7 +1726,8 @@ async def campaigns_page(request: Request, client_id: Optional[str] = None, clie
     try:
         user = require_auth(request)
         clients = load_clients()
-        campaigns = load_campaigns()
+        # Public views have the file bytes stripped, so they are JSON serializable
+        campaigns = list(campaigns_public_db.values())
         has_api_key = bool(get_api_key())
 
         # Filter campaigns by client if client_id is provided
@@ -1314,29 +1735,17 @@ async def campaigns_page(request: Request, client_id: Optional[str] = None, clie
         if client_id:
             filtered_campaigns = [c for c in campaigns if c.get('client_id') == client_id]
 
-        # Remove file data from campaigns to make them JSON serializable
-        serializable_campaigns = []
-        for campaign in filtered_campaigns:
-            campaign_copy = campaign.copy() if isinstance(campaign, dict) else campaign
-            # Remove any file-related data that might be bytes
-            if isinstance(campaign_copy, dict):
-                if 'file_data' in campaign_copy:
-                    del campaign_copy['file_data']
-                if 'csv_data' in campaign_copy:
-                    del campaign_copy['csv_data']
-            serializable_campaigns.append(campaign_copy)
-
         return templates.TemplateResponse("campaigns.html", {
             "request": request,
             "clients": clients,
-            "campaigns": serializable_campaigns,
+            "campaigns": filtered_campaigns,
             "has_api_key": has_api_key,
             "filtered_client_id": client_id,
             "filtered_client_name": client_name,
             "current_user": user
         })
     except Exception as e:
-        print(f"Error in campaigns_page: {str(e)}")
+        logger.error("Error in campaigns_page: %s", e)
         raise HTTPException(status_code=500, detail=f"Error loading campaigns page: {str(e)}")
 
 
@@ -1346,8 +1755,8 @@ async def add_client(request: Request, client: Client):
     user = require_admin(request)
     client_id = str(uuid.uuid4())
     client.id = client_id
-    clients_db[client_id] = client.dict()
-    save_clients_db(clients_db)
+    clients_db[client_id] = model_to_dict(client)
+    await save_clients_db_async(clients_db)
     return {"success": True, "client_id": client_id, "message": "Client added successfully"}
 
 @app.delete("/delete_client/{client_id}")
@@ -1362,7 +1771,7 @@ async def delete_client(request: Request, client_id: str):
 
     # Delete the client
     del clients_db[client_id]
-    save_clients_db(clients_db)
+    await save_clients_db_async(clients_db)
 
     # Delete all campaigns associated with this client
     campaigns_to_delete = []
@@ -1371,7 +1780,7 @@ async def delete_client(request: Request, client_id: str):
             campaigns_to_delete.append(campaign_id)
 
     for campaign_id in campaigns_to_delete:
-        del campaigns_db[campaign_id]
+        remove_campaign(campaign_id)
         # Also delete campaign results
         results_to_delete = []
         for result_key in campaign_results_db.keys():
@@ -1380,10 +1789,11 @@ async def delete_client(request: Request, client_id: str):
 
         for result_key in results_to_delete:
             del campaign_results_db[result_key]
+        invalidate_campaign_analytics(campaign_id)
 
     # Save changes
-    save_campaigns_db(campaigns_db)
-    save_campaign_results_db(campaign_results_db)
+    await save_campaigns_db_async(campaigns_db)
+    await save_campaign_results_db_async(campaign_results_db)
 
     return {
         "success": True,
@@ -1444,19 +1854,19 @@ async def add_campaign(
             "max_attempts": max_attempts,
             "retry_interval": retry_interval,
             "country_code": country_code,
-            "file_name": file.filename,
-            "file_data": file_content
+            "file_name": file.filename
         }
 
-        campaigns_db[campaign_id] = campaign_data
-        save_campaigns_db(campaigns_db)
-        print(f"✅ Campaign '{name}' created successfully with ID: {campaign_id}")
+        await save_campaign_file(campaign_id, campaign_data, file_content)
+        put_campaign(campaign_id, campaign_data)
+        await save_campaigns_db_async(campaigns_db)
+        logger.info("✅ Campaign '%s' created successfully with ID: %s", name, campaign_id)
         return {"success": True, "campaign_id": campaign_id, "message": "Campaign created successfully"}
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error creating campaign: {str(e)}")
+        logger.error("❌ Error creating campaign: %s", e)
         raise HTTPException(status_code=500, detail=f"Error creating campaign: {str(e)}")
 
 
@@ -1492,15 +1902,15 @@ async def update_campaign(
 
         file_content = await file.read()
         campaign["file_name"] = file.filename
-        campaign["file_data"] = file_content
+        await save_campaign_file(campaign_id, campaign, file_content)
 
-    campaigns_db[campaign_id] = campaign
-    save_campaigns_db(campaigns_db)
+    put_campaign(campaign_id, campaign)
+    await save_campaigns_db_async(campaigns_db)
     return {"success": True, "message": "Campaign updated successfully"}
 
 @app.post("/start_campaign/{campaign_id}")
-async def start_campaign(campaign_id: str, file: UploadFile = File(None)):
-    """Start a campaign using stored file or new upload with retry logic"""
+async def start_campaign(campaign_id: str, background_tasks: BackgroundTasks, file: UploadFile = File(None)):
+    """Validate the campaign file and start its calls in the background; poll /campaigns/{id}/status for progress"""
     api_key = get_api_key()
 
     if not api_key:
@@ -1532,57 +1942,65 @@ async def start_campaign(campaign_id: str, file: UploadFile = File(None)):
             filename = file.filename
         else:
             # Use stored file
-            if not campaign.get('file_data') or not campaign.get('file_name'):
+            content = await asyncio.to_thread(read_campaign_file, campaign) if campaign.get('file_name') else None
+            if not content:
                 raise HTTPException(status_code=400, detail="No file found for this campaign. Please upload a file.")
-            content = campaign['file_data']
             filename = campaign['file_name']
 
-        if filename.endswith('.xlsx'):
-            # Read Excel file
-            df = pd.read_excel(io.BytesIO(content))
-            rows = df.to_dict('records')
-        else:
-            # Read CSV file
-            csv_string = content.decode('utf-8')
-            csv_reader = csv.DictReader(io.StringIO(csv_string))
-            rows = list(csv_reader)
-
-        results = []
-        row_count = 0
-
-        # Prepare all call requests
-        call_requests = []
         validation_failures = []
-        for row in rows:
-            row_count += 1
-            # Validate required fields
-            required_fields = [
-                'phone_number', 'patient_name', 'date', 'time', 'provider_name', 'office_location'
-            ]
-            missing_fields = [
-                field for field in required_fields
-                if not str(row.get(field, '')).strip()
-            ]
 
-            if missing_fields:
+        if filename.endswith('.xlsx'):
+            # Read Excel file as strings and validate required fields column-wise
+            df = read_excel_upload(content)
+            blank_fields = find_blank_required_fields(df)
+            missing_mask = blank_fields.any(axis=1)
+
+            for row, blank_row in zip(df.loc[missing_mask].to_dict('records'),
+                                      blank_fields.loc[missing_mask].itertuples(index=False)):
+                missing_fields = [field for field, is_blank in zip(REQUIRED_FIELDS, blank_row) if is_blank]
                 validation_failures.append(
                     CallResult(
                         success=False,
                         error=f"Missing required fields: {', '.join(missing_fields)}",
                         patient_name=row.get('patient_name', 'Unknown'),
                         phone_number=row.get('phone_number', 'Unknown')))
-                continue
+
+            # Only the valid subset is converted to dicts
+            rows = df.loc[~missing_mask].to_dict('records')
+            rows_validated = True
+        else:
+            # Read CSV file
+            # Decode incrementally and hand rows straight to the loop below instead of listing them first;
+            # utf-8-sig drops the BOM Excel puts on exported CSVs, which would otherwise mangle the first header
+            csv_stream = io.TextIOWrapper(io.BytesIO(content), encoding='utf-8-sig', newline='')
+            rows = csv.DictReader(csv_stream)
+            rows_validated = False
+
+        # Prepare all call requests
+        call_requests = []
+        for row in rows:
+            # Validate required fields (Excel rows were validated above)
+            if not rows_validated:
+                # csv.DictReader values are str (or None for short rows)
+                missing_fields = [
+                    field for field in REQUIRED_FIELDS
+                    if not (row.get(field) or '').strip()
+                ]
+
+                if missing_fields:
+                    validation_failures.append(
+                        CallResult(
+                            success=False,
+                            error=f"Missing required fields: {', '.join(missing_fields)}",
+                            patient_name=row.get('patient_name', 'Unknown'),
+                            phone_number=row.get('phone_number', 'Unknown')))
+                    continue
 
             # Format phone number with campaign's country code
-            phone_number_raw = row.get('phone_number', '')
-            phone_number_str = str(phone_number_raw).strip() if phone_number_raw is not None else ''
+            phone_number_str = safe_str(row.get('phone_number'))
             campaign_country_code = campaign.get('country_code', '+1') or '+1'
             formatted_phone = format_phone_number(phone_number_str, campaign_country_code)
-            print(f"📞 Campaign {campaign['name']}: {phone_number_str} -> Formatted: {formatted_phone} (Country Code: {campaign_country_code})")
-
-            # Create call request - safely handle None values
-            def safe_str(value):
-                return str(value).strip() if value is not None else ''
+            logger.debug("📞 Campaign %s: %s -> Formatted: %s (Country Code: %s)", campaign['name'], phone_number_str, formatted_phone, campaign_country_code)
 
             # Use office_location from uploaded file as foreign key to lookup full address
             # Use the 'office_location' from the campaign file as the lookup key
@@ -1598,10 +2016,10 @@ async def start_campaign(campaign_id: str, file: UploadFile = File(None)):
             full_address = clinic_manager.find_clinic_address(office_location_key)
 
             if not full_address:
-                print(f"⚠️ Full address not found for key '{office_location_key}'. Using the key as a fallback for the address.")
+                logger.warning("⚠️ Full address not found for key '%s'. Using the key as a fallback for the address.", office_location_key)
                 full_address = office_location_key # Use the original value if lookup fails
 
-            print(f"📍 Location Mapping: For greeting, AI will use city='{city_name}'. If asked, it will use address='{full_address}'")
+            logger.debug("📍 Location Mapping: For greeting, AI will use city='%s'. If asked, it will use address='%s'", city_name, full_address)
 
             # Create the request object
             call_request = CallRequest(
@@ -1615,19 +2033,96 @@ async def start_campaign(campaign_id: str, file: UploadFile = File(None)):
                 office_location_key=office_location_key  # Keep the original key for provider lookup
             )
             call_requests.append(call_request)
-            print(f"📊 Validation complete: {len(validation_failures)} failures, {len(call_requests)} valid calls")
+            logger.info("📊 Validation complete: %s failures, %s valid calls", len(validation_failures), len(call_requests))
+
+        # Create a unique run ID for this campaign execution
+        run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        campaign_run_id = f"{campaign_id}_run_{run_timestamp}"
+
+        # Store the run straight away; the background task fills in call results as they happen
+        campaign_results = {
+            "campaign_id": campaign_id,
+            "campaign_run_id": campaign_run_id,
+            "campaign_name": campaign['name'],
+            "client_name": client['name'],
+            "total_calls": len(validation_failures) + len(call_requests),
+            "successful_calls": 0,
+            "failed_calls": len(validation_failures),
+            "started_at": datetime.now().isoformat(),
+            "completed_at": None,
+            "status": "running",
+            "run_number": len([k for k in campaign_results_db.keys() if k.startswith(campaign_id)]) + 1,
+            "results": [model_to_dict(result) for result in validation_failures]
+        }
+        store_campaign_run(campaign_run_id, campaign_results)
+        await save_campaign_results_db_async(campaign_results_db)
+
+        background_tasks.add_task(
+            run_campaign_in_background,
+            campaign_run_id,
+            campaign_id,
+            campaign,
+            call_requests,
+            validation_failures,
+            api_key,
+            client_voice
+        )
+        logger.info("✅ Campaign %s started as run %s: %s calls queued, %s validation failures", campaign['name'], campaign_run_id, len(call_requests), len(validation_failures))
+
+        return ORJSONResponse({
+            "success": True,
+            "status": "started",
+            "campaign_id": campaign_id,
+            "campaign_run_id": campaign_run_id,
+            "campaign_name": campaign['name'],
+            "total_calls": campaign_results["total_calls"],
+            "queued_calls": len(call_requests),
+            "validation_failures": len(validation_failures)
+        }, status_code=202)
+
+    except Exception as e:
+        logger.exception("❌ Error starting campaign %s (%s for client %s): %s", campaign_id,
+                         campaign.get('name', 'Unknown'), campaign.get('client_id', 'Unknown'), e)
 
+        # More specific error message
+        error_detail = f"Campaign start failed: {str(e)}"
+        if "Failed to fetch" in str(e):
+            error_detail = "Network connection error - please check your API key and internet connection"
+
+        raise HTTPException(status_code=500, detail=error_detail)
+
+
+
+async def run_campaign_in_background(campaign_run_id, campaign_id, campaign, call_requests, validation_failures, api_key, client_voice: Optional[str] = None):
+    """Process a started campaign's calls with retry logic and keep its stored run up to date"""
+
+    async def record_initiated_call(result):
+        # Add each initiated call to the live run so webhook updates can find it mid-campaign
+        run_data = get_campaign_run(campaign_run_id)
+        if run_data is None:
+            return
+        result_data = model_to_dict(result)
+        run_data['results'].append(result_data)
+        run_data['successful_calls'] += 1
+        invalidate_campaign_analytics(campaign_run_id)
+        await append_campaign_result(campaign_run_id, result_data, run_data['successful_calls'])
+
+    run_data = get_campaign_run(campaign_run_id)
+    if run_data is not None:
+        active_campaign_runs[campaign_run_id] = run_data
+
+    try:
         # Process all valid calls with retry logic and batch delays
         call_results = []
         if call_requests:
             max_attempts = campaign.get('max_attempts', 3)
             retry_interval_minutes = campaign.get('retry_interval', 30)
 
-            print(f"🚀 Starting campaign '{campaign['name']}' with retry logic - Max attempts: {max_attempts}, Retry interval: {retry_interval_minutes} min")
-            print(f"📊 Total calls to process: {len(call_requests)} (with international rate limit protection)")
-            print(f"🌍 International rate limit protection: 2 concurrent calls, 30s batch delays, extended retry intervals")
+            logger.info("🚀 Starting campaign '%s' with retry logic - Max attempts: %s, Retry interval: %s min", campaign['name'], max_attempts, retry_interval_minutes)
+            logger.info("📊 Total calls to process: %s (with international rate limit protection)", len(call_requests))
+            logger.info("🌍 International rate limit protection: up to %s concurrent calls, one call started every %ss",
+                        MAX_CALL_CONCURRENCY, CAMPAIGN_CALL_INTERVAL)
 
-            # Process calls with retry logic and batch delays
             call_results = await process_calls_with_retry_and_batching(
                 call_requests,
                 api_key,
@@ -1635,69 +2130,114 @@ async def start_campaign(campaign_id: str, file: UploadFile = File(None)):
                 retry_interval_minutes,
                 campaign['name'],
                 campaign_id,
-                client_voice # Pass client_voice here
+                client_voice,
+                on_call_initiated=record_initiated_call
             )
-            results = validation_failures + call_results
 
-        # Calculate summary
-        successful_calls = sum(1 for r in results if r.success)
-        failed_calls = len(results) - successful_calls
+        results = validation_failures + call_results
 
-        # Create a unique run ID for this campaign execution
-        run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        campaign_run_id = f"{campaign_id}_run_{run_timestamp}"
+        run_data = get_campaign_run(campaign_run_id)
+        if run_data is None:
+            logger.warning("⚠️ Campaign run %s was deleted before it finished", campaign_run_id)
+            return
 
-        # Store campaign results with unique run ID
-        campaign_results = {
-            "campaign_id": campaign_id,
-            "campaign_run_id": campaign_run_id,
-            "campaign_name": campaign['name'],
-            "client_name": client['name'],
+        # Keep any webhook updates that already landed on stored calls
+        stored_calls = {r['call_id']: r for r in run_data['results'] if r.get('call_id')}
+        successful_calls = sum(1 for r in results if r.success)
+
+        run_data.update({
             "total_calls": len(results),
             "successful_calls": successful_calls,
-            "failed_calls": failed_calls,
-            "started_at": datetime.now().isoformat(),
+            "failed_calls": len(results) - successful_calls,
             "completed_at": datetime.now().isoformat(),
             "status": "completed",
-            "run_number": len([k for k in campaign_results_db.keys() if k.startswith(campaign_id)]) + 1,
-            "results": [result.dict() for result in results]
-        }
+            "results": [stored_calls.get(result.call_id) or model_to_dict(result) for result in results]
+        })
+        store_campaign_run(campaign_run_id, run_data)
+        await save_campaign_results_db_async(campaign_results_db)
+        logger.info("✅ Stored campaign results for %s. Total campaigns with results: %s", campaign_id, len(campaign_results_db))
+        logger.info("✅ This campaign results: Total=%s, Success=%s, Failed=%s", len(results), successful_calls, len(results) - successful_calls)
 
-        # Store in the global results database with unique run ID
-        campaign_results_db[campaign_run_id] = campaign_results
-        save_campaign_results_db(campaign_results_db)
-        print(f"✅ Stored campaign results for {campaign_id}. Total campaigns with results: {len(campaign_results_db)}")
-        print(f"✅ This campaign results: Total={len(results)}, Success={successful_calls}, Failed={failed_calls}")
+    except Exception as e:
+        logger.exception("❌ Error running campaign %s (run %s): %s", campaign_id, campaign_run_id, e)
 
-        return {
-            "success": True,
-            "campaign_id": campaign_id,
-            "campaign_name": campaign['name'],
-            "total_calls": len(results),
-            "successful_calls": successful_calls,
-            "failed_calls": failed_calls,
-            "results": [result.dict() for result in results]
-        }
+        run_data = get_campaign_run(campaign_run_id)
+        if run_data is not None:
+            run_data.update({
+                "status": "failed",
+                "error": str(e),
+                "completed_at": datetime.now().isoformat()
+            })
+            store_campaign_run(campaign_run_id, run_data)
+            await save_campaign_results_db_async(campaign_results_db)
 
-    except Exception as e:
-        print(f"❌ Error starting campaign {campaign_id}: {str(e)}")
-        print(f"❌ Campaign details: {campaign.get('name', 'Unknown')} for client {campaign.get('client_id', 'Unknown')}")
-        import traceback
-        traceback.print_exc()
+    finally:
+        active_campaign_runs.pop(campaign_run_id, None)
 
-        # More specific error message
-        error_detail = f"Campaign start failed: {str(e)}"
-        if "Failed to fetch" in str(e):
-            error_detail = "Network connection error - please check your API key and internet connection"
 
-        raise HTTPException(status_code=500, detail=error_detail)
+@app.get("/campaigns/{campaign_id}/status")
+async def get_campaign_status(campaign_id: str):
+    """Report the progress of a campaign's most recent run"""
+    if campaign_id not in campaigns_db:
+        raise HTTPException(status_code=404, detail="Campaign not found")
 
+    # Run IDs end in a sortable timestamp, so the latest run is the max key
+    run_ids = [k for k in campaign_results_db.keys() if k.startswith(f"{campaign_id}_run_")]
+    if not run_ids:
+        return {"success": True, "campaign_id": campaign_id, "status": "not_started"}
 
+    campaign_run_id = max(run_ids)
+    run_data = get_campaign_run(campaign_run_id)
+    return {
+        "success": True,
+        "campaign_id": campaign_id,
+        "campaign_run_id": campaign_run_id,
+        "status": run_data.get("status", "completed"),
+        "total_calls": run_data.get("total_calls", 0),
+        "processed_calls": len(run_data.get("results", [])),
+        "successful_calls": run_data.get("successful_calls", 0),
+        "failed_calls": run_data.get("failed_calls", 0),
+        "started_at": run_data.get("started_at"),
+        "completed_at": run_data.get("completed_at"),
+        "error": run_data.get("error")
+    }
+
+
+# How many 429s per call are retried without using up one of its attempts
+RATE_LIMIT_FREE_RETRIES = 5
+# How many times a CSV upload row is re-sent after a 429 before it is reported as failed
+CSV_RATE_LIMIT_RETRIES = 3
+# Campaign calls start at most this often, for international rate limit protection
+CAMPAIGN_CALL_INTERVAL = 120  # seconds
+
+
+class TokenBucket:
+    """Async rate limiter: acquire() waits for a token, refilled at `rate` tokens per second up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
-async def process_calls_with_retry_and_batching(call_requests, api_key, max_attempts, retry_interval_minutes, campaign_name, campaign_id, client_voice: Optional[str] = None):
-    """Process calls with index-based traversal and flag-based retry system"""
-    print(f"🚀 Starting index-based traversal with flag-based retry system for campaign '{campaign_name}'")
-    print(f"📊 Total contacts in sheet: {len(call_requests)} (Index 0 to {len(call_requests)-1})")
+
+async def process_calls_with_retry_and_batching(call_requests, api_key, max_attempts, retry_interval_minutes, campaign_name, campaign_id, client_voice: Optional[str] = None, on_call_initiated=None):
+    """Process calls with index-based traversal and flag-based retry system.
+    on_call_initiated, if given, is awaited with each CallResult as soon as its call is queued."""
+    logger.info("🚀 Starting index-based traversal with flag-based retry system for campaign '%s'", campaign_name)
+    logger.info("📊 Total contacts in sheet: %s (Index 0 to %s)", len(call_requests), len(call_requests) - 1)
 
     # Create call tracker with index-based traversal - ALL NUMBERS START WITH success=False
     call_tracker = []
@@ -1713,129 +2253,135 @@ async def process_calls_with_retry_and_batching(call_requests, api_key, max_atte
             'call_status': 'pending',  # Initialize with pending status
             'patient_name': call_request.patient_name,
             'phone_number': call_request.phone_number,
-            'processing_status': 'queued'  # queued -> processing -> completed/failed
+            'processing_status': 'queued',  # queued -> processing -> completed/failed
+            'retry_after': None,  # Set when the last attempt hit a 429
+            'rate_limit_retries': 0
         })
-        print(f"📋 [Index {sheet_index:03d}] Initialized {call_request.patient_name} ({call_request.phone_number}) - Flag: False (needs processing)")
+        logger.debug("📋 [Index %03d] Initialized %s (%s) - Flag: False (needs processing)",
+                     sheet_index, call_request.patient_name, call_request.phone_number)
 
-    print(f"📊 Sheet traversal setup complete: Index 0 → {len(call_requests)-1} with flag-based processing")
+    logger.debug("📊 Sheet traversal setup complete: Index 0 → %s with flag-based processing", len(call_requests) - 1)
 
     # Status tracking
-    status_counts = {
-        'confirmed': 0,
-        'cancelled': 0,
-        'rescheduled': 0,
-        'busy_voicemail': 0,
-        'not_available': 0,
-        'wrong_number': 0,
-        'unknown': 0,
-        'failed': 0
-    }
+    status_counts = EMPTY_STATUS_COUNTS.copy()
 
     # Semaphore for concurrency control
-    semaphore = asyncio.Semaphore(2)  # Reduced concurrency for international rate limits
+    semaphore = asyncio.Semaphore(MAX_CALL_CONCURRENCY)  # Reduced concurrency for international rate limits
+
+    # Calls with success=False that still have attempts left, in sheet order
+    pending_calls = deque(call for call in call_tracker if call['attempts'] < call['max_attempts'])
+    completed_statuses = {}
+    successful_calls = 0
+    total_calls = len(call_tracker)
+
+    # Paces call starts evenly; time spent on the previous call counts towards the wait
+    call_pacer = TokenBucket(rate=1 / CAMPAIGN_CALL_INTERVAL)
 
     attempt_round = 0
 
-    while True:
+    while pending_calls:
         attempt_round += 1
 
-        # Get all calls that need retry (success = False and haven't exceeded max attempts)
-        calls_to_retry = [
-            call for call in call_tracker
-            if not call['success'] and call['attempts'] < call['max_attempts']
-        ]
-
-        if not calls_to_retry:
-            print(f"🎯 Flag-based retry complete! No more calls need retry.")
-            break
+        # This round works through the current queue; failed calls are queued for the next round
+        round_calls = pending_calls
+        pending_calls = deque()
+        round_size = len(round_calls)
+        processed = 0
 
-        print(f"\n🔄 RETRY ROUND {attempt_round}: Processing {len(calls_to_retry)} calls with success=False")
+        logger.info("🔄 RETRY ROUND %s: Processing %s calls with success=False", attempt_round, round_size)
 
         # Process calls one by one for strict international rate limits
         batch_size = 1  # Process 1 call at a time for international numbers
 
-        # Sort calls by sheet index to maintain traversal order
-        calls_to_retry_sorted = sorted(calls_to_retry, key=lambda x: x['sheet_index'])
-
-        for i in range(0, len(calls_to_retry_sorted), batch_size):
-            batch = calls_to_retry_sorted[i:i + batch_size]
+        while round_calls:
+            batch = [round_calls.popleft() for _ in range(min(batch_size, len(round_calls)))]
             batch_start_idx = batch[0]['sheet_index']
             batch_end_idx = batch[-1]['sheet_index']
 
-            print(f"🔄 Processing call {i + 1} of {len(calls_to_retry_sorted)} (SEQUENTIAL)")
-            print(f"   📍 Sheet traversal: Index [{batch_start_idx:03d}] to [{batch_end_idx:03d}] (1 call at a time)")
+            await call_pacer.acquire()
+            logger.debug("🔄 Processing call %s of %s (SEQUENTIAL)", processed + 1, round_size)
+            logger.debug("   📍 Sheet traversal: Index [%03d] to [%03d] (1 call at a time)", batch_start_idx, batch_end_idx)
 
             # Mark calls as processing
             for call_data in batch:
                 call_data['processing_status'] = 'processing'
 
-            # Process calls sequentially instead of concurrently
-            for call_data in batch:
-                await process_single_call_with_flag_indexed(call_data, api_key, semaphore, campaign_id, client_voice)
+            # Calls in a batch share the semaphore; each one is marked as soon as it
+            # finishes instead of waiting for the slowest call in the batch
+            batch_calls = [
+                process_single_call_with_flag_indexed(call_data, api_key, semaphore, campaign_id, client_voice)
+                for call_data in batch
+            ]
+            for finished_call in asyncio.as_completed(batch_calls):
+                call_data = await finished_call
 
                 # Mark completed immediately after each call
                 if call_data['success']:
                     call_data['processing_status'] = 'completed'
+                    successful_calls += 1
+                    status = call_data['call_status']
+                    completed_statuses[status] = completed_statuses.get(status, 0) + 1
+                    if status in status_counts:
+                        status_counts[status] += 1
+                    if on_call_initiated:
+                        await on_call_initiated(call_data['final_result'])
                 else:
                     call_data['processing_status'] = 'retry_needed'
 
-            # Add a small delay to respect rate limits
-            if i + batch_size < len(calls_to_retry_sorted):
-                print(f"⏰ Waiting 120 seconds before next call for international rate limit protection...")
-                await asyncio.sleep(120)
-
-        # Update status counts after this round
-        for call_data in call_tracker:
-            if call_data['success'] and call_data['call_status']:
-                status = call_data['call_status']
-                if status in status_counts:
-                    # Only count once per successful call
-                    if status not in call_data.get('counted_statuses', set()):
-                        status_counts[status] += 1
-                        call_data.setdefault('counted_statuses', set()).add(status)
+            # Rate-limited calls go back to the front of this round once Retry-After has passed
+            rate_limited = [call_data for call_data in batch if call_data['retry_after'] is not None]
+            if rate_limited:
+                round_calls.extendleft(reversed(rate_limited))
+                retry_delay = max(call_data['retry_after'] for call_data in rate_limited) * random.uniform(1.0, 1.2)
+                logger.warning("⏳ Rate limited; retrying %s call(s) in %.0fs without using an attempt", len(rate_limited), retry_delay)
+
+            # Requeue failed calls in sheet order while they have attempts left
+            pending_calls.extend(
+                call_data for call_data in batch
+                if not call_data['success'] and call_data['retry_after'] is None
+                and call_data['attempts'] < call_data['max_attempts']
+            )
+            processed += len(batch) - len(rate_limited)
 
-        # Check completion status and show flag breakdown
-        successful_calls = sum(1 for call in call_tracker if call['success'])
-        total_calls = len(call_tracker)
-        flag_true_calls = [c for c in call_tracker if c['success']]
-        flag_false_calls = [c for c in call_tracker if not c['success']]
+            if rate_limited:
+                await asyncio.sleep(retry_delay)
 
-        print(f"📊 Round {attempt_round} complete: {successful_calls}/{total_calls} calls successful")
-        print(f"🏁 Flag=True (Completed): {len(flag_true_calls)} calls")
-        print(f"⏳ Flag=False (Need retry): {len(flag_false_calls)} calls")
+        # Show completion status and flag breakdown
+        logger.info("📊 Round %s complete: %s/%s calls successful", attempt_round, successful_calls, total_calls)
+        logger.info("🏁 Flag=True (Completed): %s calls", successful_calls)
+        logger.info("⏳ Flag=False (Need retry): %s calls", total_calls - successful_calls)
 
         # Show status breakdown for Flag=True calls
-        if flag_true_calls:
-            status_breakdown = {}
-            for call in flag_true_calls:
-                status = call.get('call_status', 'unknown')
-                status_breakdown[status] = status_breakdown.get(status, 0) + 1
-            print(f"   ✅ Completed statuses: {dict(status_breakdown)}")
+        if completed_statuses:
+            logger.info("   ✅ Completed statuses: %s", completed_statuses)
 
         # Show remaining retries
-        remaining_retries = [c for c in call_tracker if not c['success'] and c['attempts'] < c['max_attempts']]
-        print(f"🔄 Calls still needing retry: {len(remaining_retries)} calls")
+        logger.info("🔄 Calls still needing retry: %s calls", len(pending_calls))
 
         # If there are more calls to retry, wait for retry interval + 2 extra minutes for international protection
-        remaining_retries = [c for c in call_tracker if not c['success'] and c['attempts'] < c['max_attempts']]
-        if remaining_retries:
+        if pending_calls:
             extended_interval = retry_interval_minutes + 2  # Add 2 extra minutes for international rate limits
-            print(f"⏰ Waiting {extended_interval} minutes before next retry round (includes 2-min international protection)...")
+            logger.info("⏰ Waiting %s minutes before next retry round (includes 2-min international protection)...", extended_interval)
             await asyncio.sleep(extended_interval * 60)
 
+    logger.info("🎯 Flag-based retry complete! No more calls need retry.")
+
     # Handle calls that exhausted all attempts (send voicemail and change flag)
     exhausted_calls = [call for call in call_tracker if not call['success'] and call['attempts'] >= call['max_attempts']]
     if exhausted_calls:
-        print(f"📬 Processing {len(exhausted_calls)} calls that exhausted retry attempts...")
-        for call_data in exhausted_calls:
+        logger.info("📬 Processing %s calls that exhausted retry attempts...", len(exhausted_calls))
+        outcomes = await send_voicemails_bulk(
+            [call_data['call_request'] for call_data in exhausted_calls], api_key, client_voice)
+        for call_data, outcome in zip(exhausted_calls, outcomes):
             try:
-                await send_final_voicemail(call_data['call_request'], api_key, client_voice)
-                print(f"📬 Voicemail sent to {call_data['patient_name']}")
+                if isinstance(outcome, Exception):
+                    raise outcome
+                logger.info("📬 Voicemail sent to %s", call_data['patient_name'])
                 # Change flag to True - voicemail sent, no more processing needed
                 old_flag = call_data['success']
                 call_data['success'] = True
                 call_data['call_status'] = 'busy_voicemail'
-                print(f"🔄 FLAG CHANGED: {call_data['patient_name']} - Flag: {old_flag} → True (voicemail sent)")
+                logger.debug("🔄 FLAG CHANGED: %s - Flag: %s → True (voicemail sent)", call_data['patient_name'], old_flag)
                 call_data['final_result'] = CallResult(
                     success=True,
                     status='busy_voicemail',
@@ -1845,7 +2391,7 @@ async def process_calls_with_retry_and_batching(call_requests, api_key, max_atte
                 )
                 status_counts['busy_voicemail'] += 1
             except Exception as e:
-                print(f"❌ Failed to send voicemail to {call_data['patient_name']}: {str(e)}")
+                logger.error("❌ Failed to send voicemail to %s: %s", call_data['patient_name'], e)
                 # Even if voicemail fails, change flag to True - we've exhausted all attempts
                 old_flag = call_data['success']
                 call_data['success'] = True  # No more processing needed
@@ -1857,7 +2403,7 @@ async def process_calls_with_retry_and_batching(call_requests, api_key, max_atte
                     phone_number=call_data['phone_number']
                 )
                 status_counts['failed'] += 1
-                print(f"🔄 FLAG CHANGED: {call_data['patient_name']} - Flag: {old_flag} → True (max attempts reached)")
+                logger.debug("🔄 FLAG CHANGED: %s - Flag: %s → True (max attempts reached)", call_data['patient_name'], old_flag)
 
     # Generate final results
     final_results = []
@@ -1878,36 +2424,36 @@ async def process_calls_with_retry_and_batching(call_requests, api_key, max_atte
     completed_indexes = [c['sheet_index'] for c in call_tracker if c['success']]
     failed_indexes = [c['sheet_index'] for c in call_tracker if not c['success']]
 
-    print(f"\n🎯 Index-based traversal completed for '{campaign_name}'!")
-    print(f"   📊 Sheet Coverage: Index 0 → {len(call_tracker)-1} (Total: {len(call_tracker)} contacts)")
-    print(f"   ✅ Completed Indexes: {len(completed_indexes)} contacts")
-    print(f"   ❌ Failed Indexes: {len(failed_indexes)} contacts")
-    print(f"   📞 Total calls: {len(final_results)}")
-    print(f"   ✅ Confirmed: {status_counts['confirmed']}")
-    print(f"   ❌ Cancelled: {status_counts['cancelled']}")
-    print(f"   🔄 Rescheduled: {status_counts['rescheduled']}")
-    print(f"   📧 Busy/Voicemail: {status_counts['busy_voicemail']}")
-    print(f"   🚫 Not Available: {status_counts['not_available']}")
-    print(f"   📱 Wrong Number: {status_counts['wrong_number']}")
-    print(f"   ❓ Unknown: {status_counts['unknown']}")
-    print(f"   💥 Failed: {status_counts['failed']}")
+    logger.info("🎯 Index-based traversal completed for '%s'!", campaign_name)
+    logger.info("   📊 Sheet Coverage: Index 0 → %s (Total: %s contacts)", len(call_tracker) - 1, len(call_tracker))
+    logger.info("   ✅ Completed Indexes: %s contacts", len(completed_indexes))
+    logger.info("   ❌ Failed Indexes: %s contacts", len(failed_indexes))
+    logger.info("   📞 Total calls: %s", len(final_results))
+    logger.info("   ✅ Confirmed: %s | ❌ Cancelled: %s | 🔄 Rescheduled: %s | 📧 Busy/Voicemail: %s",
+                status_counts['confirmed'], status_counts['cancelled'], status_counts['rescheduled'],
+                status_counts['busy_voicemail'])
+    logger.info("   🚫 Not Available: %s | 📱 Wrong Number: %s | ❓ Unknown: %s | 💥 Failed: %s",
+                status_counts['not_available'], status_counts['wrong_number'], status_counts['unknown'],
+                status_counts['failed'])
 
     # Show index ranges for debugging
     if completed_indexes:
-        print(f"   📍 Completed range: {min(completed_indexes)} - {max(completed_indexes)}")
+        logger.debug("   📍 Completed range: %s - %s", min(completed_indexes), max(completed_indexes))
     if failed_indexes:
-        print(f"   📍 Failed range: {min(failed_indexes)} - {max(failed_indexes)}")
+        logger.debug("   📍 Failed range: %s - %s", min(failed_indexes), max(failed_indexes))
 
     return final_results
 
 
 async def process_single_call_with_flag_indexed(call_data, api_key, semaphore, campaign_id, client_voice: Optional[str] = None):
-    """Process a single call and update its flag based ONLY on successful initiation."""
+    """Process a single call and update its flag based ONLY on successful initiation. Returns the updated call_data."""
     call_request = call_data['call_request']
     call_data['attempts'] += 1
+    call_data['retry_after'] = None
     sheet_index = call_data['sheet_index']
 
-    print(f"📞 [Index {sheet_index:03d}] Attempt {call_data['attempts']}/{call_data['max_attempts']} for {call_data['patient_name']}")
+    logger.debug("📞 [Index %03d] Attempt %s/%s for %s",
+                 sheet_index, call_data['attempts'], call_data['max_attempts'], call_data['patient_name'])
 
     try:
         # Pass campaign_id and client_voice to the async call function
@@ -1919,11 +2465,16 @@ async def process_single_call_with_flag_indexed(call_data, api_key, semaphore, c
             call_data['success'] = True  # Flag TRUE means successfully initiated
             call_data['final_result'] = result
             result.call_status = 'initiated'  # Set initial status
-            print(f"✅ [Index {sheet_index:03d}] INITIATED: {call_data['patient_name']} - Call ID: {result.call_id}")
+            logger.info("✅ [Index %03d] INITIATED: %s - Call ID: %s", sheet_index, call_data['patient_name'], result.call_id)
         else:
             call_data['success'] = False  # Flag FALSE means it failed to initiate
             call_data['final_result'] = result
-            print(f"⏳ [Index {sheet_index:03d}] FAILED TO INITIATE: {call_data['patient_name']} - Error: {result.error}")
+            logger.warning("⏳ [Index %03d] FAILED TO INITIATE: %s - Error: %s", sheet_index, call_data['patient_name'], result.error)
+            # A 429 means the call was never tried, so give the attempt back (a few times at most)
+            if result.retry_after is not None and call_data['rate_limit_retries'] < RATE_LIMIT_FREE_RETRIES:
+                call_data['attempts'] -= 1
+                call_data['rate_limit_retries'] += 1
+                call_data['retry_after'] = result.retry_after
 
     except Exception as e:
         call_data['success'] = False
@@ -1931,10 +2482,11 @@ async def process_single_call_with_flag_indexed(call_data, api_key, semaphore, c
             success=False, error=str(e),
             patient_name=call_data['patient_name'], phone_number=call_data['phone_number']
         )
-        print(f"💥 [Index {sheet_index:03d}] EXCEPTION: {call_data['patient_name']} - {str(e)}")
+        logger.error("💥 [Index %03d] EXCEPTION: %s - %s", sheet_index, call_data['patient_name'], e)
 
     # Add a small delay to respect rate limits
     await asyncio.sleep(1)
+    return call_data
 
 # Keep the original function for backward compatibility (in case it's used elsewhere)
 async def process_calls_with_retry(call_requests, api_key, max_attempts, retry_interval_minutes, campaign_name, campaign_id):
@@ -1942,73 +2494,18 @@ async def process_calls_with_retry(call_requests, api_key, max_attempts, retry_i
     return await process_calls_with_retry_and_batching(call_requests, api_key, max_attempts, retry_interval_minutes, campaign_name, campaign_id)
 
 
-async def send_final_voicemail(call_request: CallRequest, api_key: str, client_voice: Optional[str] = None):
-    """Send final voicemail using the updated template after all retry attempts"""
-    try:
-        # Use client voice if provided, otherwise default to Paige
-        voice_name = client_voice or "Paige"
-        selected_voice = VOICE_MAP.get(voice_name, VOICE_MAP.get("Paige", "default_voice_id"))
-        print(f"🎤 Selected voice for voicemail: {voice_name} (ID: {selected_voice})")
+# Audio previews as data URLs, keyed by voice ID. The sample text never changes, so
+# each voice is only synthesized once per process (VOICE_MAP bounds the size).
+voice_preview_cache = {}
 
-        # Updated voicemail template as per your request
-        voicemail_template = f"""
-        Hi Good Morning, I am calling from Hillside Medical Group. This call is for {call_request.patient_name} to remind him/her of an upcoming appointment on {call_request.appointment_date} at {call_request.appointment_time} with {call_request.provider_name} at {call_request.office_location}. Please make sure to arrive 15 minutes prior to your appointment. Also, Please make sure to email us your insurance information ASAP so that we can get it verified and avoid any delays on the day of your appointment. If you wish to cancel or reschedule your appointment, please inform us at least 24 hours in advance to avoid cancellation charge of $25.00. For more information, you can call us back on 210-742-6555. Thank you and have a blessed day.
-        """
-
-        payload = {
-            "phone_number": call_request.phone_number,
-            "task": f"You are leaving a voicemail message. Speak clearly and deliver this message: {voicemail_template.strip()}",
-            "voice": selected_voice,
-            "request_data": {
-                "patient_name": call_request.patient_name,
-                "appointment_date": call_request.appointment_date,
-                "appointment_time": call_request.appointment_time,
-                "provider_name": call_request.provider_name,
-                "office_location": call_request.office_location
-            }
-        }
-
-        print(f"🔄 Sending final voicemail to {call_request.phone_number} for {call_request.patient_name}")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                    "https://api.bland.ai/v1/calls",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-            ) as response:
-                if response.status == 200:
-                    resp_json = await response.json()
-                    print(f"✅ Final voicemail sent successfully for {call_request.patient_name}")
-                    return {
-                        "success": True,
-                        "call_id": resp_json.get("call_id", "N/A"),
-                        "status": resp_json.get("status", "N/A"),
-                        "message": "Final voicemail sent successfully",
-                        "patient_name": call_request.patient_name,
-                        "phone_number": call_request.phone_number
-                    }
-                else:
-                    error_msg = f"API error (Status {response.status}): {await response.text()}"
-                    print(f"❌ Error sending final voicemail for {call_request.patient_name}: {error_msg}")
-                    return {
-                        "success": False,
-                        "error": error_msg,
-                        "patient_name": call_request.patient_name,
-                        "phone_number": call_request.phone_number
-                    }
-
-    except Exception as e:
-        print(f"💥 Exception during final voicemail sending: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e),
-            "patient_name": call_request.patient_name,
-            "phone_number": call_request.phone_number
-        }
+# The voice sample request body is the same for every voice, so it is serialized once
+VOICE_SAMPLE_BODY = orjson.dumps({
+    "text": "Hello! This is a voice sample from your AI assistant. I'm here to help with your calls and appointments.",
+    "voice_settings": {
+        "speaking_rate" : 0.10
+    },
+    "language": "en"
+})
 
 
 @app.get("/voice_preview/{voice_name}")
@@ -2024,93 +2521,85 @@ async def voice_preview(voice_name: str):
         if not voice_id:
             return {"success": False, "error": f"Voice '{voice_name}' not found"}
 
-        print(f"🎤 Generating voice sample for {voice_name} (ID: {voice_id})")
+        if voice_id in voice_preview_cache:
+            return {"success": True, "preview_url": voice_preview_cache[voice_id]}
+
+        logger.info("🎤 Generating voice sample for %s (ID: %s)", voice_name, voice_id)
 
         # Bland AI voice sample API endpoint
         url = f"https://api.bland.ai/v1/voices/{voice_id}/sample"
 
-        # Sample text for preview
-        sample_text = "Hello! This is a voice sample from your AI assistant. I'm here to help with your calls and appointments."
-
-        payload = {
-            "text": sample_text,
-            "voice_settings": {
-                "speaking_rate" : 0.10
+        session = app.state.http
+        async with session.post(
+            url,
+            headers={
+                "authorization": api_key,
+                "Content-Type": "application/json"
             },
-            "language": "en"
-        }
+            data=VOICE_SAMPLE_BODY,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+
+            if response.status == 200:
+                # Check content type to determine how to handle the response
+                content_type = response.headers.get('content-type', '').lower()
+
+                if 'audio' in content_type or 'wav' in content_type or 'mp3' in content_type:
+                    # Direct audio response - convert to base64 data URL
+                    audio_data = await response.read()
+
+                    # Determine MIME type
+                    if 'wav' in content_type:
+                        mime_type = 'audio/wav'
+                    elif 'mp3' in content_type:
+                        mime_type = 'audio/mpeg'
+                    else:
+                        mime_type = 'audio/wav'  # Default to wav
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                headers={
-                    "authorization": api_key,
-                    "Content-Type": "application/json"
-                },
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
+                    # Create data URL
+                    audio_base64 = base64.b64encode(audio_data).decode('ascii')
+                    audio_url = f"data:{mime_type};base64,{audio_base64}"
+                    voice_preview_cache[voice_id] = audio_url
 
-                if response.status == 200:
-                    # Check content type to determine how to handle the response
-                    content_type = response.headers.get('content-type', '').lower()
-
-                    if 'audio' in content_type or 'wav' in content_type or 'mp3' in content_type:
-                        # Direct audio response - convert to base64 data URL
-                        audio_data = await response.read()
-                        import base64
-
-                        # Determine MIME type
-                        if 'wav' in content_type:
-                            mime_type = 'audio/wav'
-                        elif 'mp3' in content_type:
-                            mime_type = 'audio/mpeg'
+                    logger.info("✅ Voice sample audio generated for %s (%s bytes)", voice_name, len(audio_data))
+                    return {"success": True, "preview_url": audio_url}
+                else:
+                    # JSON response with URL
+                    try:
+                        response_data = orjson.loads(await response.read())
+
+                        # Bland AI might return different response formats, handle accordingly
+                        if 'audio_url' in response_data:
+                            audio_url = response_data['audio_url']
+                        elif 'url' in response_data:
+                            audio_url = response_data['url']
+                        elif 'sample_url' in response_data:
+                            audio_url = response_data['sample_url']
                         else:
-                            mime_type = 'audio/wav'  # Default to wav
-
-                        # Create data URL
-                        audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                        audio_url = f"data:{mime_type};base64,{audio_base64}"
+                            logger.info("✅ Voice sample generated for %s", voice_name)
+                            return {"success": True, "audio_data": response_data}
 
-                        print(f"✅ Voice sample audio generated for {voice_name} ({len(audio_data)} bytes)")
+                        logger.info("✅ Voice sample URL generated for %s: %s", voice_name, audio_url)
                         return {"success": True, "preview_url": audio_url}
-                    else:
-                        # JSON response with URL
-                        try:
-                            response_data = await response.json()
-
-                            # Bland AI might return different response formats, handle accordingly
-                            if 'audio_url' in response_data:
-                                audio_url = response_data['audio_url']
-                            elif 'url' in response_data:
-                                audio_url = response_data['url']
-                            elif 'sample_url' in response_data:
-                                audio_url = response_data['sample_url']
-                            else:
-                                print(f"✅ Voice sample generated for {voice_name}")
-                                return {"success": True, "audio_data": response_data}
-
-                            print(f"✅ Voice sample URL generated for {voice_name}: {audio_url}")
-                            return {"success": True, "preview_url": audio_url}
-                        except Exception as json_error:
-                            print(f"❌ Failed to parse JSON response: {json_error}")
-                            return {"success": False, "error": "Invalid response format from voice API"}
-
-                elif response.status == 404:
-                    return {"success": False, "error": f"Voice ID '{voice_id}' not found in Bland AI"}
-                elif response.status == 401:
-                    return {"success": False, "error": "Invalid API key"}
-                elif response.status == 429:
-                    return {"success": False, "error": "Rate limit exceeded. Please try again later."}
-                else:
-                    error_text = await response.text()
-                    print(f"❌ Bland AI voice sample error: Status {response.status}, Response: {error_text}")
-                    return {"success": False, "error": f"API error: {error_text}"}
+                    except Exception as json_error:
+                        logger.error("❌ Failed to parse JSON response: %s", json_error)
+                        return {"success": False, "error": "Invalid response format from voice API"}
+
+            elif response.status == 404:
+                return {"success": False, "error": f"Voice ID '{voice_id}' not found in Bland AI"}
+            elif response.status == 401:
+                return {"success": False, "error": "Invalid API key"}
+            elif response.status == 429:
+                return {"success": False, "error": "Rate limit exceeded. Please try again later."}
+            else:
+                error_text = await response.text()
+                logger.error("❌ Bland AI voice sample error: Status %s, Response: %s", response.status, error_text)
+                return {"success": False, "error": f"API error: {error_text}"}
 
     except asyncio.TimeoutError:
         return {"success": False, "error": "Request timeout. Please try again."}
     except Exception as e:
-        print(f"💥 Exception generating voice sample: {str(e)}")
+        logger.error("💥 Exception generating voice sample: %s", e)
         return {"success": False, "error": f"Error generating voice sample: {str(e)}"}
 
 
@@ -2211,6 +2700,22 @@ async def upload_clinic_data(
         }
 
 
+@app.post("/admin/reload_key")
+async def reload_api_key(request: Request):
+    """Admin endpoint to re-read BLAND_API_KEY after rotating it in Secrets"""
+    user = require_admin(request)
+
+    get_api_key.cache_clear()
+    get_bland_headers.cache_clear()
+    api_key_loaded = get_api_key() is not None
+    logger.info("🔑 API key reloaded by %s: %s", user['username'], 'found' if api_key_loaded else 'missing')
+
+    return {
+        "success": api_key_loaded,
+        "message": "API key reloaded" if api_key_loaded else "BLAND_API_KEY not found in Secrets."
+    }
+
+
 @app.post("/process_csv")
 async def process_csv(file: UploadFile = File(...),
                       country_code: str = Form("+1")):
@@ -2229,65 +2734,78 @@ async def process_csv(file: UploadFile = File(...),
                             detail="Please upload a CSV or XLSX file.")
 
     try:
-        # Read file content based on format
-        content = await file.read()
+        # Prepare call requests with validation
+        validation_failures = []
+        call_requests = []
 
         if file.filename.endswith('.xlsx'):
-            # Read Excel file
-            df = pd.read_excel(io.BytesIO(content))
-            rows = df.to_dict('records')
+            # Read Excel file as strings and validate required fields column-wise
+            df = read_excel_upload(await file.read())
+            total_rows = len(df)
+            logger.info("📋 Validating ALL %s rows from CSV/Excel file", total_rows)
+
+            blank_fields = find_blank_required_fields(df, ('', 'nan', 'null'))
+            missing_mask = blank_fields.any(axis=1)
+
+            for row_index, row, blank_row in zip(df.index[missing_mask],
+                                                 df.loc[missing_mask].to_dict('records'),
+                                                 blank_fields.loc[missing_mask].itertuples(index=False)):
+                actual_row_number = row_index + 1  # 1-based numbering for user display
+                missing_fields = [field for field, is_blank in zip(REQUIRED_FIELDS, blank_row) if is_blank]
+                validation_failures.append(CallResult(
+                    success=False,
+                    error=f"Row {actual_row_number}: Missing required fields: {', '.join(missing_fields)}",
+                    patient_name=str(row.get('patient_name', f'Row{actual_row_number}')),
+                    phone_number=str(row.get('phone_number', 'Unknown'))
+                ))
+                logger.info("❌ Row %s FAILED validation: %s", actual_row_number, missing_fields)
+
+            # Only the valid subset is converted to dicts
+            valid_df = df.loc[~missing_mask]
+            indexed_rows = zip(valid_df.index, valid_df.to_dict('records'))
+            rows_validated = True
         else:
             # Read CSV file
-            csv_string = content.decode('utf-8')
-            csv_reader = csv.DictReader(io.StringIO(csv_string))
-            rows = list(csv_reader)
+            # Decode straight from the spooled upload and validate rows as they are read, so the
+            # file is never held in memory as a whole; utf-8-sig drops the BOM Excel puts on
+            # exported CSVs, which would otherwise mangle the first header
+            await file.seek(0)
+            csv_stream = io.TextIOWrapper(file.file, encoding='utf-8-sig', newline='')
+            logger.info("📋 Validating ALL rows from CSV file")
+            indexed_rows = enumerate(csv.DictReader(csv_stream))
+            rows_validated = False
 
         results = []
-        row_count = 0
-
-        # Prepare call requests with validation
-        validation_failures = []
-        call_requests = []
 
-        print(f"📋 Validating ALL {len(rows)} rows from CSV/Excel file")
-
-        for row_index, row in enumerate(rows):
+        for row_index, row in indexed_rows:
             actual_row_number = row_index + 1  # 1-based numbering for user display
 
-            # Validate required fields
-            required_fields = ['phone_number', 'patient_name', 'date', 'time', 'provider_name', 'office_location']
-            missing_fields = []
-
-            for field in required_fields:
-                field_value = row.get(field)
-                if field_value is None or str(field_value).strip() == '' or str(field_value).strip().lower() in ['nan', 'null']:
-                    missing_fields.append(field)
+            # Validate required fields (Excel rows were validated above)
+            if not rows_validated:
+                # csv.DictReader values are str (or None for short rows)
+                missing_fields = [
+                    field for field in REQUIRED_FIELDS
+                    if (row.get(field) or '').strip().lower() in ('', 'nan', 'null')
+                ]
 
-            if missing_fields:
-                # Create validation failure result
-                validation_result = CallResult(
-                    success=False,
-                    error=f"Row {actual_row_number}: Missing required fields: {', '.join(missing_fields)}",
-                    patient_name=str(row.get('patient_name', f'Row{actual_row_number}')),
-                    phone_number=str(row.get('phone_number', 'Unknown'))
-                )
-                validation_failures.append(validation_result)
-                print(f"❌ Row {actual_row_number} FAILED validation: {missing_fields}")
-                continue
+                if missing_fields:
+                    # Create validation failure result
+                    validation_result = CallResult(
+                        success=False,
+                        error=f"Row {actual_row_number}: Missing required fields: {', '.join(missing_fields)}",
+                        patient_name=str(row.get('patient_name', f'Row{actual_row_number}')),
+                        phone_number=str(row.get('phone_number', 'Unknown'))
+                    )
+                    validation_failures.append(validation_result)
+                    logger.info("❌ Row %s FAILED validation: %s", actual_row_number, missing_fields)
+                    continue
 
             # Valid row - prepare for calling
-            phone_number_raw = row.get('phone_number', '')
-            phone_number_str = str(phone_number_raw).strip()
+            phone_number_str = safe_str(row.get('phone_number'))
             safe_country_code = country_code or '+1'
             formatted_phone = format_phone_number(phone_number_str, safe_country_code)
 
-            # Create call request
-            def safe_str(value):
-                if value is None:
-                    return ''
-                value_str = str(value).strip()
-                return value_str if value_str.lower() not in ['nan', 'null'] else ''
-
+            # Create call request (validation already rejected 'nan'/'null' placeholders)
             # Use office_location from CSV as foreign key to lookup full address
             office_location_key = safe_str(row.get('office_location', ''))
             full_address = clinic_manager.find_clinic_address(office_location_key)
@@ -2295,11 +2813,11 @@ async def process_csv(file: UploadFile = File(...),
             if full_address:
                 # Found mapping - use full address from clinic locations CSV
                 office_location = full_address
-                print(f"📍 CSV Foreign Key Mapping: '{office_location_key}' -> '{office_location}'")
+                logger.debug("📍 CSV Foreign Key Mapping: '%s' -> '%s'", office_location_key, office_location)
             else:
                 # No mapping found - use original value and log warning
                 office_location = office_location_key
-                print(f"⚠️ CSV Foreign Key NOT FOUND: '{office_location_key}' - using as-is (consider adding to clinic locations)")
+                logger.warning("⚠️ CSV Foreign Key NOT FOUND: '%s' - using as-is (consider adding to clinic locations)", office_location_key)
 
             call_request = CallRequest(
                 phone_number=formatted_phone,
@@ -2313,9 +2831,11 @@ async def process_csv(file: UploadFile = File(...),
             call_request.office_location_key = office_location_key
 
             call_requests.append(call_request)
-            print(f"✅ Row {actual_row_number} VALID - {call_request.patient_name} at {formatted_phone}")
+            logger.debug("✅ Row %s VALID - %s at %s", actual_row_number, call_request.patient_name, formatted_phone)
 
-        print(f"📊 Validation complete: {len(validation_failures)} failures, {len(call_requests)} valid calls")
+        # Every row ends up either failing validation or becoming a call request
+        total_rows = len(validation_failures) + len(call_requests)
+        logger.info("📊 Validation complete: %s failures, %s valid calls", len(validation_failures), len(call_requests))
 
         # Initialize session ID for CSV upload
         csv_session_id = f"csv_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -2323,43 +2843,72 @@ async def process_csv(file: UploadFile = File(...),
         # Process valid calls using flag-based retry system (simplified for CSV)
         call_results = []
         if call_requests:
-            print(f"📞 Processing {len(call_requests)} calls using flag-based system...")
+            logger.info("📞 Processing %s calls using flag-based system...", len(call_requests))
 
             # For CSV uploads, we'll do a single attempt per call (no retry)
-            semaphore = asyncio.Semaphore(2)  # Reduced concurrency for international rate limits
+            semaphore = asyncio.Semaphore(MAX_CALL_CONCURRENCY)  # Reduced concurrency for international rate limits
 
-            for call_request in call_requests:
-                try:
+            async def dispatch_csv_call(position, call_request):
+                # Start calls 3 seconds apart to prevent international rate limiting,
+                # without also waiting for each call's API round trip before the next
+                await asyncio.sleep(position * 3)
+                for retry in range(CSV_RATE_LIMIT_RETRIES + 1):
                     # No client_voice is passed here as CSV uploads are not client-specific in this context
                     result = await make_single_call_async(call_request, api_key, semaphore, csv_session_id)
-                    call_results.append(result)
-
-                    print(f"📞 Call to {call_request.patient_name}: {'SUCCESS' if result.success else 'FAILED'}")
-                    if not result.success:
-                        print(f"   Error: {result.error}")
-
-                    # Increased delay to prevent international rate limiting
-                    await asyncio.sleep(3)
-
-                except Exception as e:
-                    error_result = CallResult(
+                    if result.retry_after is None or retry == CSV_RATE_LIMIT_RETRIES:
+                        return result
+                    # Jitter keeps rows that were throttled together from retrying in lockstep
+                    retry_delay = result.retry_after * random.uniform(1.0, 1.2)
+                    logger.warning("⏳ Rate limited calling %s; retrying in %.0fs", call_request.patient_name, retry_delay)
+                    await asyncio.sleep(retry_delay)
+
+            # Rows repeated in an export (same patient, number and appointment) share one Bland call
+            call_positions = {}
+            unique_requests = []
+            row_positions = []
+            for call_request in call_requests:
+                key = (call_request.phone_number, call_request.patient_name, call_request.appointment_date,
+                       call_request.appointment_time, call_request.provider_name, call_request.office_location)
+                if key not in call_positions:
+                    call_positions[key] = len(unique_requests)
+                    unique_requests.append(call_request)
+                row_positions.append(call_positions[key])
+            if len(unique_requests) < len(call_requests):
+                logger.info("📞 %s duplicate rows will reuse the result of an identical call",
+                            len(call_requests) - len(unique_requests))
+
+            unique_outcomes = await asyncio.gather(
+                *(dispatch_csv_call(position, call_request) for position, call_request in enumerate(unique_requests)),
+                return_exceptions=True)
+            outcomes = [unique_outcomes[position] for position in row_positions]
+
+            for call_request, result in zip(call_requests, outcomes):
+                if isinstance(result, Exception):
+                    result = CallResult(
                         success=False,
-                        error=str(e),
+                        error=str(result),
                         patient_name=call_request.patient_name,
                         phone_number=call_request.phone_number
                     )
-                    call_results.append(error_result)
-                    print(f"❌ Exception calling {call_request.patient_name}: {str(e)}")
+                    logger.error("❌ Exception calling %s: %s", call_request.patient_name, result.error)
+                else:
+                    if result.success:
+                        logger.debug("📞 Call to %s: SUCCESS", call_request.patient_name)
+                    else:
+                        logger.warning("📞 Call to %s: FAILED - %s", call_request.patient_name, result.error)
+                call_results.append(result)
 
         # Combine all results
         results = validation_failures + call_results
 
-        print(f"\n📊 FINAL CSV PROCESSING SUMMARY:")
-        print(f"   Total rows processed: {len(rows)}")
-        print(f"   Validation failures: {len(validation_failures)}")
-        print(f"   Valid calls processed: {len(call_requests)}")
-        print(f"   Total results: {len(results)}")
-        print(f"   ✅ All rows accounted for: {len(rows) == len(results)}")
+        logger.info("📊 FINAL CSV PROCESSING SUMMARY: %s rows processed, %s validation failures, "
+                    "%s valid calls processed, %s total results (all rows accounted for: %s)",
+                    total_rows, len(validation_failures), len(call_requests), len(results),
+                    total_rows == len(results))
+
+        # Dump results once - the same list is stored and returned
+        results_payload = [model_to_dict(result) for result in results]
+        successful_calls = sum(1 for r in results if r.success)
 
         # Store results in a format similar to campaigns so dashboard can display them
         csv_results = {
@@ -2367,25 +2916,25 @@ async def process_csv(file: UploadFile = File(...),
             "campaign_name": f"CSV Upload - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
             "client_name": "Direct Upload",
             "total_calls": len(results),
-            "successful_calls": sum(1 for r in results if r.success),
-            "failed_calls": len(results) - sum(1 for r in results if r.success),
+            "successful_calls": successful_calls,
+            "failed_calls": len(results) - successful_calls,
             "started_at": datetime.now().isoformat(),
-            "results": [result.dict() for result in results]
+            "results": results_payload
         }
 
         # Store in the global results database so dashboard can show these calls
-        campaign_results_db[csv_session_id] = csv_results
-        save_campaign_results_db(campaign_results_db)
-        print(f"✅ Stored CSV upload results with ID {csv_session_id}. Total stored campaigns: {len(campaign_results_db)}")
+        store_campaign_run(csv_session_id, csv_results)
+        await save_campaign_results_db_async(campaign_results_db)
+        logger.info("✅ Stored CSV upload results with ID %s. Total stored campaigns: %s", csv_session_id, len(campaign_results_db))
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "total_calls": len(results),
-            "successful_calls": sum(1 for r in results if r.success),
-            "failed_calls": len(results) - sum(1 for r in results if r.success),
-            "results": [result.dict() for result in results],
+            "successful_calls": successful_calls,
+            "failed_calls": len(results) - successful_calls,
+            "results": results_payload,
             "session_id": csv_session_id
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500,
@@ -2522,12 +3071,17 @@ def extract_final_summary(transcript: str) -> str:
         return "Call completed - no clear summary available"
 
 
+# Transcript outcomes that override whatever the Bland summary says
+DEFINITIVE_TRANSCRIPT_STATUSES = frozenset({'cancelled', 'rescheduled', 'wrong_number', 'not_available'})
+EMPTY_SUMMARY_VALUES = frozenset({'unknown status', 'unknown', 'null', 'none'})
+
+
 def analyze_call_status_from_summary(final_summary: str, transcript: str = "") -> tuple[str, str]:
     """
     Determine call status based on final summary content primarily, with transcript as fallback.
     Returns a tuple: (call_status, standardized_summary)
     """
-    if not final_summary or final_summary.strip() == "" or final_summary.strip().lower() in ['unknown status', 'unknown', 'null', 'none']:
+    if not final_summary or final_summary.strip() == "" or final_summary.strip().lower() in EMPTY_SUMMARY_VALUES:
         # Fallback to transcript analysis if no summary or unknown status
         if transcript and transcript.strip():
             return analyze_call_transcript(transcript), "Analysis based on transcript"
@@ -2541,8 +3095,8 @@ def analyze_call_status_from_summary(final_summary: str, transcript: str = "") -
         transcript_summary = get_standardized_summary_for_status(transcript_status)
         
         # If transcript analysis gives a definitive result, use it instead of summary
-        if transcript_status in ['cancelled', 'rescheduled', 'wrong_number', 'not_available']:
-            print(f"🔍 Transcript analysis overriding summary: {transcript_status} (was {summary_lower[:50]}...)")
+        if transcript_status in DEFINITIVE_TRANSCRIPT_STATUSES:
+            logger.debug("🔍 Transcript analysis overriding summary: %s (was %s...)", transcript_status, summary_lower[:50])
             return transcript_status, transcript_summary
         
         # For confirmations, double-check with transcript patterns
@@ -2685,6 +3239,207 @@ def get_standardized_summary_for_status(status: str) -> str:
         return "Unknown status"
 
 
+# Phrase lists used by analyze_call_transcript, compiled once at import into a
+# single alternation per category so each category is one scan of the transcript
+CANCELLATION_PATTERNS = (
+    "user: no, no, i won't be able to make it",
+    "user: i'd like to cancel it",
+    "user: i want to cancel",
+    "user: cancel",
+    "user: cancel it",
+    "user: cancel this",
+    "user: cancel the appointment",
+    "user: cancel my appointment",
+    "user: want to cancel",
+    "user: need to cancel",
+    "user: have to cancel",
+    "user: can't make it",
+    "user: cannot make it",
+    "user: won't make it",
+    "user: will not make it",
+    "user: unable to make it"
+)
+
+RESCHEDULE_PATTERNS = (
+    "user: i want to reschedule",
+    "user: reschedule",
+    "user: can we reschedule",
+    "user: let's reschedule",
+    "user: different time",
+    "user: better time",
+    "user: new time",
+    "user: change the time",
+    "user: move the appointment"
+)
+
+IDENTITY_DENIAL_PATTERNS = (
+    "user: but i'm not",
+    "user: i'm not",
+    "user: that's not me",
+    "user: this isn't me",
+    "user: i am not",
+    "user: that is not me",
+    "user: this is not me"
+)
+
+WRONG_NUMBER_PATTERNS = (
+    "wrong number", "you have the wrong number", "this is the wrong number",
+    "no one by that name", "nobody by that name", "don't know", "never heard of",
+    "no such person", "no one here by that name", "nobody here by that name",
+    "you must have the wrong", "there's no", "nobody named",
+    "no one named", "i think you have the wrong",
+    "who is this", "who are you looking for"
+)
+
+NOT_AVAILABLE_PATTERNS = (
+    "user: she's not available",
+    "user: he's not available",
+    "not available", "she's not available", "he's not available",
+    "not here right now", "isn't here", "is not here",
+    "not home", "isn't home", "is not home", "out right now",
+    "can't come to the phone", "cannot come to the phone", "busy right now",
+    "in a meeting", "at work", "not in", "stepped out", "away from",
+    "will be back", "call back later", "try calling later", "not around",
+    "unavailable", "sleeping", "napping", "can you call back",
+    "not a good time", "isn't a good time", "bad time"
+)
+
+INTERRUPTED_PATTERNS = (
+    "thank you, bye", "bye bye", "goodbye", "gotta go", "have to go",
+    "talk to you later", "see you later", "catch you later", "yes, sir. bye",
+    "thank you bye", "thanks bye", "bye", "ok bye", "okay bye"
+)
+
+AI_CONFIRMING_PHRASES = (
+    'confirm your upcoming appointment', 'reason for my call is to confirm',
+    'upcoming appointment on', 'will you be able to make it',
+    'perfect! the reason for my call', 'the reason for my call is to'
+)
+
+POSITIVE_CONFIRMATIONS = (
+    "yes", "sure", "okay", "ok", "that works", "sounds good",
+    "i'll be there", "i will be there", "see you then", "confirmed",
+    "that's fine", "yes that works", "yes sounds good"
+)
+
+NEGATIVE_RESPONSES = (
+    "no", "can't", "won't", "unable", "cancel", "reschedule",
+    "different time", "better time", "not available"
+)
+
+AMBIGUOUS_INDICATORS = (
+    "i'm not sure", "not sure", "maybe", "perhaps", "i don't know", "don't know",
+    "let me think", "let me check", "i'll have to", "i need to check",
+    "uncertain", "unclear", "confused", "i don't understand",
+    "possibly", "might be", "could be", "depends", "we'll see"
+)
+
+VOICEMAIL_INDICATORS = (
+    "voicemail", "voice mail", "leave a message", "after the beep", "beep",
+    "mailbox", "voice message", "recording", "automated", "please leave",
+    "can't come to the phone", "not available", "busy", "no answer",
+    "disconnected", "line busy", "dial tone", "no response"
+)
+
+INTERACTION_INDICATORS = (
+    "hello", "hi", "hey", "good morning", "good afternoon", "good evening",
+    "speaking", "this is", "who is", "what", "when", "where", "how",
+    "thank you", "thanks", "sorry", "excuse me", "pardon"
+)
+
+APPOINTMENT_CONFIRMATION_PHRASES = (
+    "i'll be there", "i will be there", "see you then", "confirmed",
+    "that works", "sounds good", "i can make it"
+)
+
+POSITIVE_WORDS = ("yes", "sure", "fine", "good", "great", "perfect")
+NEGATIVE_WORDS = ("no", "can't", "won't", "unable", "busy", "sorry", "problem")
+
+
+def compile_phrase_pattern(phrases, whole_words=False):
+    """Compile phrases into one alternation; whole_words stops 'yes' matching inside 'yesterday'"""
+    alternation = '|'.join(re.escape(phrase) for phrase in phrases)
+    if whole_words:
+        alternation = rf"\b(?:{alternation})\b"
+    return re.compile(alternation)
+
+
+INTERRUPTED_RE = compile_phrase_pattern(INTERRUPTED_PATTERNS)
+AI_CONFIRMING_RE = compile_phrase_pattern(AI_CONFIRMING_PHRASES)
+POSITIVE_CONFIRMATION_RE = compile_phrase_pattern(POSITIVE_CONFIRMATIONS, whole_words=True)
+NEGATIVE_RESPONSE_RE = compile_phrase_pattern(NEGATIVE_RESPONSES)
+
+# Categories that analyze_call_transcript checks against the whole transcript
+TRANSCRIPT_CATEGORY_PHRASES = {
+    'cancelled': CANCELLATION_PATTERNS + ("i will cancel this appointment for you",),
+    'rescheduled': RESCHEDULE_PATTERNS + ("our scheduling agent will call you shortly",),
+    'wrong_number': IDENTITY_DENIAL_PATTERNS + WRONG_NUMBER_PATTERNS,
+    'not_available': NOT_AVAILABLE_PATTERNS,
+    'ambiguous': AMBIGUOUS_INDICATORS,
+    'voicemail': VOICEMAIL_INDICATORS,
+    'interaction': INTERACTION_INDICATORS,
+    'appointment_confirmation': APPOINTMENT_CONFIRMATION_PHRASES,
+    # Guards for the positive-confirmation check, folded into the same scan
+    'ai_cancel_notice': ("i will cancel this appointment",),
+    'mentions_reschedule': ("reschedule",),
+    'ai_reschedule_notice': ("scheduling agent will call",),
+}
+
+# Sentiment words get one category each, so the same scan yields how many distinct ones appear
+POSITIVE_WORD_CATEGORIES = frozenset(f"positive:{word}" for word in POSITIVE_WORDS)
+NEGATIVE_WORD_CATEGORIES = frozenset(f"negative:{word}" for word in NEGATIVE_WORDS)
+TRANSCRIPT_CATEGORY_PHRASES.update({f"positive:{word}": (word,) for word in POSITIVE_WORDS})
+TRANSCRIPT_CATEGORY_PHRASES.update({f"negative:{word}": (word,) for word in NEGATIVE_WORDS})
+
+# Whole-transcript categories that decide the status outright, highest priority first
+# (category names double as the resulting status)
+TRANSCRIPT_PRIORITY_STATUSES = ('cancelled', 'rescheduled', 'wrong_number', 'not_available')
+
+TRANSCRIPT_CATEGORY_RES = {
+    category: compile_phrase_pattern(phrases)
+    for category, phrases in TRANSCRIPT_CATEGORY_PHRASES.items()
+}
+
+
+def build_transcript_automaton():
+    """Build one Aho-Corasick automaton over every category phrase (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+
+    # A phrase can belong to several categories (e.g. "not available")
+    phrase_categories = {}
+    for category, phrases in TRANSCRIPT_CATEGORY_PHRASES.items():
+        for phrase in phrases:
+            phrase_categories.setdefault(phrase, set()).add(category)
+
+    automaton = ahocorasick.Automaton()
+    for phrase, categories in phrase_categories.items():
+        automaton.add_word(phrase, tuple(categories))
+    automaton.make_automaton()
+    return automaton
+
+
+TRANSCRIPT_AUTOMATON = build_transcript_automaton()
+
+
+def scan_transcript_categories(transcript_lower: str) -> set:
+    """Return the TRANSCRIPT_CATEGORY_PHRASES categories found in a lowercased transcript"""
+    if TRANSCRIPT_AUTOMATON is None:
+        return {
+            category for category, pattern in TRANSCRIPT_CATEGORY_RES.items()
+            if pattern.search(transcript_lower)
+        }
+
+    found = set()
+    for _, categories in TRANSCRIPT_AUTOMATON.iter(transcript_lower):
+        found.update(categories)
+        if 'cancelled' in found:
+            break  # Highest priority - nothing later can change the outcome
+    return found
+
+
+# Identical transcripts (e.g. the same voicemail greeting on every retry) are analyzed once
+@lru_cache(maxsize=4096)
 def analyze_call_transcript(transcript: str) -> str:
     """
     Analyze transcript to determine final call status based on patient's ultimate decision.
@@ -2695,117 +3450,17 @@ def analyze_call_transcript(transcript: str) -> str:
 
     transcript_lower = transcript.lower().strip()
 
-    # PRIORITY 1: Check for explicit patient cancellation requests first
-    cancellation_patterns = [
-        "user: no, no, i won't be able to make it",
-        "user: i'd like to cancel it",
-        "user: i want to cancel",
-        "user: cancel",
-        "user: cancel it",
-        "user: cancel this",
-        "user: cancel the appointment",
-        "user: cancel my appointment",
-        "user: want to cancel",
-        "user: need to cancel",
-        "user: have to cancel",
-        "user: can't make it",
-        "user: cannot make it",
-        "user: won't make it",
-        "user: will not make it",
-        "user: unable to make it"
-    ]
-    
-    for pattern in cancellation_patterns:
-        if pattern in transcript_lower:
-            print(f"🔍 Found cancellation pattern: {pattern}")
-            return 'cancelled'
-    
-    # Also check for AI confirmation of cancellation
-    if "i will cancel this appointment for you" in transcript_lower:
-        print(f"🔍 Found AI cancellation confirmation")
-        return 'cancelled'
-
-    # PRIORITY 2: Check for explicit reschedule requests
-    reschedule_patterns = [
-        "user: i want to reschedule",
-        "user: reschedule",
-        "user: can we reschedule", 
-        "user: let's reschedule",
-        "user: different time",
-        "user: better time",
-        "user: new time",
-        "user: change the time",
-        "user: move the appointment"
-    ]
-    
-    for pattern in reschedule_patterns:
-        if pattern in transcript_lower:
-            print(f"🔍 Found reschedule pattern: {pattern}")
-            return 'rescheduled'
-    
-    # Also check for AI confirmation of rescheduling
-    if "our scheduling agent will call you shortly" in transcript_lower:
-        print(f"🔍 Found AI reschedule confirmation")
-        return 'rescheduled'
-
-    # PRIORITY 3: Check for wrong number scenarios
-    # Look for explicit denials of identity
-    identity_denial_patterns = [
-        "user: but i'm not",
-        "user: i'm not",
-        "user: that's not me",
-        "user: this isn't me",
-        "user: i am not",
-        "user: that is not me",
-        "user: this is not me"
-    ]
-    
-    for pattern in identity_denial_patterns:
-        if pattern in transcript_lower:
-            print(f"🔍 Found identity denial pattern: {pattern}")
-            return 'wrong_number'
-
-    # Check for other wrong number indicators
-    wrong_number_patterns = [
-        "wrong number", "you have the wrong number", "this is the wrong number",
-        "no one by that name", "nobody by that name", "don't know", "never heard of",
-        "no such person", "no one here by that name", "nobody here by that name",
-        "you must have the wrong", "there's no", "nobody named",
-        "no one named", "you must have the wrong", "i think you have the wrong",
-        "who is this", "who are you looking for"
-    ]
-
-    for pattern in wrong_number_patterns:
-        if pattern in transcript_lower:
-            print(f"🔍 Found wrong number pattern: {pattern}")
-            return 'wrong_number'
-
-    # PRIORITY 4: Check for "not available" scenarios
-    not_available_patterns = [
-        "user: she's not available",
-        "user: he's not available", 
-        "not available", "she's not available", "he's not available",
-        "not here right now", "isn't here", "is not here", 
-        "not home", "isn't home", "is not home", "out right now",
-        "can't come to the phone", "cannot come to the phone", "busy right now",
-        "in a meeting", "at work", "not in", "stepped out", "away from",
-        "will be back", "call back later", "try calling later", "not around",
-        "unavailable", "sleeping", "napping", "can you call back",
-        "not a good time", "isn't a good time", "bad time"
-    ]
+    # Scan the transcript once for every whole-transcript category
+    found = scan_transcript_categories(transcript_lower)
 
-    for pattern in not_available_patterns:
-        if pattern in transcript_lower:
-            print(f"🔍 Found not available pattern: {pattern}")
-            return 'not_available'
+    # PRIORITIES 1-4: Explicit cancellation or AI cancellation confirmation, explicit
+    # reschedule or AI reschedule confirmation, wrong number / identity denial, not available
+    for status in TRANSCRIPT_PRIORITY_STATUSES:
+        if status in found:
+            logger.debug("🔍 Found %s pattern", status)
+            return status
 
     # PRIORITY 5: Check for interrupted/incomplete conversations
-    interrupted_patterns = [
-        "thank you, bye", "bye bye", "goodbye", "gotta go", "have to go",
-        "talk to you later", "see you later", "catch you later", "yes, sir. bye",
-        "thank you bye", "thanks bye", "bye", "goodbye", "ok bye", "okay bye"
-    ]
-
     # Analyze conversation flow to detect interruptions
     lines = [line.strip() for line in transcript.split('\n') if line.strip()]
     ai_was_confirming = False
@@ -2815,18 +3470,15 @@ def analyze_call_transcript(transcript: str) -> str:
         if line.startswith('assistant:'):
             line_content = line.replace('assistant:', '').strip().lower()
             # Check if AI was in middle of confirming appointment OR providing appointment details
-            if any(phrase in line_content for phrase in [
-                'confirm your upcoming appointment', 'reason for my call is to confirm',
-                'upcoming appointment on', 'will you be able to make it',
-                'perfect! the reason for my call', 'the reason for my call is to'
-            ]):
+            if AI_CONFIRMING_RE.search(line_content):
                 ai_was_confirming = True
         elif line.startswith('user:'):
             user_response = line.replace('user:', '').strip().lower()
+            said_goodbye = INTERRUPTED_RE.search(user_response) is not None
 
             # If user says goodbye/bye WHILE AI is explaining appointment details,
             # this is an interruption - they're not confirming the appointment
-            if ai_was_confirming and any(pattern in user_response for pattern in interrupted_patterns):
+            if ai_was_confirming and said_goodbye:
                 # Additional check: make sure this isn't after a full appointment confirmation
                 previous_lines = lines[:i]  # Get all lines before this interruption
                 full_appointment_mentioned = False
@@ -2840,115 +3492,72 @@ def analyze_call_transcript(transcript: str) -> str:
                             full_appointment_mentioned = True
 
                 # If AI was still in middle of explaining OR patient interrupted before full details
-                if not full_appointment_mentioned or "perfect! the reason" in transcript.lower():
+                if not full_appointment_mentioned or "perfect! the reason" in transcript_lower:
                     patient_interrupted = True
                     break
 
             # Reset confirmation tracking if user gives substantial response without goodbye
-            if len(user_response.split()) > 3 and not any(pattern in user_response for pattern in interrupted_patterns):
+            if len(user_response.split()) > 3 and not said_goodbye:
                 ai_was_confirming = False
 
     # If conversation was interrupted without clear appointment decision, return busy_voicemail
     if patient_interrupted:
-        print(f"🔍 Detected interrupted conversation")
+        logger.debug("🔍 Detected interrupted conversation")
         return 'busy_voicemail'
 
     # PRIORITY 6: Look for clear confirmations - analyze user responses in order
-    lines = [line.strip() for line in transcript.split('\n') if line.strip()]
-    
     # Find the final patient decision by going through user responses
     final_user_response = None
     for line in reversed(lines):
         if line.startswith('user:'):
             final_user_response = line.replace('user:', '').strip().lower()
             break
-    
+
     if final_user_response:
-        # Check for clear positive confirmations
-        positive_confirmations = [
-            "yes", "sure", "okay", "ok", "that works", "sounds good", 
-            "i'll be there", "i will be there", "see you then", "confirmed",
-            "that's fine", "yes that works", "yes sounds good"
-        ]
-        
-        # Check for negative responses
-        negative_responses = [
-            "no", "can't", "won't", "unable", "cancel", "reschedule",
-            "different time", "better time", "not available"
-        ]
-        
         # If final response is clearly positive and no negative words
-        if (any(pos in final_user_response for pos in positive_confirmations) and
-            not any(neg in final_user_response for neg in negative_responses)):
-            
+        if (POSITIVE_CONFIRMATION_RE.search(final_user_response) and
+            not NEGATIVE_RESPONSE_RE.search(final_user_response)):
+
             # Double check there wasn't a cancellation or reschedule earlier
-            if ("cancel" not in transcript_lower or 
-                "i will cancel this appointment" not in transcript_lower):
-                if ("reschedule" not in transcript_lower or
-                    "scheduling agent will call" not in transcript_lower):
-                    print(f"🔍 Found positive final response: {final_user_response}")
+            if 'ai_cancel_notice' not in found:
+                if ('mentions_reschedule' not in found or
+                    'ai_reschedule_notice' not in found):
+                    logger.debug("🔍 Found positive final response: %s", final_user_response)
                     return 'confirmed'
 
     # Check for ambiguous/unknown responses if no clear decisions found
-    ambiguous_indicators = [
-        "i'm not sure", "not sure", "maybe", "perhaps", "i don't know", "don't know",
-        "let me think", "let me check", "i'll have to", "i need to check",
-        "uncertain", "unclear", "confused", "i don't understand",
-        "possibly", "might be", "could be", "depends", "we'll see"
-    ]
-
-    # Check each sentence for ambiguous responses
-    for sentence in transcript_lower.split('.'):
-        if any(ambiguous in sentence for ambiguous in ambiguous_indicators):
-            print(f"🔍 Found ambiguous response")
-            return 'unknown'
+    # (no indicator contains a '.', so the whole-transcript scan covers every sentence)
+    if 'ambiguous' in found:
+        logger.debug("🔍 Found ambiguous response")
+        return 'unknown'
 
     # Check for voicemail/busy indicators
-    voicemail_indicators = [
-        "voicemail", "voice mail", "leave a message", "after the beep", "beep",
-        "mailbox", "voice message", "recording", "automated", "please leave",
-        "can't come to the phone", "not available", "busy", "no answer",
-        "disconnected", "line busy", "dial tone", "no response"
-    ]
-
-    if any(indicator in transcript_lower for indicator in voicemail_indicators):
-        print(f"🔍 Found voicemail indicator")
+    if 'voicemail' in found:
+        logger.debug("🔍 Found voicemail indicator")
         return 'busy_voicemail'
 
     # Check if conversation seems like a real interaction
-    interaction_indicators = [
-        "hello", "hi", "hey", "good morning", "good afternoon", "good evening",
-        "speaking", "this is", "who is", "what", "when", "where", "how",
-        "thank you", "thanks", "sorry", "excuse me", "pardon"
-    ]
-
-    has_interaction = any(indicator in transcript_lower for indicator in interaction_indicators)
+    has_interaction = 'interaction' in found
 
     # If we have a real conversation but no clear decision
     if has_interaction and len(transcript.strip()) > 20:
         # Look for positive vs negative sentiment in the overall response
-        positive_words = ["yes", "sure", "fine", "good", "great", "perfect"]
-        negative_words = ["no", "can't", "won't", "unable", "busy", "sorry", "problem"]
-
-        positive_count = sum(1 for word in positive_words if word in transcript_lower)
-        negative_count = sum(1 for word in negative_words if word in transcript_lower)
+        positive_count = len(found & POSITIVE_WORD_CATEGORIES)
+        negative_count = len(found & NEGATIVE_WORD_CATEGORIES)
 
         if positive_count > negative_count and positive_count > 1:
             # Double check for explicit appointment confirmation
-            appointment_confirmation = any(phrase in transcript_lower for phrase in [
-                "i'll be there", "i will be there", "see you then", "confirmed",
-                "that works", "sounds good", "i can make it"
-            ])
-
-            if appointment_confirmation:
-                print(f"🔍 Found appointment confirmation based on sentiment")
+            if 'appointment_confirmation' in found:
+                logger.debug("🔍 Found appointment confirmation based on sentiment")
                 return 'confirmed'
 
     # Default to busy_voicemail if we can't determine the status
-    print(f"🔍 Defaulting to busy_voicemail")
+    logger.debug("🔍 Defaulting to busy_voicemail")
     return 'busy_voicemail'
 
 
+# Retry rounds and repeat uploads voicemail the same appointments, so the rendered prompts are reused
+@lru_cache(maxsize=2048)
 def get_voicemail_prompt(patient_name: str = "[patient name]",
         appointment_date: str = "[date]",
         appointment_time: str = "[time]",
@@ -2966,82 +3575,99 @@ def get_voicemail_prompt(patient_name: str = "[patient name]",
     {available_providers}
     """
 
-    return f"""
-    ROLE & PERSONA
-    You are an AI voice agent leaving a voicemail message from Hillside Medical Group. You are professional, clear, and concise.
+    voicemail_message = VOICEMAIL_MESSAGE_TEMPLATE.format(
+        patient_name=patient_name,
+        appointment_date=appointment_date,
+        appointment_time=appointment_time,
+        provider_name=provider_name,
+        office_location=office_location)
+
+    return VOICEMAIL_PROMPT_TEMPLATE.format(
+        voicemail_message=voicemail_message,
+        provider_info_section=provider_info_section)
+
+@lru_cache(maxsize=2048)
+def get_final_voicemail_task(patient_name: str, appointment_date: str, appointment_time: str,
+                             provider_name: str, office_location: str) -> str:
+    """Get the task prompt for the voicemail left after all retry attempts"""
+    return FINAL_VOICEMAIL_TASK_TEMPLATE.format(
+        patient_name=patient_name,
+        appointment_date=appointment_date,
+        appointment_time=appointment_time,
+        provider_name=provider_name,
+        office_location=office_location)
+
+# How each kind of voicemail turns the appointment fields into the Bland "task" prompt
+VOICEMAIL_TASK_BUILDERS = {
+    "final": lambda fields: get_final_voicemail_task(**fields),
+    "automatic": lambda fields: get_voicemail_prompt(**fields),
+}
 
-    VOICEMAIL MESSAGE
-    Hi Good Morning, I am calling from Hillside Medical Group. This call is for {patient_name} to remind him/her of an upcoming appointment on {appointment_date} at {appointment_time} with {provider_name} at {office_location}. Please make sure to arrive 15 minutes prior to your appointment. Also, Please make sure to email us your insurance information ASAP so that we can get it verified and avoid any delays on the day of your appointment. If you wish to cancel or reschedule your appointment, please inform us at least 24 hours in advance to avoid cancellation charge of $25.00. For more information, you can call us back on 210-742-6555. Thank you and have a blessed day.{provider_info_section}
 
-    DELIVERY RULES
-    • Speak clearly and at a moderate pace
-    • Pause briefly between sentences
-    • Emphasize important information like the appointment date, time, and callback number
-    • End the call after delivering the complete message
-    """
+@lru_cache(maxsize=4)
+def get_bland_headers(api_key: str) -> dict:
+    """Bland API request headers, built once per API key (treat as read-only)"""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
 
-async def send_automatic_voicemail(call_request: CallRequest, api_key: str, client_voice: Optional[str] = None):
-    """Send a voicemail message to a patient, used for automatic follow-ups"""
+
+async def send_voicemail_message(call_request: CallRequest, api_key: str, client_voice: Optional[str] = None, *, template_kind: str = "automatic"):
+    """Send a voicemail to a patient using the "final" or "automatic" voicemail template"""
     try:
         # Use client voice if provided, otherwise default to Paige
         voice_name = client_voice or "Paige"
-        selected_voice = VOICE_MAP.get(voice_name, VOICE_MAP.get("Paige", "default_voice_id"))
-        print(f"🎤 Selected voice for voicemail: {voice_name} (ID: {selected_voice})")
+        selected_voice = get_voice_id(voice_name)
+        logger.info("🎤 Selected voice for voicemail: %s (ID: %s)", voice_name, selected_voice)
+
+        voicemail_fields = {
+            "patient_name": call_request.patient_name,
+            "appointment_date": call_request.appointment_date,
+            "appointment_time": call_request.appointment_time,
+            "provider_name": call_request.provider_name,
+            "office_location": call_request.office_location
+        }
 
         payload = {
             "phone_number": call_request.phone_number,
-            "task": get_voicemail_prompt(
-                patient_name=call_request.patient_name,
-                appointment_date=call_request.appointment_date,
-                appointment_time=call_request.appointment_time,
-                provider_name=call_request.provider_name,
-                office_location=call_request.office_location
-            ),
+            "task": VOICEMAIL_TASK_BUILDERS[template_kind](voicemail_fields),
             "voice": selected_voice,
-            "request_data": {
-                "patient_name": call_request.patient_name,
-                "appointment_date": call_request.appointment_date,
-                "appointment_time": call_request.appointment_time,
-                "provider_name": call_request.provider_name,
-                "office_location": call_request.office_location
-            }
+            "request_data": voicemail_fields
         }
 
-        print(f"🔄 Sending automatic voicemail to {call_request.phone_number} for {call_request.patient_name}")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                    "https://api.bland.ai/v1/calls",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-            ) as response:
-                if response.status == 200:
-                    resp_json = await response.json()
-                    print(f"✅ Automatic voicemail sent successfully for {call_request.patient_name}")
-                    return {
-                        "success": True,
-                        "call_id": resp_json.get("call_id", "N/A"),
-                        "status": resp_json.get("status", "N/A"),
-                        "message": "Automatic voicemail sent successfully",
-                        "patient_name": call_request.patient_name,
-                        "phone_number": call_request.phone_number
-                    }
-                else:
-                    error_msg = f"API error (Status {response.status}): {await response.text()}"
-                    print(f"❌ Error sending automatic voicemail for {call_request.patient_name}: {error_msg}")
-                    return {
-                        "success": False,
-                        "error": error_msg,
-                        "patient_name": call_request.patient_name,
-                        "phone_number": call_request.phone_number
-                    }
+        logger.info("🔄 Sending %s voicemail to %s for %s", template_kind, call_request.phone_number, call_request.patient_name)
+
+        session = app.state.http
+        async with session.post(
+                BLAND_CALLS_URL,
+                headers=get_bland_headers(api_key),
+                data=orjson.dumps(payload),
+                timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            if response.status == 200:
+                resp_json = orjson.loads(await response.read())
+                logger.info("✅ %s voicemail sent successfully for %s", template_kind.capitalize(), call_request.patient_name)
+                return {
+                    "success": True,
+                    "call_id": resp_json.get("call_id", "N/A"),
+                    "status": resp_json.get("status", "N/A"),
+                    "message": f"{template_kind.capitalize()} voicemail sent successfully",
+                    "patient_name": call_request.patient_name,
+                    "phone_number": call_request.phone_number
+                }
+            else:
+                error_msg = f"API error (Status {response.status}): {await response.text()}"
+                logger.error("❌ Error sending %s voicemail for %s: %s", template_kind, call_request.patient_name, error_msg)
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "patient_name": call_request.patient_name,
+                    "phone_number": call_request.phone_number
+                }
 
     except Exception as e:
-        print(f"💥 Exception during automatic voicemail sending: {str(e)}")
+        logger.error("💥 Exception during %s voicemail sending: %s", template_kind, e)
         return {
             "success": False,
             "error": str(e),
@@ -3050,83 +3676,97 @@ async def send_automatic_voicemail(call_request: CallRequest, api_key: str, clie
         }
 
 
-@app.post("/send_voicemail")
-async def send_voicemail(call_request: CallRequest):
-    """Send a voicemail message to a patient"""
-    api_key = get_api_key()
+async def send_final_voicemail(call_request: CallRequest, api_key: str, client_voice: Optional[str] = None):
+    """Send final voicemail using the updated template after all retry attempts"""
+    return await send_voicemail_message(call_request, api_key, client_voice, template_kind="final")
 
-    if not api_key:
-        raise HTTPException(
-            status_code=400,
-            detail="BLAND_API_KEY not found in Secrets. Please add your API key.")
 
-    try:
-        selected_voice = VOICE_MAP.get("Paige", "default_voice_id")
+async def send_automatic_voicemail(call_request: CallRequest, api_key: str, client_voice: Optional[str] = None):
+    """Send a voicemail message to a patient, used for automatic follow-ups"""
+    return await send_voicemail_message(call_request, api_key, client_voice, template_kind="automatic")
 
-        payload = {
-            "phone_number": call_request.phone_number,
-            "task": get_voicemail_prompt(
-                patient_name=call_request.patient_name,
-                appointment_date=call_request.appointment_date,
-                appointment_time=call_request.appointment_time,
-                provider_name=call_request.provider_name,
-                office_location=call_request.office_location
-            ),
-            "voice": selected_voice,
-            "request_data": {
-                "patient_name": call_request.patient_name,
-                "appointment_date": call_request.appointment_date,
-                "appointment_time": call_request.appointment_time,
-                "provider_name": call_request.provider_name,
-                "office_location": call_request.office_location
-            }
-        }
 
-        print(f"🔄 Sending voicemail to {call_request.phone_number} for {call_request.patient_name}")
+async def send_voicemails_bulk(call_requests, api_key: str, client_voice: Optional[str] = None,
+                               concurrency: int = MAX_CALL_CONCURRENCY):
+    """Send final voicemails concurrently; returns one outcome (or exception) per request, in order"""
+    # Reduced concurrency for international rate limits, like the campaign call semaphore
+    semaphore = asyncio.Semaphore(concurrency)
 
-        response = requests.post(
-            "https://api.bland.ai/v1/calls",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json=payload,
-            timeout=60
-        )
+    async def send_one(call_request):
+        async with semaphore:
+            return await send_final_voicemail(call_request, api_key, client_voice)
 
-        if response.status_code == 200:
-            resp_json = response.json()
-            print(f"✅ Voicemail sent successfully for {call_request.patient_name}")
-            return {
-                "success": True,
-                "call_id": resp_json.get("call_id", "N/A"),
-                "status": resp_json.get("status", "N/A"),
-                "message": "Voicemail sent successfully",
-                "patient_name": call_request.patient_name,
-                "phone_number": call_request.phone_number
-            }
+    return await asyncio.gather(*(send_one(call_request) for call_request in call_requests),
+                                return_exceptions=True)
+
+
+async def dispatch_voicemail(call_request: CallRequest, payload: dict, api_key: str):
+    """Background task: post a queued voicemail to Bland AI and log the outcome"""
+    try:
+        logger.info("🔄 Sending voicemail to %s for %s", call_request.phone_number, call_request.patient_name)
+
+        async with app.state.http.post(
+            BLAND_CALLS_URL,
+            headers=get_bland_headers(api_key),
+            data=orjson.dumps(payload)
+        ) as response:
+            status_code = response.status
+            body = await response.read()
+
+        if status_code == 200:
+            resp_json = orjson.loads(body)
+            logger.info("✅ Voicemail sent successfully for %s (call %s)",
+                        call_request.patient_name, resp_json.get("call_id", "N/A"))
         else:
-            error_msg = f"API error (Status {response.status_code}): {response.text}"
-            print(f"❌ Error sending voicemail for {call_request.patient_name}: {error_msg}")
-            return {
-                "success": False,
-                "error": error_msg,
-                "patient_name": call_request.patient_name,
-                "phone_number": call_request.phone_number
-            }
+            error_msg = f"API error (Status {status_code}): {body.decode('utf-8', 'replace')}"
+            logger.error("❌ Error sending voicemail for %s: %s", call_request.patient_name, error_msg)
 
     except Exception as e:
-        print(f"💥 Exception during voicemail sending: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e),
+        logger.error("💥 Exception during voicemail sending: %s", e)
+
+
+@app.post("/send_voicemail")
+async def send_voicemail(call_request: CallRequest, background_tasks: BackgroundTasks):
+    """Queue a voicemail message to a patient; the Bland AI request runs in the background"""
+    api_key = get_api_key()
+
+    if not api_key:
+        raise HTTPException(
+            status_code=400,
+            detail="BLAND_API_KEY not found in Secrets. Please add your API key.")
+
+    payload = {
+        "phone_number": call_request.phone_number,
+        "task": get_voicemail_prompt(
+            patient_name=call_request.patient_name,
+            appointment_date=call_request.appointment_date,
+            appointment_time=call_request.appointment_time,
+            provider_name=call_request.provider_name,
+            office_location=call_request.office_location
+        ),
+        "voice": DEFAULT_VOICE_ID,
+        "request_data": {
             "patient_name": call_request.patient_name,
-            "phone_number": call_request.phone_number
+            "appointment_date": call_request.appointment_date,
+            "appointment_time": call_request.appointment_time,
+            "provider_name": call_request.provider_name,
+            "office_location": call_request.office_location
         }
+    }
+
+    background_tasks.add_task(dispatch_voicemail, call_request, payload, api_key)
+
+    return ORJSONResponse({
+        "success": True,
+        "status": "queued",
+        "message": "Voicemail queued for sending",
+        "patient_name": call_request.patient_name,
+        "phone_number": call_request.phone_number
+    }, status_code=202)
 
 
 @app.get("/campaign_analytics/{campaign_id}")
-async def get_campaign_analytics(campaign_id: str):
+async def get_campaign_analytics(campaign_id: str, request: Request, refresh: bool = False):
     """Get campaign analytics including performance metrics and call details"""
     api_key = get_api_key()
 
@@ -3137,66 +3777,56 @@ async def get_campaign_analytics(campaign_id: str):
         }
 
     try:
-        print(f"🔍 Campaign analytics requested for ID: {campaign_id}")
-        print(f"📊 Available campaigns in campaigns_db: {list(campaigns_db.keys())}")
-        print(f"📊 Available campaigns in results_db: {list(campaign_results_db.keys())}")
+        logger.debug("🔍 Campaign analytics requested for ID: %s", campaign_id)
+        logger.debug("📊 Available campaigns in campaigns_db: %s", list(campaigns_db.keys()))
+        logger.debug("📊 Available campaigns in results_db: %s", list(campaign_results_db.keys()))
 
         # Get campaign details
         if campaign_id not in campaigns_db:
-            print(f"❌ Campaign {campaign_id} not found in campaigns_db")
-            print(f"📊 Available campaigns: {list(campaigns_db.keys())}")
+            logger.error("❌ Campaign %s not found in campaigns_db", campaign_id)
+            logger.debug("📊 Available campaigns: %s", list(campaigns_db.keys()))
             return {
                 "success": False,
                 "message": f"Campaign not found. Available campaigns: {len(campaigns_db)}"
             }
 
+        # ?refresh=1 bypasses the built response and rebuilds it; call details still come
+        # from call_details_cache while fresh, and webhooks evict calls that changed
+        cached = analytics_cache.get(campaign_id)
+        if cached and not refresh and cached[0] > time.monotonic():
+            logger.info("⚡ Serving cached analytics for campaign %s", campaign_id)
+            return json_response_with_etag(request, cached[1], etag=cached[2])
+
         campaign = campaigns_db[campaign_id]
         campaign_name = campaign.get('name', 'Unknown Campaign')
-        print(f"🔍 Looking for analytics for campaign: {campaign_name} (ID: {campaign_id})")
+        logger.debug("🔍 Looking for analytics for campaign: %s (ID: %s)", campaign_name, campaign_id)
 
-        # Debug: Print all available campaign result IDs
-        print(f"🔍 All campaign result IDs: {list(campaign_results_db.keys())}")
-        print(f"🔍 Campaign ID being searched: {campaign_id}")
-        print(f"🔍 Campaign ID type: {type(campaign_id)}")
+        # Debug: Print all available campaign result IDs (skipped entirely unless DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 All campaign result IDs: %s", list(campaign_results_db.keys()))
+            logger.debug("🔍 Campaign ID being searched: %s", campaign_id)
+            logger.debug("🔍 Campaign ID type: %s", type(campaign_id))
 
-        # Check if any stored results have mismatched ID types
-        for stored_id in campaign_results_db.keys():
-            print(f"🔍 Stored ID: {stored_id} (type: {type(stored_id)})")
+            # Check if any stored results have mismatched ID types
+            for stored_id in campaign_results_db.keys():
+                logger.debug("🔍 Stored ID: %s (type: %s)", stored_id, type(stored_id))
 
         # Find all runs for this campaign ID
         campaign_runs = {}
-        for stored_key, stored_results in campaign_results_db.items():
+        for stored_key in list(campaign_results_db.keys()):
             if stored_key == campaign_id or stored_key.startswith(f"{campaign_id}_run_"):
-                campaign_runs[stored_key] = stored_results
-                print(f"   Found run matching campaign ID: {stored_key}")
+                campaign_runs[stored_key] = get_campaign_run(stored_key)
+                logger.debug("   Found run matching campaign ID: %s", stored_key)
 
         if not campaign_runs:
-            print(f"🔍 No stored results found for campaign {campaign_name}. Available campaigns in results_db: {list(campaign_results_db.keys())}")
+            logger.debug("🔍 No stored results found for campaign %s. Available campaigns in results_db: %s", campaign_name, campaign_results_db.keys())
 
             # If no stored results, return empty analytics structure
-            return {
-                "success": True,
-                "campaign_id": campaign_id,
-                "campaign_name": campaign_name,
-                "analytics": {
-                    'total_calls': 0,
-                    'total_duration': 0,
-                    'formatted_duration': "0s",
-                    'campaign_runs': 0,
-                    'success_rate': 0,
-                    'status_counts': {
-                        'confirmed': 0,
-                        'cancelled': 0,
-                        'rescheduled': 0,
-                        'busy_voicemail': 0,
-                        'not_available': 0,
-                        'wrong_number': 0,
-                        'unknown': 0,
-                        'failed': 0
-                    },
-                    'calls': []
-                }
-            }
+            return Response(
+                content=b'{"success":true,"campaign_id":' + orjson.dumps(campaign_id)
+                        + b',"campaign_name":' + orjson.dumps(campaign_name)
+                        + b',"analytics":' + EMPTY_CAMPAIGN_ANALYTICS_JSON + b'}',
+                media_type="application/json")
 
         # Aggregate results from all runs but deduplicate by call_id or patient+phone combination
         unique_calls_map = {}
@@ -3212,13 +3842,14 @@ async def get_campaign_analytics(campaign_id: str):
 
         for run_key, run_data in sorted_runs:
             run_results = run_data.get('results', [])
-            print(f"📊 Processing run {run_key} with {len(run_results)} calls")
+            logger.debug("📊 Processing run %s with %s calls", run_key, len(run_results))
 
             for result in run_results:
                 # Create unique identifier for each call
-                call_id = result.get('call_id')
-                patient_name = result.get('patient_name', 'Unknown')
-                phone_number = result.get('phone_number', 'Unknown')
+                get = result.get
+                call_id = get('call_id')
+                patient_name = get('patient_name', 'Unknown')
+                phone_number = get('phone_number', 'Unknown')
 
                 # Use call_id as primary key, fallback to patient+phone combination
                 unique_key = call_id if call_id else f"{patient_name}_{phone_number}"
@@ -3228,280 +3859,412 @@ async def get_campaign_analytics(campaign_id: str):
                     call_id and unique_calls_map[unique_key].get('call_id') != call_id
                 ):
                     unique_calls_map[unique_key] = result
-                    print(f"📊 Added/Updated call: {patient_name} with key {unique_key}")
+                    logger.debug("📊 Added/Updated call: %s with key %s", patient_name, unique_key)
                 else:
-                    print(f"📊 Skipping duplicate call: {patient_name} with key {unique_key}")
+                    logger.debug("📊 Skipping duplicate call: %s with key %s", patient_name, unique_key)
 
         # Convert back to list for processing
         all_results = list(unique_calls_map.values())
-        print(f"📊 After deduplication: {len(all_results)} unique calls from {total_runs} runs")
-
-        # Get detailed call information for each call with batch processing
-        calls_with_details = []
-        total_duration = 0
-        status_counts = {
-            'confirmed': 0,
-            'cancelled': 0,
-            'rescheduled': 0,
-            'busy_voicemail': 0,
-            'not_available': 0,
-            'wrong_number': 0,
-            'unknown': 0,
-            'failed': 0
-        }
+        total_calls = len(all_results)
+        logger.debug("📊 After deduplication: %s unique calls from %s runs", total_calls, total_runs)
 
-        print(f"🔍 Processing {len(all_results)} calls from {total_runs} runs for analytics")
+        logger.debug("🔍 Processing %s calls from %s runs for analytics", total_calls, total_runs)
 
-        # Process calls in batches to avoid overwhelming the API
-        batch_size = 5
-        results_list = all_results
+        # Fetch call details concurrently, capped so Bland AI doesn't rate-limit us
+        detail_semaphore = asyncio.Semaphore(16)
 
-        for i in range(0, len(results_list), batch_size):
-            batch = results_list[i:i + batch_size]
-            batch_calls = []
+        def new_call_details(result):
+            """Analytics row for a stored result before any Bland AI details are merged in"""
+            get = result.get
+            return {
+                'patient_name': get('patient_name', 'Unknown'),
+                'phone_number': get('phone_number', 'Unknown'),
+                'success': get('success', False),
+                'error': get('error'),
+                'call_id': get('call_id'),
+                'transcript': None,
+                'final_summary': None, # Added for final summary
+                'duration': 0,
+                'call_status': 'failed',
+                'created_at': first_run_started_at,
+                'analysis_notes': ''
+            }
 
-            # Process each call in the batch
-            for result in batch:
-                call_details = {
-                    'patient_name': result.get('patient_name', 'Unknown'),
-                    'phone_number': result.get('phone_number', 'Unknown'),
-                    'success': result.get('success', False),
-                    'error': result.get('error'),
-                    'call_id': result.get('call_id'),
-                    'transcript': None,
-                    'final_summary': None, # Added for final summary
-                    'duration': 0,
-                    'call_status': 'failed',
-                    'created_at': first_run_started_at,
-                    'analysis_notes': ''
-                }
+        async def fetch_call_detail(result, fetch_details):
+            """Fetch one call's details; returns (call_details, status bucket to count, whether the call is final)"""
+            async with detail_semaphore:
+                call_details = new_call_details(result)
+                # Only a call Bland reports in a terminal state can't change any more
+                settled = False
 
                 stored_call_id = result.get('call_id')
-                print(f"📞 ANALYTICS CALL ID TRACKING:")
-                print(f"   Patient: {result.get('patient_name', 'Unknown')}")
-                print(f"   Stored Call ID: {stored_call_id}")
-                print(f"   Call ID Type: {type(stored_call_id)}")
-                print(f"   Success Flag: {result.get('success', False)}")
+                logger.debug("📞 ANALYTICS CALL ID TRACKING:")
+                logger.debug("   Patient: %s", result.get('patient_name', 'Unknown'))
+                logger.debug("   Stored Call ID: %s", stored_call_id)
+                logger.debug("   Call ID Type: %s", type(stored_call_id))
+                logger.debug("   Success Flag: %s", result.get('success', False))
 
                 stored_call_data = result.get('stored_call_data', {})
 
                 # If call was successful and has call_id, try to get detailed info
-                if result.get('success') and result.get('call_id'):
+                if fetch_details:
                     try:
-                        print(f"🔍 Fetching call details for call_id: {result.get('call_id')}")
-
-                        async with aiohttp.ClientSession() as session:
-                            async with session.get(
-                                f"https://api.bland.ai/v1/calls/{result['call_id']}",
-                                headers={"Authorization": f"Bearer {api_key}"},
-                                timeout=aiohttp.ClientTimeout(total=30)
-                            ) as call_response:
-
-                                print(f"🔍 API Response Status: {call_response.status} for call {result['call_id']}")
-
-                                if call_response.status == 200:
-                                    call_data = await call_response.json()
-                                    print(f"📊 Call data keys: {list(call_data.keys())}")
-
-                                    # Get transcript and other details with better field handling
-                                    transcript = call_data.get('transcript', call_data.get('concatenated_transcript', ''))
-                                    # Parse duration more robustly - prioritize call_length parameter
-                                    call_length = call_data.get("call_length")
-                                    corrected_duration = call_data.get("corrected_duration")
-
-                                    print(f"🔍 Duration parsing for {call_details['patient_name']}:")
-                                    print(f"   call_length: {call_length} (type: {type(call_length)})")
-                                    print(f"   corrected_duration: {corrected_duration} (type: {type(corrected_duration)})")
-
-                                    if call_length is not None and call_length != 0:
-                                        # call_length is in MINUTES, convert to seconds
-                                        duration = int(float(call_length) * 60)
-                                        print(f"   Using call_length: {call_length} minutes -> {duration} seconds")
-                                    elif corrected_duration is not None and corrected_duration != 0:
-                                        # corrected_duration is in SECONDS
-                                        duration = parse_duration(corrected_duration)
-                                        print(f"   Using corrected_duration: {corrected_duration} -> {duration} seconds")
-                                    else:
-                                        raw_duration = (call_data.get("duration", 0) or call_data.get("length", 0))
-                                        duration = parse_duration(raw_duration)
-                                        print(f"   Using fallback duration: {raw_duration} -> {duration} seconds")
+                        logger.debug("🔍 Fetching call details for call_id: %s", result.get('call_id'))
+
+                        # Served from call_details_cache when fresh (finished calls stay cached for a day)
+                        status_code, call_data = await fetch_call_data_cached(result['call_id'], api_key)
+
+                        logger.debug("🔍 API Response Status: %s for call %s", status_code, result['call_id'])
+
+                        if status_code == 200:
+                            logger.debug("📊 Call data keys: %s", list(call_data.keys()))
+                            settled = call_data.get("status") in TERMINAL_CALL_STATES
+
+                            # Get transcript and other details with better field handling
+                            transcript = call_data.get('transcript', call_data.get('concatenated_transcript', ''))
+                            duration = call_duration_seconds(call_data)
+                            call_details['duration'] = duration
+
+                            # Priority order for status extraction:
+                            # 1. Fresh transcript analysis (most accurate)
+                            # 2. Stored webhook data with summary
+                            # 3. Stored status only
+                            # 4. Default fallback
+
+                            call_status = 'busy_voicemail'  # Default
+                            final_summary = "No summary available"
+                            analysis_source = "default"
+
+                            # Priority 1: Fresh transcript from API (most accurate)
+                            if transcript and transcript.strip():
+                                extracted_summary = extract_final_summary(transcript)
+                                call_status, standardized_summary = analyze_call_status_from_summary(extracted_summary, transcript)
+                                final_summary = standardized_summary
+                                analysis_source = f"fresh_transcript_{len(transcript)}_chars"
+                                logger.debug("📊 Using fresh transcript for %s: %s", call_details['patient_name'], call_status)
+
+                            # Priority 2: Stored final summary from webhook
+                            elif result.get('final_summary') and result.get('final_summary').strip():
+                                stored_final_summary = result.get('final_summary')
+                                call_status, standardized_summary = analyze_call_status_from_summary(stored_final_summary, result.get('transcript', ''))
+                                final_summary = standardized_summary
+                                analysis_source = "stored_summary"
+                                logger.debug("📊 Using stored summary for %s: %s", call_details['patient_name'], call_status)
+
+                            # Priority 3: Stored status from webhook - but validate it's not 'initiated' or 'processing'
+                            elif result.get('call_status') and result.get('call_status') not in ['initiated', 'processing']:
+                                call_status = result.get('call_status')
+                                final_summary = get_standardized_summary_for_status(call_status)
+                                transcript = result.get('transcript', '')
+                                analysis_source = "stored_status"
+                                logger.debug("📊 Using stored status for %s: %s", call_details['patient_name'], call_status)
+
+                            # Priority 4: No good data available or status is 'initiated'/'processing'
+                            else:
+                                # If status is 'initiated' or 'processing', it means call was started but not completed
+                                if result.get('call_status') in ['initiated', 'processing']:
+                                    call_status = 'busy_voicemail'
+                                    final_summary = "Call initiated but no response received"
+                                    analysis_source = "initiated_fallback"
+                                else:
+                                    call_status = 'busy_voicemail'
+                                    final_summary = "No summary available"
+                                    analysis_source = "no_data_fallback"
+                                logger.debug("📊 No data available for %s, using fallback", call_details['patient_name'])
 
-                                    call_details['duration'] = duration
-                                    total_duration += duration
+                            call_details['analysis_notes'] = analysis_source
 
-                                    # Priority order for status extraction:
-                                    # 1. Fresh transcript analysis (most accurate)
-                                    # 2. Stored webhook data with summary
-                                    # 3. Stored status only
-                                    # 4. Default fallback
+                            call_details['call_status'] = call_status
+                            call_details['transcript'] = transcript
+                            call_details['final_summary'] = final_summary
 
-                                    call_status = 'busy_voicemail'  # Default
-                                    final_summary = "No summary available"
-                                    analysis_source = "default"
-
-                                    # Priority 1: Fresh transcript from API (most accurate)
-                                    if transcript and transcript.strip():
-                                        extracted_summary = extract_final_summary(transcript)
-                                        call_status, standardized_summary = analyze_call_status_from_summary(extracted_summary, transcript)
-                                        final_summary = standardized_summary
-                                        analysis_source = f"fresh_transcript_{len(transcript)}_chars"
-                                        print(f"📊 Using fresh transcript for {call_details['patient_name']}: {call_status}")
-
-                                    # Priority 2: Stored final summary from webhook
-                                    elif result.get('final_summary') and result.get('final_summary').strip():
-                                        stored_final_summary = result.get('final_summary')
-                                        call_status, standardized_summary = analyze_call_status_from_summary(stored_final_summary, result.get('transcript', ''))
-                                        final_summary = standardized_summary
-                                        analysis_source = "stored_summary"
-                                        print(f"📊 Using stored summary for {call_details['patient_name']}: {call_status}")
-
-                                    # Priority 3: Stored status from webhook - but validate it's not 'initiated' or 'processing'
-                                    elif result.get('call_status') and result.get('call_status') not in ['initiated', 'processing']:
-                                        call_status = result.get('call_status')
-                                        final_summary = get_standardized_summary_for_status(call_status)
-                                        transcript = result.get('transcript', '')
-                                        analysis_source = "stored_status"
-                                        print(f"📊 Using stored status for {call_details['patient_name']}: {call_status}")
-
-                                    # Priority 4: No good data available or status is 'initiated'/'processing'
-                                    else:
-                                        # If status is 'initiated' or 'processing', it means call was started but not completed
-                                        if result.get('call_status') in ['initiated', 'processing']:
-                                            call_status = 'busy_voicemail'
-                                            final_summary = "Call initiated but no response received"
-                                            analysis_source = "initiated_fallback"
-                                        else:
-                                            call_status = 'busy_voicemail'
-                                            final_summary = "No summary available"
-                                            analysis_source = "no_data_fallback"
-                                        print(f"📊 No data available for {call_details['patient_name']}, using fallback")
-
-                                    call_details['analysis_notes'] = analysis_source
-
-                                    call_details['call_status'] = call_status
-                                    call_details['transcript'] = transcript
-                                    call_details['final_summary'] = final_summary
-
-                                    # Convert created_at to IST - use actual call timestamp, not campaign start time
-                                    actual_call_time = call_data.get('created_at') or call_data.get('started_at')
-                                    if actual_call_time:
-                                        call_details['created_at'] = convert_utc_to_ist(actual_call_time)
-                                    else:
-                                        # Fallback to stored data or campaign start time
-                                        fallback_time = stored_call_data.get('created_at') if stored_call_data else first_run_started_at
-                                        call_details['created_at'] = convert_utc_to_ist(fallback_time)
+                            # Convert created_at to IST - use actual call timestamp, not campaign start time
+                            actual_call_time = call_data.get('created_at') or call_data.get('started_at')
+                            if actual_call_time:
+                                call_details['created_at'] = convert_utc_to_ist(actual_call_time)
+                            else:
+                                # Fallback to stored data or campaign start time
+                                fallback_time = stored_call_data.get('created_at') if stored_call_data else first_run_started_at
+                                call_details['created_at'] = convert_utc_to_ist(fallback_time)
 
-                                    # Count the status
-                                    if call_status in status_counts:
-                                        status_counts[call_status] += 1
-                                    else:
-                                        status_counts['unknown'] += 1 # Categorize unknown statuses
-                                        call_details['call_status'] = 'unknown'
-
-                                    print(f"✅ Call details for {call_details['patient_name']}: Status={call_status}, Duration={duration}s, Transcript={len(transcript)} chars")
-
-                                elif call_response.status == 404:
-                                    print(f"⚠️ Call {result.get('call_id')} not found in Bland AI - may still be processing")
-                                    call_details['call_status'] = 'processing'
-                                    call_details['analysis_notes'] = "Call not found in API - may still be processing"
-                                    status_counts['busy_voicemail'] += 1
-                                elif call_response.status == 429:
-                                    print(f"⏳ Rate limit hit, waiting and retrying...")
-                                    await asyncio.sleep(2)
-                                    # Retry once
-                                    async with session.get(
-                                        f"https://api.bland.ai/v1/calls/{result['call_id']}",
-                                        headers={"Authorization": f"Bearer {api_key}"},
-                                        timeout=aiohttp.ClientTimeout(total=45)
-                                    ) as retry_response:
-                                        if retry_response.status == 200:
-                                            call_data = await retry_response.json()
-                                            transcript = call_data.get('transcript', '')
-                                            call_details['transcript'] = transcript
-                                            if transcript:
-                                                call_status = analyze_call_transcript(transcript)
-                                                call_details['call_status'] = call_status
-                                                if call_status in status_counts:
-                                                    status_counts[call_status] += 1
-                                                else:
-                                                    status_counts['unknown'] += 1 # Categorize unknown statuses
-                                            else:
-                                                call_details['call_status'] = 'busy_voicemail'
-                                                status_counts['busy_voicemail'] += 1
-                                        else:
-                                            call_details['call_status'] = 'busy_voicemail'
-                                            status_counts['busy_voicemail'] += 1
-                                else:
-                                    response_text = await call_response.text()
-                                    print(f"❌ API error for call {result.get('call_id')}: Status {call_response.status}")
-                                    call_details['call_status'] = 'busy_voicemail'
-                                    call_details['analysis_notes'] = f"API error: {call_response.status}"
-                                    status_counts['busy_voicemail'] += 1
+                            # Count the status
+                            if call_status in EMPTY_STATUS_COUNTS:
+                                counted_status = call_status
+                            else:
+                                counted_status = 'unknown' # Categorize unknown statuses
+                                call_details['call_status'] = 'unknown'
+
+                            logger.debug("✅ Call details for %s: Status=%s, Duration=%ss, Transcript=%s chars", call_details['patient_name'], call_status, duration, len(transcript))
+
+                        elif status_code == 404:
+                            logger.warning("⚠️ Call %s not found in Bland AI - may still be processing", result.get('call_id'))
+                            call_details['call_status'] = 'processing'
+                            call_details['analysis_notes'] = "Call not found in API - may still be processing"
+                            counted_status = 'busy_voicemail'
+                        else:
+                            logger.error("❌ API error for call %s: Status %s", result.get('call_id'), status_code)
+                            call_details['call_status'] = 'busy_voicemail'
+                            call_details['analysis_notes'] = f"API error: {status_code}"
+                            counted_status = 'busy_voicemail'
 
                     except asyncio.TimeoutError:
-                        print(f"⏱️ Timeout getting call details for {result.get('call_id')}")
+                        logger.warning("⏱️ Timeout getting call details for %s", result.get('call_id'))
                         call_details['call_status'] = 'busy_voicemail'
                         call_details['analysis_notes'] = "API timeout"
-                        status_counts['busy_voicemail'] += 1
+                        counted_status = 'busy_voicemail'
                     except Exception as e:
-                        print(f"❌ Exception getting call details for {result.get('call_id')}: {str(e)}")
+                        logger.error("❌ Exception getting call details for %s: %s", result.get('call_id'), e)
                         call_details['call_status'] = 'busy_voicemail'
                         call_details['analysis_notes'] = f"Error: {str(e)}"
-                        status_counts['busy_voicemail'] += 1
+                        counted_status = 'busy_voicemail'
                 else:
                     # Failed calls or calls without call_id count as busy_voicemail
                     call_details['call_status'] = 'busy_voicemail'
                     call_details['final_summary'] = "No summary available"  # Consistent message
                     call_details['analysis_notes'] = "Call failed or no call_id"
-                    status_counts['busy_voicemail'] += 1
+                    counted_status = 'busy_voicemail'
+                    settled = True
 
-                batch_calls.append(call_details)
+                return call_details, counted_status, settled
 
-            # Add batch to main list
-            calls_with_details.extend(batch_calls)
+        # Start every fetch now; the stream below writes rows out in campaign order
+        # as they finish, so the client gets bytes long before the last call returns
+        # Only successful calls with a call_id have details to fetch
+        detail_tasks = [
+            asyncio.create_task(fetch_call_detail(result, bool(result.get('success') and result.get('call_id'))))
+            for result in all_results
+        ]
 
-            # Increased delay between batches for international rate limiting
-            if i + batch_size < len(results_list):
-                await asyncio.sleep(5)
+        async def stream_analytics():
+            """Yield the analytics JSON document one call row at a time"""
+            status_counts = EMPTY_STATUS_COUNTS.copy()
+            total_duration = 0
+            successful_calls = 0
+            transcripts_count = 0
+            settled = True
+
+            chunks = [b'{"success":true,"campaign_id":' + orjson.dumps(campaign_id)
+                      + b',"campaign_name":' + orjson.dumps(campaign_name)
+                      + b',"analytics":{"calls":[']
+            yield chunks[0]
+
+            first_row = True
+            # Set when the stream breaks after the headers went out; the document is still closed properly
+            stream_error = None
+            # Set when any row is a timeout/error placeholder; such a document is served but not cached
+            degraded = False
+            try:
+                for result, task in zip(all_results, detail_tasks):
+                    try:
+                        call_details, counted_status, call_settled = await asyncio.wait_for(task, ANALYTICS_ROW_TIMEOUT)
+                    except TimeoutError:
+                        logger.warning("⏱️ Timeout getting call details for %s", result.get('call_id'))
+                        call_details = new_call_details(result)
+                        call_details['call_status'] = 'busy_voicemail'
+                        call_details['analysis_notes'] = "API timeout"
+                        counted_status = 'busy_voicemail'
+                        call_settled = False
+                        degraded = True
+                    except Exception as e:
+                        # Keep the row so calls and status_counts still add up to total_calls
+                        logger.error("❌ Call detail fetch failed for %s: %s", result.get('call_id'), e)
+                        call_details = new_call_details(result)
+                        call_details['call_status'] = 'busy_voicemail'
+                        call_details['analysis_notes'] = f"Error: {str(e)}"
+                        counted_status = 'busy_voicemail'
+                        call_settled = False
+                        degraded = True
+
+                    status_counts[counted_status] += 1
+                    total_duration += call_details['duration']
+                    if call_details.get('success'):
+                        successful_calls += 1
+                    if call_details.get('transcript'):
+                        transcripts_count += 1
+                    if not call_settled:
+                        settled = False
+
+                    row = orjson.dumps(call_details)
+                    chunk = row if first_row else b',' + row
+                    first_row = False
+                    chunks.append(chunk)
+                    yield chunk
+            except Exception as e:
+                logger.error("❌ Error streaming campaign analytics: %s", e)
+                stream_error = e
+            finally:
+                # Client went away or we're done; stop any fetches still in flight
+                for task in detail_tasks:
+                    task.cancel()
+
+            # Calculate analytics across all runs
+            try:
+                success_rate = round((successful_calls / total_calls * 100) if total_calls > 0 else 0, 1)
+
+                summary = {
+                    'total_calls': total_calls,
+                    'total_duration': total_duration,
+                    'formatted_duration': format_duration_display(total_duration),
+                    'campaign_runs': total_runs,  # Number of times campaign was run
+                    'success_rate': success_rate,
+                    'status_counts': status_counts
+                }
+                if stream_error is not None:
+                    summary['error'] = f"Error fetching campaign analytics: {str(stream_error)}"
+                summary_json = orjson.dumps(summary)
+            except Exception as e:
+                logger.error("❌ Error summarizing campaign analytics: %s", e)
+                stream_error = stream_error or e
+                summary_json = orjson.dumps({'error': f"Error fetching campaign analytics: {str(stream_error)}"})
 
-        # Calculate analytics across all runs
-        total_calls = len(all_results)
-        successful_calls = sum(1 for call in calls_with_details if call.get('success'))
-        success_rate = round((successful_calls / total_calls * 100) if total_calls > 0 else 0, 1)
+            # Splice the summary fields in after "calls" and close both objects
+            chunk = b'],' + summary_json[1:] + b'}'
+            chunks.append(chunk)
+            yield chunk
 
-        # Format total duration
-        formatted_duration = format_duration_display(total_duration)
-
-        analytics = {
-            'total_calls': total_calls,
-            'total_duration': total_duration,
-            'formatted_duration': formatted_duration,
-            'campaign_runs': total_runs,  # Number of times campaign was run
-            'success_rate': success_rate,
-            'status_counts': status_counts,
-            'calls': calls_with_details
-        }
+            if stream_error is not None or degraded:
+                return  # Never cache a partial or placeholder-filled document
 
-        print(f"📊 Analytics generated: {total_calls} calls, {len([c for c in calls_with_details if c.get('transcript')])} with transcripts")
+            logger.info("📊 Analytics generated: %s calls, %s with transcripts", total_calls, transcripts_count)
 
-        return {
-            "success": True,
-            "campaign_id": campaign_id,
-            "campaign_name": campaign_name,
-            "analytics": analytics
-        }
+            # Once no call is still pending the numbers cannot change until a run is stored
+            ttl = ANALYTICS_CACHE_TTL_SETTLED if settled else ANALYTICS_CACHE_TTL_ACTIVE
+            body = b''.join(chunks)
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            analytics_cache[campaign_id] = (time.monotonic() + ttl, body, etag)
+
+        return StreamingResponse(stream_analytics(), media_type="application/json")
 
     except Exception as e:
-        print(f"❌ Error in campaign analytics: {str(e)}")
+        logger.error("❌ Error in campaign analytics: %s", e)
         return {
             "success": False,
             "message": f"Error fetching campaign analytics: {str(e)}"
         }
 
 
+async def get_with_retry(session, url, *, headers=None, retries=3, timeout=30):
+    """GET a Bland AI URL, retrying 429/5xx with exponential backoff; returns (status, body bytes)
+
+    session is either the shared aiohttp session or the optional httpx HTTP/2 client.
+    """
+    for attempt in range(retries + 1):
+        if httpx is not None and isinstance(session, httpx.AsyncClient):
+            try:
+                response = await session.get(url, headers=headers, timeout=timeout)
+            except httpx.TimeoutException as e:
+                # Surface timeouts the same way aiohttp does so callers handle one type
+                raise asyncio.TimeoutError() from e
+            status_code = response.status_code
+            body = response.content
+        else:
+            async with session.get(url, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                status_code = response.status
+                body = await response.read()
+
+        if (status_code != 429 and status_code < 500) or attempt == retries:
+            return status_code, body
+
+        delay = 2 ** attempt * 0.25 + random.random() * 0.1
+        if status_code == 429:
+            delay = max(delay, parse_retry_after(response.headers.get('Retry-After'), default=0.0))
+        logger.warning("⏳ Bland AI returned %s for %s, retrying in %.2fs", status_code, url, delay)
+        await asyncio.sleep(delay)
+
+
+# Bland AI call data cache: call_id -> (expires_at, call_data), least recently used first.
+# Finished calls never change, so they are kept far longer than calls still in progress.
+TERMINAL_CALL_STATES = frozenset({"completed", "failed", "busy"})
+CALL_DETAILS_TTL_TERMINAL = 24 * 3600
+CALL_DETAILS_TTL_ACTIVE = 30
+CALL_DETAILS_CACHE_MAX = 4096
+call_details_cache = OrderedDict()
+# Fetches in progress, call_id -> task; each entry removes itself when its fetch finishes
+call_details_inflight = {}
+
+
+def cached_call_data(call_id: str):
+    """Return unexpired cached call data (marking it recently used), or None"""
+    cached = call_details_cache.get(call_id)
+    if cached is None:
+        return None
+    if time.monotonic() >= cached[0]:
+        del call_details_cache[call_id]
+        return None
+    call_details_cache.move_to_end(call_id)
+    return cached[1]
+
+
+def cache_call_data(call_id: str, call_data: dict):
+    """Cache call data with a TTL for its state, evicting the least recently used entries past the cap"""
+    ttl = (CALL_DETAILS_TTL_TERMINAL if call_data.get("status") in TERMINAL_CALL_STATES
+           else CALL_DETAILS_TTL_ACTIVE)
+    call_details_cache[call_id] = (time.monotonic() + ttl, call_data)
+    call_details_cache.move_to_end(call_id)
+    while len(call_details_cache) > CALL_DETAILS_CACHE_MAX:
+        call_details_cache.popitem(last=False)
+
+
+async def fetch_call_data(call_id: str, api_key: str):
+    """GET one call from Bland AI with retries and cache it; returns (status_code, call_data or error text)"""
+    session = app.state.bland or app.state.http
+    status_code, body = await get_with_retry(session, f"{BLAND_CALLS_URL}/{call_id}",
+                                             headers=get_bland_headers(api_key), timeout=20)
+    if status_code != 200:
+        return status_code, body.decode('utf-8', 'replace')
+
+    call_data = orjson.loads(body)
+    cache_call_data(call_id, call_data)
+    return 200, call_data
+
+
+def forget_call_fetch(call_id: str, task: asyncio.Task):
+    """Done callback: drop a finished fetch from call_details_inflight"""
+    if call_details_inflight.get(call_id) is task:
+        del call_details_inflight[call_id]
+    if not task.cancelled():
+        task.exception()  # Mark as retrieved even when every waiter has gone away
+
+
+async def fetch_call_data_cached(call_id: str, api_key: str):
+    """Fetch raw call data from Bland AI, returning (status_code, call_data or error text)
+
+    The returned call_data is shared with the cache; treat it as read-only.
+    """
+    call_data = cached_call_data(call_id)
+    if call_data is not None:
+        return 200, call_data
+
+    # Single-flight: concurrent misses for the same call share one upstream request
+    task = call_details_inflight.get(call_id)
+    if task is None:
+        task = asyncio.ensure_future(fetch_call_data(call_id, api_key))
+        call_details_inflight[call_id] = task
+        task.add_done_callback(lambda done: forget_call_fetch(call_id, done))
+    # A waiter being cancelled (e.g. an analytics client going away) must not cancel the others
+    return await asyncio.shield(task)
+
+
+def json_response_with_etag(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """Serve a JSON body with an ETag, or an empty 304 when the client already has it"""
+    etag = etag or f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    # no-cache: the browser keeps the body but revalidates every poll, so new results show at once
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 @app.get("/call_details/{call_id}")
-async def get_call_details(call_id: str):
+async def get_call_details(call_id: str, request: Request):
     """Get detailed call information including transcript"""
+    call_details = await load_call_details(call_id)
+    return json_response_with_etag(request, orjson.dumps(call_details))
+
+
+async def load_call_details(call_id: str):
+    """Build the call details payload from Bland AI, falling back to stored campaign results"""
     api_key = get_api_key()
 
     if not api_key:
@@ -3514,30 +4277,25 @@ async def get_call_details(call_id: str):
     # --------------------
 
     try:
-        print(f"🔍 Fetching call details for {call_id}")
+        logger.debug("🔍 Fetching call details for %s", call_id)
 
         # First check if we have stored data in our campaign results
-        for campaign_id, campaign_results in campaign_results_db.items():
-            for result in campaign_results.get("results", []):
+        for campaign_id, run_data in iter_campaign_runs_with_call(call_id):
+            for result in run_data.get("results", []):
                 if result.get("call_id") == call_id:
                     stored_call_data = result
-                    print(f"📊 Found stored data for call {call_id} in campaign {campaign_id}")
+                    logger.debug("📊 Found stored data for call %s in campaign %s", call_id, campaign_id)
                     break
             if stored_call_data:
                 break
 
         # Try to get fresh data from Bland AI API
-        response = requests.get(f"https://api.bland.ai/v1/calls/{call_id}",
-                                headers={
-                                    "Authorization": f"Bearer {api_key}",
-                                },
-                                timeout=20)
+        status_code, call_data = await fetch_call_data_cached(call_id, api_key)
 
-        print(f"📊 Bland AI API response status: {response.status_code}")
+        logger.debug("📊 Bland AI API response status: %s", status_code)
 
-        if response.status_code == 200:
-            call_data = response.json()
-            print(f"📊 API call data keys: {list(call_data.keys())}")
+        if status_code == 200:
+            logger.debug("📊 API call data keys: %s", list(call_data.keys()))
 
             # Get transcript from multiple possible fields
             transcript = (call_data.get("transcript", "") or
@@ -3552,27 +4310,7 @@ async def get_call_details(call_id: str):
                 call_status = analyze_call_transcript(transcript) if transcript else "busy_voicemail"
                 final_summary = extract_final_summary(transcript)
 
-            # Handle duration from multiple fields
-            call_length = call_data.get("call_length")
-            corrected_duration = call_data.get("corrected_duration")
-
-            print(f"🔍 Call details duration parsing for {call_id}:")
-            print(f"  call_length: {call_length} (type: {type(call_length)})")
-            print(f"  corrected_duration: {corrected_duration} (type: {type(corrected_duration)})")
-
-            if call_length is not None and call_length != 0:
-                # call_length is in MINUTES, convert to seconds
-                duration_in_seconds = int(float(call_length) * 60)
-                print(f"  Using call_length: {call_length} minutes -> {duration_in_seconds} seconds")
-                duration = duration_in_seconds
-            elif corrected_duration is not None and corrected_duration != 0:
-                # corrected_duration is in SECONDS
-                duration = parse_duration(corrected_duration)
-                print(f"  Using corrected_duration: {corrected_duration} -> {duration} seconds")
-            else:
-                raw_duration = (call_data.get("duration", 0) or call_data.get("length", 0))
-                duration = parse_duration(raw_duration)
-                print(f"  Using fallback duration: {raw_duration} -> {duration} seconds")
+            duration = call_duration_seconds(call_data)
 
             return {
                 "call_id": call_id,
@@ -3585,10 +4323,10 @@ async def get_call_details(call_id: str):
                 "phone_number": call_data.get("to", call_data.get("phone_number", "")),
                 "data_source": "api_with_stored_fallback"
             }
-        elif response.status_code == 404:
+        elif status_code == 404:
             # Call not found in API, use stored data if available
             if stored_call_data:
-                print(f"📊 Using stored data for call {call_id} (not found in API)")
+                logger.debug("📊 Using stored data for call %s (not found in API)", call_id)
                 return {
                     "call_id": call_id,
                     "status": stored_call_data.get("status", "completed"),
@@ -3603,9 +4341,9 @@ async def get_call_details(call_id: str):
             else:
                 raise HTTPException(status_code=404, detail="Call not found in API or stored data")
         else:
-            error_detail = f"API error: Status {response.status_code}, Response: {response.text}"
+            error_detail = f"API error: Status {status_code}, Response: {call_data}"
             if stored_call_data:
-                print(f"⚠️ API error, falling back to stored data: {error_detail}")
+                logger.warning("⚠️ API error, falling back to stored data: %s", error_detail)
                 return {
                     "call_id": call_id,
                     "status": stored_call_data.get("status", "completed"),
@@ -3618,10 +4356,10 @@ async def get_call_details(call_id: str):
                     "data_source": "stored_fallback"
                 }
             else:
-                raise HTTPException(status_code=response.status_code, detail=error_detail)
+                raise HTTPException(status_code=status_code, detail=error_detail)
 
-    except requests.RequestException as e:
-        print(f"💥 Network error fetching call details: {str(e)}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("💥 Network error fetching call details: %s", e)
         # Try to return stored data if network fails
         if stored_call_data:
             return {
@@ -3637,7 +4375,7 @@ async def get_call_details(call_id: str):
             }
         raise HTTPException(status_code=500, detail=f"Network error: {str(e)}")
     except Exception as e:
-        print(f"💥 Unexpected error fetching call details: {str(e)}")
+        logger.error("💥 Unexpected error fetching call details: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching call details: {str(e)}")
 
 
@@ -3660,18 +4398,14 @@ async def get_clients_api():
 async def get_campaigns_api():
     """Get all campaigns data for API usage"""
     try:
-        campaigns = []
-        for campaign in campaigns_db.values():
-            # Create a copy without file data for API response
-            campaign_copy = campaign.copy()
-            if 'file_data' in campaign_copy:
-                del campaign_copy['file_data']
-            campaigns.append(campaign_copy)
-
-        return {
-            "success": True,
-            "campaigns": campaigns
-        }
+        body = campaigns_api_cache.get("body")
+        if body is None:
+            body = orjson.dumps({
+                "success": True,
+                "campaigns": list(campaigns_public_db.values())
+            })
+            campaigns_api_cache["body"] = body
+        return Response(body, media_type="application/json")
     except Exception as e:
         return {
             "success": False,
@@ -3682,13 +4416,17 @@ async def get_campaigns_api():
 async def debug_campaign_results():
     """Debug endpoint to check stored campaign results"""
     try:
+        body = campaign_results_debug_cache.get("body")
+        if body is not None:
+            return Response(body, media_type="application/json")
+
         debug_info = {
             "total_campaigns_with_results": len(campaign_results_db),
             "campaign_ids": list(campaign_results_db.keys()),
             "campaign_details": {}
         }
 
-        for campaign_id, results in campaign_results_db.items():
+        for campaign_id, results in iter_campaign_runs():
             call_details = []
             for result in results.get("results", []):
                 call_details.append({
@@ -3712,10 +4450,12 @@ async def debug_campaign_results():
                 "call_details": call_details
             }
 
-        return {
+        body = orjson.dumps({
             "success": True,
             "debug_info": debug_info
-        }
+        })
+        campaign_results_debug_cache["body"] = body
+        return Response(body, media_type="application/json")
     except Exception as e:
         return {
             "success": False,
@@ -3734,7 +4474,7 @@ async def debug_active_campaigns():
 
         # Check each campaign's status
         for campaign_id, campaign in campaigns_db.items():
-            results = campaign_results_db.get(campaign_id, {})
+            results = get_campaign_run(campaign_id, {})
             active_info["campaign_status"][campaign_id] = {
                 "name": campaign.get("name", "Unknown"),
                 "has_results": campaign_id in campaign_results_db,
@@ -3780,7 +4520,7 @@ async def debug_call_data(call_id: str):
         found_calls = []
 
         # Search in all campaigns
-        for campaign_id, results in campaign_results_db.items():
+        for campaign_id, results in iter_campaign_runs_with_call(call_id):
             for result in results.get("results", []):
                 if result.get("call_id") == call_id:
                     found_calls.append({
@@ -3805,37 +4545,32 @@ async def debug_call_data(call_id: str):
 async def get_dashboard_metrics():
     """Get updated dashboard metrics by aggregating campaign analytics"""
     try:
-        # Calculate metrics from actual campaign results
-        clients = load_clients()
-        campaigns = load_campaigns()
-
-        total_clients = len(clients)
-        total_campaigns = len(campaigns)
+        # Calculate metrics from actual campaign results; counts come straight from the in-memory dicts
+        total_clients = len(clients_db)
+        total_campaigns = len(campaigns_db)
         total_calls = 0
         total_duration_seconds = 0
 
         # Get all unique campaign IDs
-        unique_campaign_ids = set()
-        for campaign in campaigns:
-            unique_campaign_ids.add(campaign['id'])
+        unique_campaign_ids = set(campaigns_db)
 
-        print(f"📊 Dashboard metrics: Processing {len(unique_campaign_ids)} unique campaigns")
+        logger.debug("📊 Dashboard metrics: Processing %s unique campaigns", len(unique_campaign_ids))
 
         # For each campaign, calculate its total duration using the same logic as campaign analytics
         for campaign_id in unique_campaign_ids:
             campaign_runs = {}
 
             # Find all runs for this campaign ID (same logic as campaign analytics)
-            for stored_key, stored_results in campaign_results_db.items():
+            for stored_key in list(campaign_results_db.keys()):
                 if stored_key == campaign_id or stored_key.startswith(f"{campaign_id}_run_"):
-                    campaign_runs[stored_key] = stored_results
+                    campaign_runs[stored_key] = get_campaign_run(stored_key)
 
             if campaign_runs:
                 # Aggregate all results from all runs of this campaign
                 all_results = []
                 for run_key, run_data in campaign_runs.items():
                     all_results.extend(run_data.get('results', []))
-                    print(f"📊 Dashboard: Found run {run_key} with {len(run_data.get('results', []))} calls")
+                    logger.debug("📊 Dashboard: Found run %s with %s calls", run_key, len(run_data.get('results', [])))
 
                 # Count calls for this campaign
                 total_calls += len(all_results)
@@ -3848,50 +4583,33 @@ async def get_dashboard_metrics():
                         stored_duration = result.get('duration', 0)
                         if stored_duration and stored_duration > 0:
                             campaign_duration += stored_duration
-                            print(f"📊 Dashboard: Adding stored {stored_duration}s from {result.get('patient_name', 'Unknown')} in campaign {campaign_id}")
+                            logger.debug("📊 Dashboard: Adding stored %ss from %s in campaign %s", stored_duration, result.get('patient_name', 'Unknown'), campaign_id)
                         else:
                             # Fetch fresh duration from API if stored duration is missing/zero
                             try:
-                                print(f"📊 Dashboard: Fetching fresh duration for {result.get('patient_name', 'Unknown')} call {result.get('call_id')}")
-                                import requests
+                                logger.debug("📊 Dashboard: Fetching fresh duration for %s call %s", result.get('patient_name', 'Unknown'), result.get('call_id'))
                                 api_key = get_api_key()
                                 if api_key:
-                                    response = requests.get(
-                                        f"https://api.bland.ai/v1/calls/{result['call_id']}",
-                                        headers={"Authorization": f"Bearer {api_key}"},
-                                        timeout=10
-                                    )
-                                    if response.status_code == 200:
-                                        call_data = response.json()
+                                    status_code, call_data = await fetch_call_data_cached(result['call_id'], api_key)
+                                    if status_code == 200:
                                         # Parse duration using same logic as campaign analytics
-                                        call_length = call_data.get("call_length")
-                                        corrected_duration = call_data.get("corrected_duration")
-
-                                        if call_length is not None and call_length != 0:
-                                            # call_length is in MINUTES, convert to seconds
-                                            duration = int(float(call_length) * 60)
-                                        elif corrected_duration is not None and corrected_duration != 0:
-                                            # corrected_duration is in SECONDS
-                                            duration = parse_duration(corrected_duration)
-                                        else:
-                                            raw_duration = (call_data.get("duration", 0) or call_data.get("length", 0))
-                                            duration = parse_duration(raw_duration)
+                                        duration = call_duration_seconds(call_data)
 
                                         if duration > 0:
                                             campaign_duration += duration
-                                            print(f"📊 Dashboard: Adding fresh {duration}s from {result.get('patient_name', 'Unknown')} in campaign {campaign_id}")
+                                            logger.debug("📊 Dashboard: Adding fresh %ss from %s in campaign %s", duration, result.get('patient_name', 'Unknown'), campaign_id)
                                     else:
-                                        print(f"📊 Dashboard: API error {response.status_code} for call {result.get('call_id')}")
+                                        logger.warning("📊 Dashboard: API error %s for call %s", status_code, result.get('call_id'))
                             except Exception as e:
-                                print(f"📊 Dashboard: Error fetching fresh duration for {result.get('call_id')}: {str(e)}")
+                                logger.warning("📊 Dashboard: Error fetching fresh duration for %s: %s", result.get('call_id'), e)
 
                 total_duration_seconds += campaign_duration
-                print(f"📊 Dashboard: Campaign {campaign_id} total duration: {campaign_duration}s")
+                logger.debug("📊 Dashboard: Campaign %s total duration: %ss", campaign_id, campaign_duration)
 
         # Format total duration
         formatted_duration = format_duration_display(total_duration_seconds)
 
-        print(f"📊 Dashboard final metrics: {total_calls} calls, {total_duration_seconds}s total ({formatted_duration})")
+        logger.info("📊 Dashboard final metrics: %s calls, %ss total (%s)", total_calls, total_duration_seconds, formatted_duration)
 
         return {
             "success": True,
@@ -3903,7 +4621,7 @@ async def get_dashboard_metrics():
             }
         }
     except Exception as e:
-        print(f"❌ Error calculating dashboard metrics: {str(e)}")
+        logger.error("❌ Error calculating dashboard metrics: %s", e)
         return {
             "success": False,
             "message": f"Error calculating metrics: {str(e)}"
@@ -3920,7 +4638,7 @@ async def view_campaign_results(campaign_id: str):
                 "available_campaigns": list(campaign_results_db.keys())
             }
 
-        results = campaign_results_db[campaign_id]
+        results = get_campaign_run(campaign_id)
         return {
             "success": True,
             "campaign_id": campaign_id,
@@ -3949,17 +4667,20 @@ async def view_campaign_results(campaign_id: str):
 async def bland_webhook(request: Request):
     """Webhook to receive Bland AI call updates and update the main results DB."""
     try:
-        data = await request.json()
-        print(f"🔔 Webhook received: {data}")
+        data = orjson.loads(await request.body())
+        logger.debug("🔔 Webhook received: %s", data)
 
         call_id = data.get("call_id")
         request_data = data.get("request_data", {})
         campaign_id = request_data.get("campaign_id")
 
         if not call_id:
-            print(f"⚠️ Webhook ignored: Missing call_id")
+            logger.warning("⚠️ Webhook ignored: Missing call_id")
             return {"success": False, "reason": "Missing call_id"}
 
+        # The call changed upstream, so any cached call details are stale
+        call_details_cache.pop(call_id, None)
+
         # Update call in all campaigns if campaign_id not provided
         # Also check for campaign run IDs that start with the campaign_id
         campaigns_to_check = []
@@ -3969,56 +4690,58 @@ async def bland_webhook(request: Request):
             campaigns_to_check = list(campaign_results_db.keys())
 
         call_updated = False
-        for check_campaign_id in campaigns_to_check:
-            if check_campaign_id in campaign_results_db:
-                # Find the specific call within that campaign's results
-                for result in campaign_results_db[check_campaign_id].get("results", []):
-                    if result.get("call_id") == call_id:
-                        # Update this call's data with the final results
-                        transcript = data.get('transcript', '')
-                        call_status = data.get('status', 'completed')
-
-                        # Extract final summary first, then determine status based on it
-                        if transcript and transcript.strip():
-                            final_summary = extract_final_summary(transcript)
-                            # Use final summary to determine status (more accurate)
-                            analyzed_status, standardized_summary = analyze_call_status_from_summary(final_summary, transcript)
-                            final_summary = standardized_summary
-                        else:
-                            analyzed_status = 'busy_voicemail'
-                            final_summary = "No transcript available"
-
-                        duration = parse_duration(data.get('call_length', data.get('duration', 0)))
-
-                        # Update the result with complete data
-                        result.update({
-                            "transcript": transcript,
-                            "call_status": analyzed_status,
-                            "final_summary": final_summary,
-                            "duration": duration,
-                            "webhook_status": call_status,
-                            "webhook_received_at": datetime.now().isoformat()
-                        })
-
-                        print(f"✅ Webhook updated call {call_id} in campaign {check_campaign_id}")
-                        print(f"   Status: {analyzed_status}, Transcript length: {len(transcript)}")
-                        call_updated = True
-                        break
-
-                if call_updated:
-                    # Persist the changes to the JSON file
-                    save_campaign_results_db(campaign_results_db)
+        for check_campaign_id, run_data in iter_campaign_runs_with_call(call_id, campaigns_to_check):
+            # Find the specific call within that campaign's results
+            for result in run_data.get("results", []):
+                if result.get("call_id") == call_id:
+                    # Update this call's data with the final results
+                    transcript = data.get('transcript', '')
+                    call_status = data.get('status', 'completed')
+
+                    # Extract final summary first, then determine status based on it
+                    if transcript and transcript.strip():
+                        final_summary = extract_final_summary(transcript)
+                        # Use final summary to determine status (more accurate)
+                        analyzed_status, standardized_summary = analyze_call_status_from_summary(final_summary, transcript)
+                        final_summary = standardized_summary
+                    else:
+                        analyzed_status = 'busy_voicemail'
+                        final_summary = "No transcript available"
+
+                    duration = parse_duration(data.get('call_length', data.get('duration', 0)))
+
+                    # Update the result with complete data
+                    result.update({
+                        "transcript": transcript,
+                        "call_status": analyzed_status,
+                        "final_summary": final_summary,
+                        "duration": duration,
+                        "webhook_status": call_status,
+                        "webhook_received_at": datetime.now().isoformat()
+                    })
+
+                    logger.info("✅ Webhook updated call %s in campaign %s", call_id, check_campaign_id)
+                    logger.info("   Status: %s, Transcript length: %s", analyzed_status, len(transcript))
+                    call_updated = True
                     break
 
+            if call_updated:
+                # Re-store the updated run and log just the changed call; a run in progress
+                # is already the live dict and gets stored when it finishes
+                if check_campaign_id in active_campaign_runs:
+                    invalidate_campaign_analytics(check_campaign_id)
+                else:
+                    store_campaign_run(check_campaign_id, run_data)
+                await append_campaign_result(check_campaign_id, result)
+                break
+
         if not call_updated:
-            print(f"⚠️ Call {call_id} not found in any campaign results")
+            logger.warning("⚠️ Call %s not found in any campaign results", call_id)
 
         return {"success": True, "call_updated": call_updated}
 
     except Exception as e:
-        print(f"💥 Webhook error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("💥 Webhook error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -4044,7 +4767,7 @@ async def get_call_history_api():
         all_calls = []
 
         # Process all campaign results
-        for campaign_id, campaign_results in campaign_results_db.items():
+        for campaign_id, campaign_results in iter_campaign_runs():
             campaign_name = campaign_results.get('campaign_name', 'Unknown Campaign')
             client_name = campaign_results.get('client_name', 'Unknown Client')
 
@@ -4068,73 +4791,62 @@ async def get_call_history_api():
                     call_status, standardized_summary = analyze_call_status_from_summary(stored_summary, transcript)
                     final_summary = standardized_summary
                     duration = result.get('duration', 0) if result.get('duration') else 0
-                    print(f"📊 Call History API: Using stored summary for {result.get('patient_name', 'Unknown')}: {call_status}")
+                    logger.debug("📊 Call History API: Using stored summary for %s: %s", result.get('patient_name', 'Unknown'), call_status)
 
                 # Priority 2: Use stored call_status if available and not 'initiated'/'processing'
                 elif result.get('call_status') and result.get('call_status') not in ['initiated', 'processing']:
                     call_status = result.get('call_status')
                     final_summary = get_standardized_summary_for_status(call_status)
                     duration = result.get('duration', 0) if result.get('duration') else 0
-                    print(f"📊 Call History API: Using stored status for {result.get('patient_name', 'Unknown')}: {call_status}")
+                    logger.debug("📊 Call History API: Using stored status for %s: %s", result.get('patient_name', 'Unknown'), call_status)
 
                 # Priority 3: Fetch fresh data from API if call was successful but we don't have good stored data
                 elif result.get('success') and result.get('call_id') and api_key:
                     try:
-                        print(f"📊 Call History API: Fetching fresh data for {result.get('patient_name', 'Unknown')} call {result.get('call_id')}")
-
-                        async with aiohttp.ClientSession() as session:
-                            async with session.get(
-                                f"https://api.bland.ai/v1/calls/{result['call_id']}",
-                                headers={"Authorization": f"Bearer {api_key}"},
-                                timeout=aiohttp.ClientTimeout(total=15)
-                            ) as response:
-
-                                if response.status == 200:
-                                    call_data = await response.json()
-
-                                    # Get fresh transcript and duration
-                                    fresh_transcript = call_data.get('transcript', call_data.get('concatenated_transcript', ''))
-
-                                    # Parse duration from API response
-                                    call_length = call_data.get("call_length")
-                                    corrected_duration = call_data.get("corrected_duration")
-
-                                    if call_length is not None and call_length != 0:
-                                        # call_length is in MINUTES, convert to seconds
-                                        duration = int(float(call_length) * 60)
-                                    elif corrected_duration is not None and corrected_duration != 0:
-                                        # corrected_duration is in SECONDS
-                                        duration = parse_duration(corrected_duration)
-                                    else:
-                                        raw_duration = (call_data.get("duration", 0) or call_data.get("length", 0))
-                                        duration = parse_duration(raw_duration)
-
-                                    # Analyze fresh transcript for status
-                                    if fresh_transcript and fresh_transcript.strip():
-                                        transcript = fresh_transcript
-                                        extracted_summary = extract_final_summary(fresh_transcript)
-                                        call_status, standardized_summary = analyze_call_status_from_summary(extracted_summary, fresh_transcript)
-                                        final_summary = standardized_summary
-                                        print(f"📊 Call History API: Using fresh data for {result.get('patient_name', 'Unknown')}: {call_status}, Duration: {duration}s")
-                                    else:
-                                        # No transcript available, treat as busy/voicemail
-                                        call_status = 'busy_voicemail'
-                                        final_summary = "No transcript available"
-                                        print(f"📊 Call History API: Fresh data has no transcript for {result.get('patient_name', 'Unknown')}")
-
-                                elif response.status == 404:
-                                    print(f"📊 Call History API: Call {result.get('call_id')} not found in API")
-                                    call_status = 'busy_voicemail'
-                                    final_summary = "Call not found in API"
-                                    duration = 0
+                        logger.debug("📊 Call History API: Fetching fresh data for %s call %s", result.get('patient_name', 'Unknown'), result.get('call_id'))
+
+                        session = app.state.http
+                        async with session.get(
+                            f"{BLAND_CALLS_URL}/{result['call_id']}",
+                            headers={"Authorization": f"Bearer {api_key}"},
+                            timeout=aiohttp.ClientTimeout(total=15)
+                        ) as response:
+
+                            if response.status == 200:
+                                call_data = orjson.loads(await response.read())
+
+                                # Get fresh transcript and duration
+                                fresh_transcript = call_data.get('transcript', call_data.get('concatenated_transcript', ''))
+
+                                # Parse duration from API response
+                                duration = call_duration_seconds(call_data)
+
+                                # Analyze fresh transcript for status
+                                if fresh_transcript and fresh_transcript.strip():
+                                    transcript = fresh_transcript
+                                    extracted_summary = extract_final_summary(fresh_transcript)
+                                    call_status, standardized_summary = analyze_call_status_from_summary(extracted_summary, fresh_transcript)
+                                    final_summary = standardized_summary
+                                    logger.debug("📊 Call History API: Using fresh data for %s: %s, Duration: %ss", result.get('patient_name', 'Unknown'), call_status, duration)
                                 else:
-                                    print(f"📊 Call History API: API error {response.status} for call {result.get('call_id')}")
+                                    # No transcript available, treat as busy/voicemail
                                     call_status = 'busy_voicemail'
-                                    final_summary = "API error retrieving call data"
-                                    duration = 0
+                                    final_summary = "No transcript available"
+                                    logger.debug("📊 Call History API: Fresh data has no transcript for %s", result.get('patient_name', 'Unknown'))
+
+                            elif response.status == 404:
+                                logger.debug("📊 Call History API: Call %s not found in API", result.get('call_id'))
+                                call_status = 'busy_voicemail'
+                                final_summary = "Call not found in API"
+                                duration = 0
+                            else:
+                                logger.warning("📊 Call History API: API error %s for call %s", response.status, result.get('call_id'))
+                                call_status = 'busy_voicemail'
+                                final_summary = "API error retrieving call data"
+                                duration = 0
 
                     except Exception as e:
-                        print(f"📊 Call History API: Error fetching fresh data for {result.get('call_id')}: {str(e)}")
+                        logger.warning("📊 Call History API: Error fetching fresh data for %s: %s", result.get('call_id'), e)
                         call_status = 'busy_voicemail'
                         final_summary = "Error retrieving call data"
                         duration = 0
@@ -4145,14 +4857,14 @@ async def get_call_history_api():
                     call_status, standardized_summary = analyze_call_status_from_summary(extracted_summary, transcript)
                     final_summary = standardized_summary
                     duration = result.get('duration', 0) if result.get('duration') else 0
-                    print(f"📊 Call History API: Using stored transcript analysis for {result.get('patient_name', 'Unknown')}: {call_status}")
+                    logger.debug("📊 Call History API: Using stored transcript analysis for %s: %s", result.get('patient_name', 'Unknown'), call_status)
 
                 # Fallback: Use whatever we have or default
                 else:
                     call_status = 'busy_voicemail'
                     final_summary = "No summary available"
                     duration = result.get('duration', 0) if result.get('duration') else 0
-                    print(f"📊 Call History API: Using fallback for {result.get('patient_name', 'Unknown')}: {call_status}")
+                    logger.debug("📊 Call History API: Using fallback for %s: %s", result.get('patient_name', 'Unknown'), call_status)
 
                 call_record = {
                     'call_id': result.get('call_id'),
@@ -4200,10 +4912,10 @@ async def get_call_history_api():
         # Sort by created_at timestamp (most recent first)
         all_calls.sort(key=lambda x: parse_datetime_for_sorting(x.get('created_at', '')), reverse=True)
 
-        print(f"📊 Call history API: Returning {len(all_calls)} calls sorted by most recent first")
+        logger.info("📊 Call history API: Returning %s calls sorted by most recent first", len(all_calls))
         if all_calls:
-            print(f"📊 First call: {all_calls[0]['patient_name']} at {all_calls[0]['dateTime']}")
-            print(f"📊 Last call: {all_calls[-1]['patient_name']} at {all_calls[-1]['dateTime']}")
+            logger.debug("📊 First call: %s at %s", all_calls[0]['patient_name'], all_calls[0]['dateTime'])
+            logger.debug("📊 Last call: %s at %s", all_calls[-1]['patient_name'], all_calls[-1]['dateTime'])
 
         return {
             "success": True,
@@ -4212,7 +4924,7 @@ async def get_call_history_api():
         }
 
     except Exception as e:
-        print(f"❌ Error in call history API: {str(e)}")
+        logger.error("❌ Error in call history API: %s", e)
         return {
             "success": False,
             "message": f"Error loading call history: {str(e)}",
@@ -4228,4 +4940,8 @@ async def get_docs():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=5000)
\ No newline at end of file
+    # Prefer the C event loop and HTTP parser when installed; stay on one worker
+    # because campaigns, sessions and results live in this process's memory
+    uvicorn.run(app, host="0.0.0.0", port=5000,
+                loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+                http="httptools" if importlib.util.find_spec("httptools") else "h11")